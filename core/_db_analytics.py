@@ -25,7 +25,7 @@ class _DatabaseAnalyticsMixin:
         active_conn = conn
         try:
             if active_conn is None:
-                active_conn = self.get_connection()
+                active_conn = self.get_read_connection()
             visibility_params: List[Any] = []
             append_visibility = getattr(self, "_append_visibility_filter_clause", None)
             visibility_clause = ""
@@ -34,35 +34,33 @@ class _DatabaseAnalyticsMixin:
                     visibility_params,
                     blocked_publishers=blocked_publishers,
                 ))
-            stats = {}
-            stats["total"] = active_conn.execute(
-                "SELECT COUNT(*) FROM news n WHERE COALESCE(n.is_deleted, 0) = 0" + visibility_clause,
-                visibility_params,
-            ).fetchone()[0]
-            stats["unread"] = active_conn.execute(
-                "SELECT COUNT(*) FROM news n WHERE n.is_read = 0 AND COALESCE(n.is_deleted, 0) = 0" + visibility_clause,
-                visibility_params,
-            ).fetchone()[0]
-            stats["bookmarked"] = active_conn.execute(
-                "SELECT COUNT(*) FROM news n WHERE n.is_bookmarked = 1 AND COALESCE(n.is_deleted, 0) = 0" + visibility_clause,
-                visibility_params,
-            ).fetchone()[0]
-            stats["with_notes"] = active_conn.execute(
-                "SELECT COUNT(*) FROM news n WHERE n.notes IS NOT NULL AND n.notes != '' AND COALESCE(n.is_deleted, 0) = 0" + visibility_clause,
-                visibility_params,
-            ).fetchone()[0]
-            stats["with_tags"] = active_conn.execute(
-                "SELECT COUNT(DISTINCT n.link) FROM news n "
-                "JOIN news_tags nt ON nt.link = n.link "
-                "WHERE COALESCE(n.is_deleted, 0) = 0" + visibility_clause,
-                visibility_params,
-            ).fetchone()[0]
-            stats["duplicates"] = active_conn.execute(
-                "SELECT COUNT(DISTINCT nk.link) FROM news_keywords nk "
-                "JOIN news n ON n.link = nk.link "
-                "WHERE nk.is_duplicate = 1 AND COALESCE(n.is_deleted, 0) = 0" + visibility_clause,
+            # One pass over the visible rows; tag/duplicate membership is an
+            # indexed EXISTS probe per row instead of separate join scans.
+            row = active_conn.execute(
+                """
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(CASE WHEN n.is_read = 0 THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN n.is_bookmarked = 1 THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(CASE WHEN n.notes IS NOT NULL AND n.notes != '' THEN 1 ELSE 0 END), 0),
+                    COALESCE(SUM(EXISTS (SELECT 1 FROM news_tags nt WHERE nt.link = n.link)), 0),
+                    COALESCE(SUM(EXISTS (
+                        SELECT 1 FROM news_keywords nk WHERE nk.link = n.link AND nk.is_duplicate = 1
+                    )), 0)
+                FROM news n
+                WHERE COALESCE(n.is_deleted, 0) = 0
+                """
+                + visibility_clause,
                 visibility_params,
-            ).fetchone()[0]
+            ).fetchone()
+            stats = {
+                "total": int(row[0] or 0),
+                "unread": int(row[1] or 0),
+                "bookmarked": int(row[2] or 0),
+                "with_notes": int(row[3] or 0),
+                "with_tags": int(row[4] or 0),
+                "duplicates": int(row[5] or 0),
+            }
             return stats
         except Exception as e:
             logger.error("get_statistics failed: %s", e)
@@ -89,7 +87,7 @@ class _DatabaseAnalyticsMixin:
         active_conn = conn
         try:
             if active_conn is None:
-                active_conn = self.get_connection()
+                active_conn = self.get_read_connection()
             params: List[Any] = []
             if query_key:
                 query = """
@@ -114,13 +112,7 @@ class _DatabaseAnalyticsMixin:
                     WHERE COALESCE(n.is_deleted, 0) = 0
                 """
 
-            if exclude_words:
-                for exclude_word in exclude_words:
-                    if not exclude_word:
-                        continue
-                    query += " AND NOT (n.title LIKE ? ESCAPE '\\' OR n.description LIKE ? ESCAPE '\\')"
-                    wildcard = self._like_contains(exclude_word)
-                    params.extend([wildcard, wildcard])
+            query += self._append_exclude_words_clause(params, exclude_words)
 
             append_visibility = getattr(self, "_append_visibility_filter_clause", None)
             if callable(append_visibility):
@@ -164,7 +156,7 @@ class _DatabaseAnalyticsMixin:
         active_conn = conn
         try:
             if active_conn is None:
-                active_conn = self.get_connection()
+                active_conn = self.get_read_connection()
             params: List[Any] = []
             query = (
                 "SELECT nt.tag, COUNT(DISTINCT nt.link) AS count "
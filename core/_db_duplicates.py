@@ -6,13 +6,16 @@ import logging
 import sqlite3
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from core.text_utils import RE_WHITESPACE, perf_timer
+from core.text_utils import perf_timer
 
 if TYPE_CHECKING:
     from core.database import DatabaseManager
 
 
 logger = logging.getLogger(__name__)
+# Title hashes are a non-cryptographic grouping key; MD5 is kept so stored
+# hashes stay comparable.
+_md5 = hashlib.md5
 
 
 class _DatabaseDuplicatesMixin:
@@ -173,6 +176,10 @@ class _DatabaseDuplicatesMixin:
             self.return_connection(conn)
 
     def _calculate_title_hash(self: DatabaseManager, title: str) -> str:
-        """Stable title hash used for duplicate grouping."""
-        normalized = RE_WHITESPACE.sub("", title.lower())
-        return hashlib.md5(normalized.encode()).hexdigest()
+        """Stable title hash used for duplicate grouping.
+
+        ``str.split()`` drops exactly the characters ``RE_WHITESPACE`` matches,
+        so stored hashes stay comparable while skipping the regex engine.
+        """
+        normalized = "".join(title.lower().split())
+        return _md5(normalized.encode(), usedforsecurity=False).hexdigest()
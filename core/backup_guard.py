@@ -41,7 +41,8 @@ def write_hashes(dst_dir: str, output_name: str = 'backup_hashes.sha256') -> str
     for p in sorted(dst.rglob('*')):
         if p.is_file() and p.name not in {'backup_manifest.txt', output_name}:
             rel = p.relative_to(dst).as_posix()
-            h = hashlib.sha256(p.read_bytes()).hexdigest()
+            with p.open('rb') as fh:
+                h = hashlib.file_digest(fh, 'sha256').hexdigest()
             lines.append(f"{h} *{rel}")
     out.write_text('\n'.join(lines) + ('\n' if lines else ''), encoding='utf-8')
     return str(out)
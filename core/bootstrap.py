@@ -286,6 +286,9 @@ def main():
         app.setFont(font)
         
         window = MainApp(runtime_paths=RUNTIME_PATHS)
+        if window.client_id and window.http_client_config is not None:
+            # 첫 새로고침의 DNS/TLS 비용을 줄이기 위해 공유 세션 연결을 미리 연다.
+            window.http_client_config.preheat_shared_session()
         instance_server = _setup_instance_server(
             app,
             lambda: window.show_window() if window else None,
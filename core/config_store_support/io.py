@@ -5,26 +5,56 @@ import json
 import logging
 import os
 import tempfile
-from typing import Any, Dict
+from types import ModuleType
+from typing import Any, Dict, Optional
 
-from core.config_store_support.normalization import default_config, normalize_loaded_config
+from core.config_store_support.normalization import (
+    clear_normalized_config_cache,
+    default_config,
+    normalize_loaded_config,
+)
 from core.config_store_support.secrets import (
     _is_windows_platform,
     encode_client_secret_for_storage,
     resolve_client_secret_for_runtime,
 )
-from core.config_store_support.types import AppConfig
+from core.config_store_support.types import CONFIG_SCHEMA_REV, CONFIG_SCHEMA_REV_KEY, AppConfig
+
+try:
+    import orjson
+    _ORJSON: Optional[ModuleType] = orjson
+except ImportError:
+    _ORJSON = None
 
 logger = logging.getLogger(__name__)
 
 
-def load_config_file(path: str) -> AppConfig:
-    if not os.path.exists(path):
-        return default_config()
+def _json_loads(data: bytes) -> Any:
+    # orjson is stricter than the stdlib parser (no BOM, no NaN), so anything it
+    # rejects is retried with json to keep accepting previously valid files.
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.loads(data)
+        except _ORJSON.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
+def _json_dumps_bytes(payload: Dict[str, Any]) -> bytes:
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.dumps(payload, option=_ORJSON.OPT_INDENT_2 | _ORJSON.OPT_APPEND_NEWLINE)
+        except _ORJSON.JSONEncodeError:
+            pass
+    return json.dumps(payload, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+def load_config_file(path: str) -> AppConfig:
     def _load_raw_json(file_path: str) -> Dict[str, Any]:
-        with open(file_path, "r", encoding="utf-8") as f:
-            loaded = json.load(f)
+        # Read raw bytes and let json detect the encoding; this avoids a
+        # separate existence probe and the text-decoding wrapper.
+        with open(file_path, "rb") as f:
+            loaded = _json_loads(f.read())
         if not isinstance(loaded, dict):
             raise ValueError(f"config root is not dict: {type(loaded).__name__}")
         return loaded
@@ -32,6 +62,8 @@ def load_config_file(path: str) -> AppConfig:
     raw: Dict[str, Any]
     try:
         raw = _load_raw_json(path)
+    except FileNotFoundError:
+        return default_config()
     except Exception as original_error:
         backup_path = f"{path}.backup"
         if os.path.exists(backup_path):
@@ -71,22 +103,26 @@ def load_config_file(path: str) -> AppConfig:
 
 
 def save_config_file_atomic(path: str, config: AppConfig) -> None:
-    _write_text_atomic(
-        path,
-        json.dumps(config, indent=4, ensure_ascii=False),
-    )
+    payload: Dict[str, Any] = dict(config)
+    payload[CONFIG_SCHEMA_REV_KEY] = CONFIG_SCHEMA_REV
+    _write_bytes_atomic(path, _json_dumps_bytes(payload))
+    clear_normalized_config_cache()
 
 
 def _write_text_atomic(path: str, text: str) -> None:
+    _write_bytes_atomic(path, text.encode("utf-8"))
+
+
+def _write_bytes_atomic(path: str, data: bytes) -> None:
     directory = os.path.dirname(os.path.abspath(path)) or "."
     os.makedirs(directory, exist_ok=True)
 
     fd, tmp_path = tempfile.mkstemp(prefix=".config_", suffix=".tmp", dir=directory)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
-            f.write(text)
-            if not text.endswith("\n"):
-                f.write("\n")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if not data.endswith(b"\n"):
+                f.write(b"\n")
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
@@ -104,11 +140,11 @@ def save_primary_config_file(path: str, config: AppConfig) -> None:
 
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as src:
-                current_text = src.read()
-            loaded = json.loads(current_text)
+            with open(path, "rb") as src:
+                current_bytes = src.read()
+            loaded = _json_loads(current_bytes)
             if isinstance(loaded, dict):
-                _write_text_atomic(backup_path, current_text)
+                _write_bytes_atomic(backup_path, current_bytes)
             else:
                 logger.warning("기존 설정 파일이 JSON object가 아니어서 backup 회전을 건너뜁니다.")
         except Exception as e:
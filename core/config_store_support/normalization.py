@@ -2,14 +2,19 @@
 from __future__ import annotations
 
 import copy
+import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.automation_rules import normalize_automation_rules
 from core.config_store_support.secrets import _normalize_secret_storage
 from core.config_store_support.types import (
     ALLOWED_AUTO_BACKUP_MINUTES,
     ALLOWED_CLOUD_SYNC_INTERVAL_MINUTES,
+    CONFIG_SCHEMA_REV,
+    CONFIG_SCHEMA_REV_KEY,
     DEFAULT_AUTO_BACKUP_MINUTES,
     DEFAULT_CLOUD_SYNC_INTERVAL_MINUTES,
     DEFAULT_CONFIG,
@@ -95,6 +100,45 @@ def _to_keyword_groups(value: Any) -> Dict[str, List[str]]:
     return normalized
 
 
+def _is_canonical_str_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _is_canonical_keyword_groups(value: Any) -> bool:
+    if not isinstance(value, dict):
+        return False
+    for group_name, keywords in value.items():
+        if not isinstance(group_name, str) or not group_name or group_name != group_name.strip():
+            return False
+        if not isinstance(keywords, list):
+            return False
+        seen = set()
+        for keyword in keywords:
+            if not isinstance(keyword, str) or not keyword or keyword != keyword.strip():
+                return False
+            if keyword in seen:
+                return False
+            seen.add(keyword)
+    return True
+
+
+def _to_str_list_trusted(value: Any, trusted: bool) -> List[str]:
+    if trusted and _is_canonical_str_list(value):
+        return list(value)
+    return _to_str_list(value)
+
+
+def _to_keyword_groups_trusted(value: Any, trusted: bool) -> Dict[str, List[str]]:
+    """Copy already-canonical groups from files written by this module.
+
+    Anything that fails the structural check goes through the full
+    ``_to_keyword_groups`` strip/dedup path.
+    """
+    if trusted and _is_canonical_keyword_groups(value):
+        return {group_name: list(keywords) for group_name, keywords in value.items()}
+    return _to_keyword_groups(value)
+
+
 def _to_pagination_state(value: Any) -> Dict[str, int]:
     if not isinstance(value, dict):
         return {}
@@ -471,8 +515,55 @@ def default_config() -> AppConfig:
     return copy.deepcopy(DEFAULT_CONFIG)
 
 
+_NORMALIZED_CONFIG_CACHE_SIZE = 8
+_NORMALIZED_CONFIG_CACHE_MAX_KEY_CHARS = 512 * 1024
+_normalized_config_cache: "OrderedDict[str, AppConfig]" = OrderedDict()
+_normalized_config_cache_lock = threading.Lock()
+
+
+def _normalized_config_cache_key(raw: Any) -> Optional[str]:
+    try:
+        key = json.dumps(raw, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    if len(key) > _NORMALIZED_CONFIG_CACHE_MAX_KEY_CHARS:
+        return None
+    return key
+
+
+def clear_normalized_config_cache() -> None:
+    with _normalized_config_cache_lock:
+        _normalized_config_cache.clear()
+
+
 def normalize_loaded_config(raw: Dict[str, Any]) -> AppConfig:
+    """Normalize a loaded config dict, reusing results for identical raw payloads.
+
+    Callers always receive an independent deep copy so mutating the result
+    never leaks into the cache.
+    """
+    cache_key = _normalized_config_cache_key(raw)
+    if cache_key is None:
+        return _normalize_loaded_config_uncached(raw)
+
+    with _normalized_config_cache_lock:
+        cached = _normalized_config_cache.get(cache_key)
+        if cached is not None:
+            _normalized_config_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
+    cfg = _normalize_loaded_config_uncached(raw)
+    with _normalized_config_cache_lock:
+        _normalized_config_cache[cache_key] = copy.deepcopy(cfg)
+        _normalized_config_cache.move_to_end(cache_key)
+        while len(_normalized_config_cache) > _NORMALIZED_CONFIG_CACHE_SIZE:
+            _normalized_config_cache.popitem(last=False)
+    return cfg
+
+
+def _normalize_loaded_config_uncached(raw: Dict[str, Any]) -> AppConfig:
     cfg = default_config()
+    trusted = raw.get(CONFIG_SCHEMA_REV_KEY) == CONFIG_SCHEMA_REV
 
     if "app_settings" in raw and isinstance(raw.get("app_settings"), dict):
         app_raw = raw["app_settings"]
@@ -537,9 +628,9 @@ def normalize_loaded_config(raw: Dict[str, Any]) -> AppConfig:
                 "height": _to_int(geom_raw.get("height"), cfg["app_settings"]["window_geometry"]["height"]),
             }
 
-        cfg["tabs"] = _to_str_list(raw.get("tabs"))
-        cfg["search_history"] = _to_str_list(raw.get("search_history"))
-        cfg["keyword_groups"] = _to_keyword_groups(raw.get("keyword_groups"))
+        cfg["tabs"] = _to_str_list_trusted(raw.get("tabs"), trusted)
+        cfg["search_history"] = _to_str_list_trusted(raw.get("search_history"), trusted)
+        cfg["keyword_groups"] = _to_keyword_groups_trusted(raw.get("keyword_groups"), trusted)
         cfg["pagination_state"] = _to_pagination_state(raw.get("pagination_state"))
         cfg["pagination_totals"] = _to_pagination_totals(raw.get("pagination_totals"))
         cfg["saved_searches"] = _to_saved_searches(raw.get("saved_searches"))
@@ -588,9 +679,9 @@ def normalize_loaded_config(raw: Dict[str, Any]) -> AppConfig:
         raw.get("cloud_sync_interval_minutes"),
         app_cfg["cloud_sync_interval_minutes"],
     )
-    cfg["tabs"] = _to_str_list(raw.get("tabs"))
-    cfg["search_history"] = _to_str_list(raw.get("search_history"))
-    cfg["keyword_groups"] = _to_keyword_groups(raw.get("keyword_groups"))
+    cfg["tabs"] = _to_str_list_trusted(raw.get("tabs"), trusted)
+    cfg["search_history"] = _to_str_list_trusted(raw.get("search_history"), trusted)
+    cfg["keyword_groups"] = _to_keyword_groups_trusted(raw.get("keyword_groups"), trusted)
     cfg["pagination_state"] = _to_pagination_state(raw.get("pagination_state"))
     cfg["pagination_totals"] = _to_pagination_totals(raw.get("pagination_totals"))
     cfg["saved_searches"] = _to_saved_searches(raw.get("saved_searches"))
@@ -618,6 +709,7 @@ __all__ = [
     "_coerce_int_range_for_import",
     "_coerce_auto_backup_minutes_for_import",
     "normalize_import_settings",
+    "clear_normalized_config_cache",
     "default_config",
     "normalize_loaded_config",
 ]
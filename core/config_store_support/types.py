@@ -94,6 +94,11 @@ DEFAULT_AUTO_BACKUP_MINUTES = 60
 ALLOWED_CLOUD_SYNC_INTERVAL_MINUTES = {10, 30, 60, 120, 360}
 DEFAULT_CLOUD_SYNC_INTERVAL_MINUTES = 30
 
+# Stamped into files written by save_config_file_atomic so loads can take the
+# canonical-structure fast path. It is never part of the in-memory AppConfig.
+CONFIG_SCHEMA_REV_KEY = "__schema_rev__"
+CONFIG_SCHEMA_REV = 1
+
 __all__ = [
     "WindowGeometry",
     "AppSettings",
@@ -103,4 +108,6 @@ __all__ = [
     "DEFAULT_AUTO_BACKUP_MINUTES",
     "ALLOWED_CLOUD_SYNC_INTERVAL_MINUTES",
     "DEFAULT_CLOUD_SYNC_INTERVAL_MINUTES",
+    "CONFIG_SCHEMA_REV_KEY",
+    "CONFIG_SCHEMA_REV",
 ]
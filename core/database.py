@@ -2,8 +2,9 @@ import logging
 import os
 import sqlite3
 import threading
+import time
+from collections import OrderedDict, deque
 from contextlib import contextmanager
-from queue import Queue
 from typing import Iterator, Optional, TYPE_CHECKING
 
 from core._db_analytics import _DatabaseAnalyticsMixin
@@ -12,7 +13,7 @@ from core._db_duplicates import _DatabaseDuplicatesMixin
 from core._db_mutations import _DatabaseMutationsMixin
 from core._db_queries import _DatabaseQueriesMixin
 from core._db_schema import _DatabaseSchemaMixin
-from core.db_mutations_support import NewsUpsertResult
+from core.db_mutations_support import NewsRow, NewsUpsertResult, news_row_as_dict
 from core.db_queries_support import NewsCountSummary
 from core.logging_setup import configure_logging
 
@@ -130,12 +131,24 @@ class DatabaseManager(
         db_file: str,
         max_connections: int = 10,
         max_emergency_connections: int = 2,
+        max_read_connections: Optional[int] = None,
     ):
         self.db_file = db_file
         self.max_connections = max_connections
         self.max_emergency_connections = max(0, int(max_emergency_connections))
-        self.connection_pool = Queue(maxsize=max_connections)
+        if max_read_connections is None:
+            max_read_connections = max(0, int(max_connections) - 1)
+        self.max_read_connections = max(0, int(max_read_connections))
+        # deque append/popleft are atomic, so the read pool needs no lock and
+        # the writer pool only takes its Condition when it may have to wait.
+        self.connection_pool: deque = deque()
+        self._pool_cv = threading.Condition(threading.Lock())
+        self._read_pool: deque = deque()
+        self._read_connection_ids: set[int] = set()
         self._lock = threading.Lock()
+        self._count_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._write_generation = 0
+        self._connection_change_marks: dict[int, int] = {}
         self._active_connections = 0
         self._closed = False
         self._emergency_connections = set()
@@ -164,51 +177,90 @@ class DatabaseManager(
 
         for _ in range(max_connections):
             conn = self._create_connection()
-            self.connection_pool.put(conn)
+            self.connection_pool.append(conn)
 
-    def get_connection(self, timeout: float = 10.0):
-        """연결 풀에서 연결 가져오기"""
+        for _ in range(self.max_read_connections):
+            read_conn = self._create_read_only_connection()
+            self._read_connection_ids.add(id(read_conn))
+            self._read_pool.append(read_conn)
+
+    def get_connection(self, timeout: Optional[float] = None):
+        """연결 풀에서 연결 가져오기
+
+        ``timeout`` defaults to busy_timeout plus a grace period.
+        """
         if self._closed:
             raise DatabaseConnectionError("DatabaseManager is closed")
-        try:
-            conn = self.connection_pool.get(timeout=timeout)
-            with self._lock:
+        if timeout is None:
+            timeout = self.SQLITE_BUSY_TIMEOUT_MS / 1000.0 + self.POOL_CHECKOUT_GRACE_SEC
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._pool_cv:
+            while not self.connection_pool and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._pool_cv.wait(remaining)
+            if self._closed:
+                raise DatabaseConnectionError("DatabaseManager is closed")
+            if self.connection_pool:
                 self._active_connections += 1
-            return conn
-        except Exception as e:
-            logger.warning(f"DB 연결 획득 실패 (timeout={timeout}s): {e}")
-            logger.warning(f"활성 연결 수: {self._active_connections}/{self.max_connections}")
-            with self._lock:
-                active_emergency = len(self._emergency_connections)
-                if active_emergency >= self.max_emergency_connections:
-                    self._emergency_connection_rejections += 1
-                    logger.error(
-                        "DB emergency connection cap exceeded: active=%s/%s, rejects=%s",
-                        active_emergency,
-                        self.max_emergency_connections,
-                        self._emergency_connection_rejections,
-                    )
-                    raise DatabaseConnectionError(
-                        "Database connection pool exhausted",
-                        pool_exhausted=True,
-                        cause=e,
-                    ) from e
-            conn = self._create_connection()
-            with self._lock:
-                self._emergency_connections.add(id(conn))
-                self._emergency_connection_uses += 1
-                emergency_use_no = self._emergency_connection_uses
-                active_emergency = len(self._emergency_connections)
-            logger.warning(
-                "비상 DB 연결 사용: #%s (active=%s/%s)",
-                emergency_use_no,
-                active_emergency,
-                self.max_emergency_connections,
-            )
-            return conn
+                return self.connection_pool.popleft()
+
+        e = TimeoutError(f"no pooled connection within {timeout}s")
+        logger.warning(f"DB 연결 획득 실패 (timeout={timeout}s): {e}")
+        logger.warning(
+            "DB 풀 상태: in_use=%s/%s, idle=%s, emergency=%s/%s",
+            self._active_connections,
+            self.max_connections,
+            len(self.connection_pool),
+            len(self._emergency_connections),
+            self.max_emergency_connections,
+        )
+        with self._lock:
+            active_emergency = len(self._emergency_connections)
+            if active_emergency >= self.max_emergency_connections:
+                self._emergency_connection_rejections += 1
+                logger.error(
+                    "DB emergency connection cap exceeded: active=%s/%s, rejects=%s",
+                    active_emergency,
+                    self.max_emergency_connections,
+                    self._emergency_connection_rejections,
+                )
+                raise DatabaseConnectionError(
+                    "Database connection pool exhausted",
+                    pool_exhausted=True,
+                    cause=e,
+                ) from e
+
+        conn = self._create_connection()
+        with self._lock:
+            self._emergency_connections.add(id(conn))
+            self._emergency_connection_uses += 1
+            emergency_use_no = self._emergency_connection_uses
+            active_emergency = len(self._emergency_connections)
+        logger.warning(
+            "비상 DB 연결 사용: #%s (active=%s/%s)",
+            emergency_use_no,
+            active_emergency,
+            self.max_emergency_connections,
+        )
+        return conn
+
+    def get_read_connection(self, timeout: Optional[float] = None):
+        """Take a query_only connection for SELECT paths.
+
+        Falls back to the general pool when every reader is checked out, so
+        read paths keep the existing timeout/emergency semantics.
+        """
+        if self._closed:
+            raise DatabaseConnectionError("DatabaseManager is closed")
+        try:
+            return self._read_pool.popleft()
+        except IndexError:
+            return self.get_connection(timeout=timeout)
 
     @contextmanager
-    def connection(self, timeout: float = 10.0):
+    def connection(self, timeout: Optional[float] = None):
         """Official context manager for pooled DB connection lifecycle."""
         conn = self.get_connection(timeout=timeout)
         try:
@@ -216,15 +268,31 @@ class DatabaseManager(
         finally:
             self.return_connection(conn)
 
+    @contextmanager
+    def read_connection(self, timeout: Optional[float] = None):
+        """Context manager for pooled read-only connection lifecycle."""
+        conn = self.get_read_connection(timeout=timeout)
+        try:
+            yield conn
+        finally:
+            self.return_connection(conn)
+
     def return_connection(self, conn):
         """연결 풀에 연결 반환"""
         if conn is None:
             return
 
         conn_id = id(conn)
+        if conn_id in self._read_connection_ids:
+            self._return_read_connection(conn)
+            return
+
+        self._record_connection_writes(conn)
+
         with self._lock:
             if conn_id in self._emergency_connections:
                 self._emergency_connections.discard(conn_id)
+                self._connection_change_marks.pop(conn_id, None)
                 try:
                     conn.close()
                     logger.debug("비상 연결 정리됨")
@@ -240,12 +308,13 @@ class DatabaseManager(
             return
 
         try:
-            with self._lock:
+            with self._pool_cv:
                 self._active_connections = max(0, self._active_connections - 1)
-            if self.connection_pool.full():
-                conn.close()
-            else:
-                self.connection_pool.put_nowait(conn)
+                if len(self.connection_pool) >= self.max_connections:
+                    conn.close()
+                else:
+                    self.connection_pool.append(conn)
+                    self._pool_cv.notify()
         except Exception as e:
             logger.warning(f"DB 연결 반환 실패: {e}")
             try:
@@ -253,6 +322,42 @@ class DatabaseManager(
             except sqlite3.Error:
                 pass
 
+    def _record_connection_writes(self, conn) -> None:
+        """Bump the write generation when a writer connection changed rows.
+
+        ``total_changes`` is a cheap per-connection counter, so this stands
+        in for an update hook (not exposed by the stdlib sqlite3 module).
+        """
+        try:
+            total_changes = int(conn.total_changes)
+        except sqlite3.Error:
+            total_changes = -1
+        conn_id = id(conn)
+        with self._lock:
+            if self._connection_change_marks.get(conn_id, 0) == total_changes:
+                return
+            self._connection_change_marks[conn_id] = total_changes
+            self._write_generation += 1
+            self._count_cache.clear()
+
+    def _return_read_connection(self, conn) -> None:
+        if self._closed:
+            self._read_connection_ids.discard(id(conn))
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            return
+        try:
+            self._read_pool.append(conn)
+        except Exception as e:
+            logger.warning(f"DB 읽기 연결 반환 실패: {e}")
+            self._read_connection_ids.discard(id(conn))
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
     def close(self):
         """모든 연결 종료"""
         self._closed = True
@@ -270,10 +375,21 @@ class DatabaseManager(
                 )
             self._emergency_connections.clear()
 
+        with self._pool_cv:
+            self._pool_cv.notify_all()
+
         try:
-            while not self.connection_pool.empty():
+            while self.connection_pool:
+                try:
+                    conn = self.connection_pool.popleft()
+                    conn.close()
+                    closed_count += 1
+                except (sqlite3.Error, Exception):
+                    break
+            while self._read_pool:
                 try:
-                    conn = self.connection_pool.get_nowait()
+                    conn = self._read_pool.popleft()
+                    self._read_connection_ids.discard(id(conn))
                     conn.close()
                     closed_count += 1
                 except (sqlite3.Error, Exception):
@@ -302,12 +418,14 @@ class DatabaseManager(
             self.db_file,
             timeout=max(0.1, float(timeout)),
             check_same_thread=False,
+            cached_statements=int(self.SQLITE_CACHED_STATEMENTS),
         )
         conn.execute("PRAGMA foreign_keys=ON")
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA cache_size=-64000")
         conn.execute(f"PRAGMA busy_timeout={max(100, int(timeout * 1000))}")
+        self._apply_io_pragmas(conn)
         conn.row_factory = sqlite3.Row
         return conn
 
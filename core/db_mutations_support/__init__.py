@@ -1,4 +1,17 @@
 from core.db_mutations_support.mixin import _DatabaseMutationsMixin
-from core.db_mutations_support.news_upsert import NewsUpsertResult
+from core.db_mutations_support.news_upsert import (
+    NEWS_ROW_FIELDS,
+    NewsItem,
+    NewsRow,
+    NewsUpsertResult,
+    news_row_as_dict,
+)
 
-__all__ = ["NewsUpsertResult", "_DatabaseMutationsMixin"]
+__all__ = [
+    "NEWS_ROW_FIELDS",
+    "NewsItem",
+    "NewsRow",
+    "NewsUpsertResult",
+    "_DatabaseMutationsMixin",
+    "news_row_as_dict",
+]
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import logging
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, cast
 
 if TYPE_CHECKING:
     from core.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
+_SQLITE_SUPPORTS_UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
 
 
 class _NewsReadMaintenanceMixin:
@@ -100,17 +101,11 @@ class _NewsReadMaintenanceMixin:
             wildcard = self._like_contains(filter_txt)
             params.extend([wildcard, wildcard])
 
-        if exclude_words:
-            for exclude_word in exclude_words:
-                if not exclude_word:
-                    continue
-                scope_query += " AND NOT (n.title LIKE ? ESCAPE '\\' OR n.description LIKE ? ESCAPE '\\')"
-                wildcard = self._like_contains(exclude_word)
-                params.extend([wildcard, wildcard])
+        scope_query += self._append_exclude_words_clause(params, exclude_words)
 
         if start_date:
             try:
-                s_ts = datetime.strptime(start_date, "%Y-%m-%d").timestamp()
+                s_ts = self._date_filter_ts(start_date)
                 scope_query += " AND n.pubDate_ts >= ?"
                 params.append(s_ts)
             except ValueError:
@@ -118,7 +113,7 @@ class _NewsReadMaintenanceMixin:
 
         if end_date:
             try:
-                e_ts = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+                e_ts = self._date_filter_ts(end_date, next_day=True)
                 scope_query += " AND n.pubDate_ts < ?"
                 params.append(e_ts)
             except ValueError:
@@ -134,6 +129,7 @@ class _NewsReadMaintenanceMixin:
         conn = self.get_connection()
         try:
             with conn:
+                self._begin_immediate(conn)
                 return self._mark_links_as_read_with_conn(conn, links)
         except Exception as e:
             logger.error("mark_links_as_read failed: %s", e)
@@ -151,6 +147,7 @@ class _NewsReadMaintenanceMixin:
         conn = self.get_connection()
         try:
             with conn:
+                self._begin_immediate(conn)
                 if only_bookmark:
                     now_ts = datetime.now().timestamp()
                     cursor = conn.execute(
@@ -163,9 +160,31 @@ class _NewsReadMaintenanceMixin:
                         """,
                         (now_ts,),
                     )
-                else:
+                elif _SQLITE_SUPPORTS_UPDATE_FROM:
+                    # UPDATE ... FROM joins the scoped links once (driven by the
+                    # news_keywords scope indexes) instead of an IN probe.
                     now_ts = datetime.now().timestamp()
                     params: List[Any] = []
+                    cursor = conn.execute(
+                        """
+                        UPDATE news
+                        SET is_read = 1, read_updated_at = ?
+                        FROM (
+                            SELECT DISTINCT nk.link FROM news_keywords nk
+                            WHERE
+                        """
+                        + self._append_query_scope_sql(params, keyword, query_key)
+                        + """
+                        ) AS scoped
+                        WHERE news.link = scoped.link
+                          AND news.is_read = 0
+                          AND COALESCE(news.is_deleted, 0) = 0
+                        """,
+                        [now_ts, *params],
+                    )
+                else:
+                    now_ts = datetime.now().timestamp()
+                    params = []
                     cursor = conn.execute(
                         """
                         UPDATE news
@@ -226,6 +245,7 @@ class _NewsReadMaintenanceMixin:
                 + ")"
             )
             with conn:
+                self._begin_immediate(conn)
                 cursor = conn.execute(query, [datetime.now().timestamp(), *params])
                 return int(cursor.rowcount or 0)
         except Exception as e:
@@ -300,6 +320,7 @@ class _NewsReadMaintenanceMixin:
                 if not links:
                     break
                 with conn:
+                    self._begin_immediate(conn)
                     conn.executemany(
                         "INSERT OR IGNORE INTO temp_mark_query_seen_links (link) VALUES (?)",
                         [(link,) for link in links],
@@ -5,7 +5,7 @@ import logging
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 
 from core.content_filters import normalize_tags
 from core.query_parser import build_fetch_key
@@ -16,6 +16,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Field order of the tuple rows accepted by upsert_news(_detailed).
+NEWS_ROW_FIELDS: Tuple[str, ...] = ("title", "description", "link", "pubDate", "publisher")
+NewsRow = Tuple[str, str, str, str, str]
+NewsItem = Union[Dict[str, Any], NewsRow]
+
+
+def news_row_as_dict(item: NewsItem) -> Dict[str, Any]:
+    """Return a dict view of a news row, leaving dict items untouched."""
+    if isinstance(item, dict):
+        return item
+    return dict(zip(NEWS_ROW_FIELDS, item))
+
 
 @dataclass(frozen=True)
 class NewsUpsertResult:
@@ -51,7 +63,7 @@ class _NewsUpsertMixin:
         return f"{alias}.query_key = ?"
     def upsert_news(
         self: DatabaseManager,
-        items: List[Dict[str, Any]],
+        items: Sequence[NewsItem],
         keyword: str,
         query_key: Optional[str] = None,
     ) -> Tuple[int, int]:
@@ -61,11 +73,14 @@ class _NewsUpsertMixin:
 
     def upsert_news_detailed(
         self: DatabaseManager,
-        items: List[Dict[str, Any]],
+        items: Sequence[NewsItem],
         keyword: str,
         query_key: Optional[str] = None,
     ) -> NewsUpsertResult:
-        """Insert or update rows and return detailed scope-new link metadata."""
+        """Insert or update rows and return detailed scope-new link metadata.
+
+        Items are dicts or tuples ordered as NEWS_ROW_FIELDS.
+        """
         if not items:
             return NewsUpsertResult(0, 0, ())
 
@@ -79,28 +94,38 @@ class _NewsUpsertMixin:
             conn = self.get_connection()
             with perf_timer(
                 "db.upsert_news_detailed",
-                f"kw={keyword}|query_key={scope_query_key}|items={len(items)}",
+                "kw=%s|query_key=%s|items=%s",
+                keyword,
+                scope_query_key,
+                len(items),
             ):
                 prepared_by_link: Dict[str, Dict[str, Any]] = {}
                 link_order: List[str] = []
+                calculate_title_hash = self._calculate_title_hash
 
                 for item in items:
-                    link = str(item.get("link", "") or "").strip()
+                    if isinstance(item, tuple):
+                        title, description, raw_link, pub_date, publisher = item
+                    else:
+                        title = item.get("title", "")
+                        description = item.get("description", "")
+                        raw_link = item.get("link", "")
+                        pub_date = item.get("pubDate", "")
+                        publisher = item.get("publisher", "")
+                    link = str(raw_link or "").strip()
                     if not link:
                         continue
                     if link not in prepared_by_link:
                         link_order.append(link)
-                    pub_date = item.get("pubDate", "")
-                    title = item.get("title", "")
-                    title_hash = self._calculate_title_hash(title)
+                    title_hash = calculate_title_hash(title)
                     prepared_by_link[link] = {
                         "link": link,
                         "keyword": keyword,
                         "query_key": scope_query_key,
                         "title": title,
-                        "description": item.get("description", ""),
+                        "description": description,
                         "pubDate": pub_date,
-                        "publisher": item.get("publisher", ""),
+                        "publisher": publisher,
                         "pubDate_ts": parse_date_to_ts(pub_date),
                         "title_hash": title_hash,
                     }
@@ -108,28 +133,43 @@ class _NewsUpsertMixin:
                 prepared_items = [prepared_by_link[link] for link in link_order]
 
                 with conn:
+                    # The duplicate-scope reads below and the inserts share one
+                    # write-locked snapshot.
+                    self._begin_immediate(conn)
                     unique_hashes = sorted(
-                        {
-                            str(item.get("title_hash", "") or "").strip()
-                            for item in prepared_items
-                            if str(item.get("title_hash", "") or "").strip()
-                        }
+                        {item["title_hash"] for item in prepared_items if item["title_hash"]}
                     )
                     incoming_links = sorted(link_order)
 
+                    # Probe through per-connection temp tables instead of a
+                    # batch-sized IN (...) list: the SQL text stays constant so
+                    # the statement cache is reused, and large batches never hit
+                    # the bound-parameter limit.
+                    conn.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS temp_upsert_hash_probe (title_hash TEXT PRIMARY KEY)"
+                    )
+                    conn.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS temp_upsert_link_probe (link TEXT PRIMARY KEY)"
+                    )
+                    conn.execute("DELETE FROM temp_upsert_hash_probe")
+                    conn.execute("DELETE FROM temp_upsert_link_probe")
+
                     existing_links_by_hash: Dict[str, Set[str]] = {}
                     if unique_hashes:
-                        hash_placeholders = ",".join(["?"] * len(unique_hashes))
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO temp_upsert_hash_probe (title_hash) VALUES (?)",
+                            [(title_hash,) for title_hash in unique_hashes],
+                        )
                         hash_rows = conn.execute(
-                            f"""
+                            """
                             SELECT n.title_hash, nk.link
-                            FROM news n
+                            FROM temp_upsert_hash_probe probe
+                            JOIN news n ON n.title_hash = probe.title_hash
                             JOIN news_keywords nk ON nk.link = n.link
                             WHERE nk.query_key = ?
-                              AND n.title_hash IN ({hash_placeholders})
                               AND COALESCE(n.is_deleted, 0) = 0
                             """,
-                            [scope_query_key] + unique_hashes,
+                            (scope_query_key,),
                         ).fetchall()
                         for row in hash_rows:
                             title_hash = str(row[0] or "")
@@ -138,15 +178,19 @@ class _NewsUpsertMixin:
 
                     existing_hash_by_link: Dict[str, str] = {}
                     if incoming_links:
-                        link_placeholders = ",".join(["?"] * len(incoming_links))
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO temp_upsert_link_probe (link) VALUES (?)",
+                            [(link,) for link in incoming_links],
+                        )
                         link_rows = conn.execute(
-                            f"""
+                            """
                             SELECT nk.link, COALESCE(n.title_hash, '')
-                            FROM news_keywords nk
+                            FROM temp_upsert_link_probe probe
+                            JOIN news_keywords nk ON nk.link = probe.link
                             JOIN news n ON n.link = nk.link
-                            WHERE nk.query_key = ? AND nk.link IN ({link_placeholders})
+                            WHERE nk.query_key = ?
                             """,
-                            [scope_query_key] + incoming_links,
+                            (scope_query_key,),
                         ).fetchall()
                         for row in link_rows:
                             existing_hash_by_link[str(row[0] or "")] = str(row[1] or "")
@@ -164,7 +208,8 @@ class _NewsUpsertMixin:
                         hash_links = existing_links_by_hash.setdefault(title_hash, set())
                         previous_hash = existing_hash_by_link.get(link)
                         same_link_exists = previous_hash is not None
-                        has_other_link = any(existing_link != link for existing_link in hash_links)
+                        # O(1) replacement for scanning hash_links for a different link.
+                        has_other_link = len(hash_links) > (1 if link in hash_links else 0)
 
                         if same_link_exists:
                             is_dup = has_other_link
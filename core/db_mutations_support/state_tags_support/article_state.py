@@ -17,6 +17,49 @@ logger = logging.getLogger(__name__)
 
 
 class _NewsArticleStateMixin:
+    def _apply_status_update(
+        self: DatabaseManager,
+        conn: sqlite3.Connection,
+        link: str,
+        field: str,
+        value: Any,
+        timestamp: float,
+    ) -> bool:
+        if field == "notes":
+            normalized_value = normalize_note(value)
+            current = conn.execute(
+                "SELECT COALESCE(notes, '') FROM news WHERE link = ?",
+                (link,),
+            ).fetchone()
+            if current is None or str(current[0] or "") == normalized_value:
+                return False
+            value = normalized_value
+        else:
+            try:
+                normalized_value = 1 if int(value or 0) else 0
+            except Exception:
+                normalized_value = 1 if bool(value) else 0
+            current = conn.execute(
+                f"SELECT COALESCE({field}, 0) FROM news WHERE link = ?",
+                (link,),
+            ).fetchone()
+            if current is None or int(current[0] or 0) == normalized_value:
+                return False
+            value = normalized_value
+        timestamp_field = {
+            "is_read": "read_updated_at",
+            "is_bookmarked": "bookmark_updated_at",
+            "notes": "notes_updated_at",
+        }.get(field)
+        if timestamp_field:
+            cursor = conn.execute(
+                f"UPDATE news SET {field} = ?, {timestamp_field} = ? WHERE link = ?",
+                (value, timestamp, link),
+            )
+        else:
+            cursor = conn.execute(f"UPDATE news SET {field} = ? WHERE link = ?", (value, link))
+        return int(cursor.rowcount or 0) > 0
+
     def update_status(self: DatabaseManager, link: str, field: str, value) -> bool:
         """Update a safe allow-listed status field."""
         if field not in self.ALLOWED_UPDATE_FIELDS:
@@ -28,46 +71,46 @@ class _NewsArticleStateMixin:
         conn = self.get_connection()
         try:
             with conn:
-                if field == "notes":
-                    normalized_value = normalize_note(value)
-                    current = conn.execute(
-                        "SELECT COALESCE(notes, '') FROM news WHERE link = ?",
-                        (link,),
-                    ).fetchone()
-                    if current is None or str(current[0] or "") == normalized_value:
-                        return False
-                    value = normalized_value
-                else:
-                    try:
-                        normalized_value = 1 if int(value or 0) else 0
-                    except Exception:
-                        normalized_value = 1 if bool(value) else 0
-                    current = conn.execute(
-                        f"SELECT COALESCE({field}, 0) FROM news WHERE link = ?",
-                        (link,),
-                    ).fetchone()
-                    if current is None or int(current[0] or 0) == normalized_value:
-                        return False
-                    value = normalized_value
-                timestamp_field = {
-                    "is_read": "read_updated_at",
-                    "is_bookmarked": "bookmark_updated_at",
-                    "notes": "notes_updated_at",
-                }.get(field)
-                if timestamp_field:
-                    cursor = conn.execute(
-                        f"UPDATE news SET {field} = ?, {timestamp_field} = ? WHERE link = ?",
-                        (value, datetime.now().timestamp(), link),
-                    )
-                else:
-                    cursor = conn.execute(f"UPDATE news SET {field} = ? WHERE link = ?", (value, link))
-            return int(cursor.rowcount or 0) > 0
+                return self._apply_status_update(conn, link, field, value, datetime.now().timestamp())
         except sqlite3.Error as e:
             logger.error("DB update failed: %s", e)
             raise self._new_write_error("update_status", e) from e
         finally:
             self.return_connection(conn)
 
+    def update_status_many(
+        self: DatabaseManager,
+        updates: List[Tuple[str, str, Any]],
+    ) -> List[bool]:
+        """Apply several ``(link, field, value)`` status updates in one transaction.
+
+        Returns one changed flag per input, matching ``update_status`` results.
+        """
+        results = [False] * len(updates)
+        pending: List[Tuple[int, str, str, Any]] = []
+        for index, (link, field, value) in enumerate(updates):
+            if field not in self.ALLOWED_UPDATE_FIELDS:
+                logger.error("Rejected update for unsupported field: %s", field)
+                continue
+            if isinstance(link, str) and link.strip():
+                pending.append((index, link, field, value))
+        if not pending:
+            return results
+
+        conn = self.get_connection()
+        try:
+            with conn:
+                self._begin_immediate(conn)
+                timestamp = datetime.now().timestamp()
+                for index, link, field, value in pending:
+                    results[index] = self._apply_status_update(conn, link, field, value, timestamp)
+            return results
+        except sqlite3.Error as e:
+            logger.error("DB batch update failed: %s", e)
+            raise self._new_write_error("update_status_many", e) from e
+        finally:
+            self.return_connection(conn)
+
     def save_note(self: DatabaseManager, link: str, note: str) -> bool:
         return self.update_status(link, "notes", note)
 
@@ -136,7 +179,7 @@ class _NewsArticleStateMixin:
             self.return_connection(conn)
 
     def get_note(self: DatabaseManager, link: str) -> str:
-        conn = self.get_connection()
+        conn = self.get_read_connection()
         try:
             result = conn.execute("SELECT notes FROM news WHERE link = ?", (link,)).fetchone()
             return str(result[0]) if result and result[0] else ""
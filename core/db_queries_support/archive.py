@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 import re
 import sqlite3
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from core.publisher_aliases import expand_publisher_filters
@@ -105,14 +104,14 @@ class _DatabaseArchiveQueriesMixin:
 
         if start_date:
             try:
-                s_ts = datetime.strptime(start_date, "%Y-%m-%d").timestamp()
+                s_ts = self._date_filter_ts(start_date)
                 query += " AND n.pubDate_ts >= ?"
                 params.append(s_ts)
             except ValueError:
                 logger.warning("Invalid start_date format for archive search: %s", start_date)
         if end_date:
             try:
-                e_ts = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).timestamp()
+                e_ts = self._date_filter_ts(end_date, next_day=True)
                 query += " AND n.pubDate_ts < ?"
                 params.append(e_ts)
             except ValueError:
@@ -142,7 +141,7 @@ class _DatabaseArchiveQueriesMixin:
         rows_out: List[Dict[str, Any]] = []
         try:
             if active_conn is None:
-                active_conn = self.get_connection()
+                active_conn = self.get_read_connection()
             params: List[Any] = []
             query = self._append_archive_filters(
                 self._archive_base_select(include_deleted=include_deleted),
@@ -163,10 +162,10 @@ class _DatabaseArchiveQueriesMixin:
                 query += " ORDER BY n.pubDate_ts DESC, n.link DESC"
             query += " LIMIT ? OFFSET ?"
             params.extend([max(1, int(limit or 50)), max(0, int(offset or 0))])
-            cursor = active_conn.execute(query, params)
-            columns = [column[0] for column in cursor.description]
-            for row in cursor.fetchall():
-                rows_out.append(dict(zip(columns, row)))
+            cursor = active_conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(query, params)
+            rows_out = list(map(dict, cursor.fetchall()))
             return rows_out
         except Exception as e:
             logger.error("search_archive failed: %s", e)
@@ -194,7 +193,7 @@ class _DatabaseArchiveQueriesMixin:
         active_conn = conn
         try:
             if active_conn is None:
-                active_conn = self.get_connection()
+                active_conn = self.get_read_connection()
             params: List[Any] = []
             deleted_filter = "1 = 1" if include_deleted else "COALESCE(n.is_deleted, 0) = 0"
             query = self._append_archive_filters(
@@ -27,8 +27,8 @@ class _DatabaseCountQueriesMixin:
         """Count memberships for a keyword or a full query scope."""
         conn = None
         try:
-            conn = self.get_connection()
-            with perf_timer("db.get_counts", f"kw={keyword}|query_key={query_key or ''}"):
+            conn = self.get_read_connection()
+            with perf_timer("db.get_counts", "kw=%s|query_key=%s", keyword, query_key or ""):
                 if query_key:
                     row = conn.execute(
                         """
@@ -65,8 +65,8 @@ class _DatabaseCountQueriesMixin:
         """Count unread rows for a keyword or a full query scope."""
         conn = None
         try:
-            conn = self.get_connection()
-            with perf_timer("db.get_unread_count", f"kw={keyword}|query_key={query_key or ''}"):
+            conn = self.get_read_connection()
+            with perf_timer("db.get_unread_count", "kw=%s|query_key=%s", keyword, query_key or ""):
                 params: List[Any] = []
                 query = (
                     "SELECT COUNT(*) "
@@ -95,7 +95,7 @@ class _DatabaseCountQueriesMixin:
         active_conn = conn
         try:
             if active_conn is None:
-                active_conn = self.get_connection()
+                active_conn = self.get_read_connection()
             with perf_timer("db.get_total_unread_count", "scope=all"):
                 params: List[Any] = []
                 query = "SELECT COUNT(*) FROM news n WHERE n.is_read = 0 AND COALESCE(n.is_deleted, 0) = 0"
@@ -126,8 +126,8 @@ class _DatabaseCountQueriesMixin:
 
         conn = None
         try:
-            conn = self.get_connection()
-            with perf_timer(f"db.get_unread_counts_by_{column_name}", f"count={len(cleaned)}"):
+            conn = self.get_read_connection()
+            with perf_timer(f"db.get_unread_counts_by_{column_name}", "count=%s", len(cleaned)):
                 placeholders = ",".join(["?"] * len(cleaned))
                 query = f"""
                     SELECT nk.{column_name}, COUNT(*) AS unread_count
@@ -182,10 +182,13 @@ class _DatabaseCountQueriesMixin:
         deduped_links = list(dict.fromkeys(cleaned_links))
         conn = None
         try:
-            conn = self.get_connection()
+            conn = self.get_read_connection()
             with perf_timer(
                 "db.get_existing_links_for_query",
-                f"kw={keyword}|query_key={query_key or ''}|links={len(deduped_links)}",
+                "kw=%s|query_key=%s|links=%s",
+                keyword,
+                query_key or "",
+                len(deduped_links),
             ):
                 placeholders = ",".join(["?"] * len(deduped_links))
                 params: List[Any] = []
@@ -5,8 +5,9 @@ from __future__ import annotations
 import logging
 import re
 import sqlite3
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from core.publisher_aliases import expand_publisher_filters
@@ -25,7 +26,189 @@ class NewsCountSummary:
     unread_count: int
 
 
+_FETCH_SELECT_COLUMNS = """
+    n.link,
+    n.title,
+    n.description,
+    n.pubDate,
+    n.publisher,
+    n.is_read,
+    n.is_bookmarked,
+    n.pubDate_ts,
+    n.created_at,
+    n.notes,
+    COALESCE((
+        SELECT GROUP_CONCAT(nt.tag, ',')
+        FROM news_tags nt
+        WHERE nt.link = n.link
+    ), '') AS tags,
+    n.title_hash,
+"""
+_FETCH_SELECT_BOOKMARK = _FETCH_SELECT_COLUMNS + """
+    CASE
+        WHEN EXISTS (
+            SELECT 1 FROM news_keywords nk
+            WHERE nk.link = n.link AND nk.is_duplicate = 1
+        ) THEN 1
+        ELSE 0
+    END AS is_duplicate
+"""
+_FETCH_SELECT_SCOPE = _FETCH_SELECT_COLUMNS + """
+    nk.is_duplicate AS is_duplicate
+"""
+
+
+@lru_cache(maxsize=64)
+def _build_news_scope_sql(
+    select_expression: str,
+    only_bookmark: bool,
+    scope_column: str,
+    only_unread: bool,
+    hide_duplicates: bool,
+) -> str:
+    """Return the flag-dependent, parameter-free prefix shared by fetch/count.
+
+    The prefix only binds the scope value (``nk.<scope_column> = ?``) for tab
+    views, so the same flag combination always yields the same SQL text.
+    """
+    if only_bookmark:
+        query = (
+            f"SELECT {select_expression} "
+            "FROM news n "
+            "WHERE n.is_bookmarked = 1 AND COALESCE(n.is_deleted, 0) = 0"
+        )
+    else:
+        query = (
+            f"SELECT {select_expression} "
+            "FROM news n "
+            "JOIN news_keywords nk ON nk.link = n.link "
+            f"WHERE nk.{scope_column} = ? AND COALESCE(n.is_deleted, 0) = 0"
+        )
+
+    if only_unread:
+        query += " AND n.is_read = 0"
+
+    if hide_duplicates:
+        if only_bookmark:
+            query += (
+                " AND NOT EXISTS ("
+                "SELECT 1 FROM news_keywords nk WHERE nk.link = n.link AND nk.is_duplicate = 1)"
+            )
+        else:
+            query += " AND nk.is_duplicate = 0"
+    return query
+
+
 class _DatabaseFetchQueriesMixin:
+    COUNT_CACHE_TTL_SECONDS = 5.0
+    COUNT_CACHE_MAX_ENTRIES = 256
+
+    def _count_cache_key(self: DatabaseManager, operation: str, **kwargs: Any) -> tuple:
+        return (operation,) + tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(kwargs.items())
+        )
+
+    def _count_cache_get(self: DatabaseManager, key: tuple) -> Any:
+        with self._lock:
+            entry = self._count_cache.get(key)
+            if entry is None:
+                return None
+            value, cached_at, generation = entry
+            if generation != self._write_generation or time.monotonic() - cached_at > self.COUNT_CACHE_TTL_SECONDS:
+                self._count_cache.pop(key, None)
+                return None
+            return value
+
+    def _count_cache_put(self: DatabaseManager, key: tuple, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation != self._write_generation:
+                return
+            self._count_cache[key] = (value, time.monotonic(), generation)
+            self._count_cache.move_to_end(key)
+            while len(self._count_cache) > self.COUNT_CACHE_MAX_ENTRIES:
+                self._count_cache.popitem(last=False)
+
+    def _news_scope_query(
+        self: DatabaseManager,
+        params: List[Any],
+        keyword: str,
+        query_key: Optional[str],
+        *,
+        select_expression: str,
+        only_bookmark: bool,
+        only_unread: bool,
+        hide_duplicates: bool,
+    ) -> str:
+        scope_column = "keyword"
+        if not only_bookmark:
+            normalized_query_key = str(query_key or "").strip()
+            if normalized_query_key:
+                scope_column = "query_key"
+                params.append(normalized_query_key)
+            else:
+                params.append(keyword)
+        return _build_news_scope_sql(
+            select_expression,
+            bool(only_bookmark),
+            scope_column,
+            bool(only_unread),
+            bool(hide_duplicates),
+        )
+
+    def _append_news_filter_clauses(
+        self: DatabaseManager,
+        params: List[Any],
+        *,
+        filter_txt: str = "",
+        exclude_words: Optional[List[str]] = None,
+        blocked_publishers: Optional[List[str]] = None,
+        preferred_publishers: Optional[List[str]] = None,
+        only_preferred_publishers: bool = False,
+        tag_filter: str = "",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> str:
+        query = ""
+        fts_match = self._fts_match_expression(filter_txt)
+        if fts_match:
+            query += (
+                " AND n.rowid IN ("
+                "SELECT rowid FROM news_fts WHERE news_fts MATCH ?"
+                ")"
+            )
+            params.append(fts_match)
+
+        query += self._append_visibility_filter_clause(
+            params,
+            blocked_publishers=blocked_publishers,
+            preferred_publishers=preferred_publishers,
+            only_preferred_publishers=only_preferred_publishers,
+            tag_filter=tag_filter,
+        )
+
+        query += self._append_text_filter_clause(params, filter_txt)
+
+        query += self._append_exclude_words_clause(params, exclude_words)
+
+        if start_date:
+            try:
+                s_ts = self._date_filter_ts(start_date)
+                query += " AND n.pubDate_ts >= ?"
+                params.append(s_ts)
+            except ValueError:
+                logger.warning("Invalid start_date format: %s", start_date)
+
+        if end_date:
+            try:
+                e_ts = self._date_filter_ts(end_date, next_day=True)
+                query += " AND n.pubDate_ts < ?"
+                params.append(e_ts)
+            except ValueError:
+                logger.warning("Invalid end_date format: %s", end_date)
+
+        return query
+
     def fetch_news(
         self: DatabaseManager,
         keyword: str,
@@ -50,132 +233,42 @@ class _DatabaseFetchQueriesMixin:
         managed_conn = conn is None
         news_items: List[Dict[str, Any]] = []
         scope_meta = (
-            f"kw={keyword}|query_key={query_key or ''}|bookmark={int(only_bookmark)}|"
-            f"unread={int(only_unread)}|hide_dup={int(hide_duplicates)}|"
-            f"ex={len(exclude_words) if exclude_words else 0}|limit={limit}|offset={offset}"
+            "kw=%s|query_key=%s|bookmark=%d|unread=%d|hide_dup=%d|ex=%d|limit=%s|offset=%s",
+            keyword,
+            query_key or "",
+            only_bookmark,
+            only_unread,
+            hide_duplicates,
+            len(exclude_words) if exclude_words else 0,
+            limit,
+            offset,
         )
         try:
             if conn is None:
-                conn = self.get_connection()
-            with perf_timer("db.fetch_news", scope_meta):
+                conn = self.get_read_connection()
+            with perf_timer("db.fetch_news", *scope_meta):
                 params: List[Any] = []
-                fts_match = self._fts_match_expression(filter_txt)
-
-                if only_bookmark:
-                    query = (
-                        """
-                        SELECT
-                            n.link,
-                            n.title,
-                            n.description,
-                            n.pubDate,
-                            n.publisher,
-                            n.is_read,
-                            n.is_bookmarked,
-                            n.pubDate_ts,
-                            n.created_at,
-                            n.notes,
-                            COALESCE((
-                                SELECT GROUP_CONCAT(nt.tag, ',')
-                                FROM news_tags nt
-                                WHERE nt.link = n.link
-                            ), '') AS tags,
-                            n.title_hash,
-                            CASE
-                                WHEN EXISTS (
-                                    SELECT 1 FROM news_keywords nk
-                                    WHERE nk.link = n.link AND nk.is_duplicate = 1
-                                ) THEN 1
-                                ELSE 0
-                            END AS is_duplicate
-                        FROM news n
-                        WHERE n.is_bookmarked = 1
-                          AND COALESCE(n.is_deleted, 0) = 0
-                        """
-                    )
-                else:
-                    query = (
-                        """
-                        SELECT
-                            n.link,
-                            n.title,
-                            n.description,
-                            n.pubDate,
-                            n.publisher,
-                            n.is_read,
-                            n.is_bookmarked,
-                            n.pubDate_ts,
-                            n.created_at,
-                            n.notes,
-                            COALESCE((
-                                SELECT GROUP_CONCAT(nt.tag, ',')
-                                FROM news_tags nt
-                                WHERE nt.link = n.link
-                            ), '') AS tags,
-                            n.title_hash,
-                            nk.is_duplicate AS is_duplicate
-                        FROM news n
-                        JOIN news_keywords nk ON nk.link = n.link
-                        WHERE
-                        """
-                        + self._append_news_scope_clause(params, keyword, query_key)
-                        + " AND COALESCE(n.is_deleted, 0) = 0"
-                    )
-
-                if fts_match:
-                    query += (
-                        " AND n.rowid IN ("
-                        "SELECT rowid FROM news_fts WHERE news_fts MATCH ?"
-                        ")"
-                    )
-                    params.append(fts_match)
-
-                if only_unread:
-                    query += " AND n.is_read = 0"
-
-                if hide_duplicates:
-                    if only_bookmark:
-                        query += (
-                            " AND NOT EXISTS ("
-                            "SELECT 1 FROM news_keywords nk WHERE nk.link = n.link AND nk.is_duplicate = 1)"
-                        )
-                    else:
-                        query += " AND nk.is_duplicate = 0"
-
-                query += self._append_visibility_filter_clause(
+                query = self._news_scope_query(
+                    params,
+                    keyword,
+                    query_key,
+                    select_expression=_FETCH_SELECT_BOOKMARK if only_bookmark else _FETCH_SELECT_SCOPE,
+                    only_bookmark=only_bookmark,
+                    only_unread=only_unread,
+                    hide_duplicates=hide_duplicates,
+                )
+                query += self._append_news_filter_clauses(
                     params,
+                    filter_txt=filter_txt,
+                    exclude_words=exclude_words,
                     blocked_publishers=blocked_publishers,
                     preferred_publishers=preferred_publishers,
                     only_preferred_publishers=only_preferred_publishers,
                     tag_filter=tag_filter,
+                    start_date=start_date,
+                    end_date=end_date,
                 )
 
-                query += self._append_text_filter_clause(params, filter_txt)
-
-                if exclude_words:
-                    for exclude_word in exclude_words:
-                        if not exclude_word:
-                            continue
-                        query += " AND NOT (n.title LIKE ? ESCAPE '\\' OR n.description LIKE ? ESCAPE '\\')"
-                        wildcard = self._like_contains(exclude_word)
-                        params.extend([wildcard, wildcard])
-
-                if start_date:
-                    try:
-                        s_ts = datetime.strptime(start_date, "%Y-%m-%d").timestamp()
-                        query += " AND n.pubDate_ts >= ?"
-                        params.append(s_ts)
-                    except ValueError:
-                        logger.warning("Invalid start_date format: %s", start_date)
-
-                if end_date:
-                    try:
-                        e_ts = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).timestamp()
-                        query += " AND n.pubDate_ts < ?"
-                        params.append(e_ts)
-                    except ValueError:
-                        logger.warning("Invalid end_date format: %s", end_date)
-
                 if sort_mode == "최신순":
                     query += " ORDER BY n.pubDate_ts DESC, n.link DESC"
                 else:
@@ -188,10 +281,9 @@ class _DatabaseFetchQueriesMixin:
                     params.append(safe_offset)
 
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 cursor.execute(query, params)
-                columns = [column[0] for column in cursor.description]
-                for row in cursor.fetchall():
-                    news_items.append(dict(zip(columns, row)))
+                news_items = list(map(dict, cursor.fetchall()))
         except Exception as e:
             logger.error("fetch_news failed: %s", e)
             raise self._new_query_error("fetch_news", e) from e
@@ -220,77 +312,26 @@ class _DatabaseFetchQueriesMixin:
         query_key: Optional[str] = None,
     ) -> tuple[str, List[Any]]:
         params: List[Any] = []
-        fts_match = self._fts_match_expression(filter_txt)
-        if only_bookmark:
-            query = (
-                f"SELECT {select_expression} "
-                "FROM news n "
-                "WHERE n.is_bookmarked = 1 AND COALESCE(n.is_deleted, 0) = 0"
-            )
-        else:
-            query = (
-                f"SELECT {select_expression} "
-                "FROM news n "
-                "JOIN news_keywords nk ON nk.link = n.link "
-                "WHERE "
-                + self._append_news_scope_clause(params, keyword, query_key)
-                + " AND COALESCE(n.is_deleted, 0) = 0"
-            )
-
-        if fts_match:
-            query += (
-                " AND n.rowid IN ("
-                "SELECT rowid FROM news_fts WHERE news_fts MATCH ?"
-                ")"
-            )
-            params.append(fts_match)
-
-        if only_unread:
-            query += " AND n.is_read = 0"
-
-        if hide_duplicates:
-            if only_bookmark:
-                query += (
-                    " AND NOT EXISTS ("
-                    "SELECT 1 FROM news_keywords nk WHERE nk.link = n.link AND nk.is_duplicate = 1)"
-                )
-            else:
-                query += " AND nk.is_duplicate = 0"
-
-        query += self._append_visibility_filter_clause(
+        query = self._news_scope_query(
+            params,
+            keyword,
+            query_key,
+            select_expression=select_expression,
+            only_bookmark=only_bookmark,
+            only_unread=only_unread,
+            hide_duplicates=hide_duplicates,
+        )
+        query += self._append_news_filter_clauses(
             params,
+            filter_txt=filter_txt,
+            exclude_words=exclude_words,
             blocked_publishers=blocked_publishers,
             preferred_publishers=preferred_publishers,
             only_preferred_publishers=only_preferred_publishers,
             tag_filter=tag_filter,
+            start_date=start_date,
+            end_date=end_date,
         )
-
-        query += self._append_text_filter_clause(params, filter_txt)
-
-        if exclude_words:
-            for exclude_word in exclude_words:
-                if not exclude_word:
-                    continue
-                query += " AND NOT (n.title LIKE ? ESCAPE '\\' OR n.description LIKE ? ESCAPE '\\')"
-                wildcard = self._like_contains(exclude_word)
-                params.extend([wildcard, wildcard])
-
-        if start_date:
-            try:
-                s_ts = datetime.strptime(start_date, "%Y-%m-%d").timestamp()
-                query += " AND n.pubDate_ts >= ?"
-                params.append(s_ts)
-            except ValueError:
-                logger.warning("Invalid start_date format: %s", start_date)
-
-        if end_date:
-            try:
-                e_ts = (datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)).timestamp()
-                query += " AND n.pubDate_ts < ?"
-                params.append(e_ts)
-            except ValueError:
-                logger.warning("Invalid end_date format: %s", end_date)
-
         return query, params
 
     def count_news(
@@ -310,34 +351,55 @@ class _DatabaseFetchQueriesMixin:
         query_key: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> int:
-        """Count rows for a tab or bookmark view."""
+        """Count rows for a tab or bookmark view.
+
+        Counts on pooled connections are memoized briefly and dropped on any
+        write; caller-supplied connections (snapshots) always query directly.
+        """
         managed_conn = conn is None
         scope_meta = (
-            f"kw={keyword}|query_key={query_key or ''}|bookmark={int(only_bookmark)}|"
-            f"unread={int(only_unread)}|hide_dup={int(hide_duplicates)}"
+            "kw=%s|query_key=%s|bookmark=%d|unread=%d|hide_dup=%d",
+            keyword,
+            query_key or "",
+            only_bookmark,
+            only_unread,
+            hide_duplicates,
+        )
+        query_kwargs: Dict[str, Any] = dict(
+            only_bookmark=only_bookmark,
+            only_unread=only_unread,
+            hide_duplicates=hide_duplicates,
+            filter_txt=filter_txt,
+            exclude_words=exclude_words,
+            blocked_publishers=blocked_publishers,
+            preferred_publishers=preferred_publishers,
+            only_preferred_publishers=only_preferred_publishers,
+            tag_filter=tag_filter,
+            start_date=start_date,
+            end_date=end_date,
+            query_key=query_key,
         )
+        cache_key = None
+        if managed_conn:
+            cache_key = self._count_cache_key("count_news", keyword=keyword, **query_kwargs)
+            cached = self._count_cache_get(cache_key)
+            if cached is not None:
+                return cached
+        generation = self._write_generation
         try:
             if conn is None:
-                conn = self.get_connection()
-            with perf_timer("db.count_news", scope_meta):
+                conn = self.get_read_connection()
+            with perf_timer("db.count_news", *scope_meta):
                 query, params = self._build_count_news_query(
                     keyword,
                     select_expression="COUNT(*)",
-                    only_bookmark=only_bookmark,
-                    only_unread=only_unread,
-                    hide_duplicates=hide_duplicates,
-                    filter_txt=filter_txt,
-                    exclude_words=exclude_words,
-                    blocked_publishers=blocked_publishers,
-                    preferred_publishers=preferred_publishers,
-                    only_preferred_publishers=only_preferred_publishers,
-                    tag_filter=tag_filter,
-                    start_date=start_date,
-                    end_date=end_date,
-                    query_key=query_key,
+                    **query_kwargs,
                 )
                 row = conn.execute(query, params).fetchone()
-                return int(row[0]) if row else 0
+                total = int(row[0]) if row else 0
+                if cache_key is not None:
+                    self._count_cache_put(cache_key, total, generation)
+                return total
         except Exception as e:
             logger.error("count_news failed: %s", e)
             raise self._new_query_error("count_news", e) from e
@@ -365,39 +427,57 @@ class _DatabaseFetchQueriesMixin:
         """Count total and unread rows for the same visible scope in one query."""
         managed_conn = conn is None
         scope_meta = (
-            f"kw={keyword}|query_key={query_key or ''}|bookmark={int(only_bookmark)}|"
-            f"unread={int(only_unread)}|hide_dup={int(hide_duplicates)}"
+            "kw=%s|query_key=%s|bookmark=%d|unread=%d|hide_dup=%d",
+            keyword,
+            query_key or "",
+            only_bookmark,
+            only_unread,
+            hide_duplicates,
         )
+        query_kwargs: Dict[str, Any] = dict(
+            only_bookmark=only_bookmark,
+            only_unread=only_unread,
+            hide_duplicates=hide_duplicates,
+            filter_txt=filter_txt,
+            exclude_words=exclude_words,
+            blocked_publishers=blocked_publishers,
+            preferred_publishers=preferred_publishers,
+            only_preferred_publishers=only_preferred_publishers,
+            tag_filter=tag_filter,
+            start_date=start_date,
+            end_date=end_date,
+            query_key=query_key,
+        )
+        cache_key = None
+        if managed_conn:
+            cache_key = self._count_cache_key("count_news_states", keyword=keyword, **query_kwargs)
+            cached = self._count_cache_get(cache_key)
+            if cached is not None:
+                return cached
+        generation = self._write_generation
         try:
             if conn is None:
-                conn = self.get_connection()
-            with perf_timer("db.count_news_states", scope_meta):
+                conn = self.get_read_connection()
+            with perf_timer("db.count_news_states", *scope_meta):
                 query, params = self._build_count_news_query(
                     keyword,
                     select_expression=(
                         "COUNT(*) AS total_count, "
                         "COALESCE(SUM(CASE WHEN n.is_read = 0 THEN 1 ELSE 0 END), 0) AS unread_count"
                     ),
-                    only_bookmark=only_bookmark,
-                    only_unread=only_unread,
-                    hide_duplicates=hide_duplicates,
-                    filter_txt=filter_txt,
-                    exclude_words=exclude_words,
-                    blocked_publishers=blocked_publishers,
-                    preferred_publishers=preferred_publishers,
-                    only_preferred_publishers=only_preferred_publishers,
-                    tag_filter=tag_filter,
-                    start_date=start_date,
-                    end_date=end_date,
-                    query_key=query_key,
+                    **query_kwargs,
                 )
                 row = conn.execute(query, params).fetchone()
                 if not row:
-                    return NewsCountSummary(0, 0)
-                return NewsCountSummary(
-                    total_count=max(0, int(row[0] or 0)),
-                    unread_count=max(0, int(row[1] or 0)),
-                )
+                    summary = NewsCountSummary(0, 0)
+                else:
+                    summary = NewsCountSummary(
+                        total_count=max(0, int(row[0] or 0)),
+                        unread_count=max(0, int(row[1] or 0)),
+                    )
+                if cache_key is not None:
+                    self._count_cache_put(cache_key, summary, generation)
+                return summary
         except Exception as e:
             logger.error("count_news_states failed: %s", e)
             raise self._new_query_error("count_news_states", e) from e
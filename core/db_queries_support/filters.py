@@ -6,7 +6,8 @@ import logging
 import re
 import sqlite3
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from core.publisher_aliases import expand_publisher_filters
 from core.text_utils import perf_timer
@@ -18,6 +19,36 @@ logger = logging.getLogger(__name__)
 RE_FTS_ACCEL_TOKEN = re.compile(r"[0-9A-Za-z\u3131-\u318E\uAC00-\uD7A3]{2,}")
 
 
+@lru_cache(maxsize=256)
+def _ymd_to_ts(value: str, next_day: bool = False) -> float:
+    parsed = datetime.strptime(value, "%Y-%m-%d")
+    if next_day:
+        parsed += timedelta(days=1)
+    return parsed.timestamp()
+
+
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+@lru_cache(maxsize=256)
+def _minimal_exclude_words(exclude_words: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Drop exclude words already implied by a shorter one.
+
+    SQLite LIKE only folds ASCII case, so "coin" excluding a row also
+    excludes every row "Bitcoin" would; each dropped word saves two LIKE
+    scans per candidate row.
+    """
+    kept: List[str] = []
+    kept_folded: List[str] = []
+    for word in sorted(dict.fromkeys(w for w in exclude_words if w), key=len):
+        folded = word.translate(_ASCII_LOWER)
+        if any(existing in folded for existing in kept_folded):
+            continue
+        kept.append(word)
+        kept_folded.append(folded)
+    return tuple(kept)
+
+
 class _DatabaseQueryFilterMixin:
     def _active_news_clause(self: DatabaseManager, alias: str = "n") -> str:
         return f"COALESCE({alias}.is_deleted, 0) = 0"
@@ -28,6 +59,24 @@ class _DatabaseQueryFilterMixin:
     def _like_contains(self: DatabaseManager, value: str) -> str:
         return f"%{self._escape_like(value)}%"
 
+    def _append_exclude_words_clause(
+        self: DatabaseManager,
+        params: List[Any],
+        exclude_words: Optional[Iterable[str]],
+    ) -> str:
+        if not exclude_words:
+            return ""
+        query = ""
+        for exclude_word in _minimal_exclude_words(tuple(str(word) for word in exclude_words if word)):
+            query += " AND NOT (n.title LIKE ? ESCAPE '\\' OR n.description LIKE ? ESCAPE '\\')"
+            wildcard = self._like_contains(exclude_word)
+            params.extend([wildcard, wildcard])
+        return query
+
+    def _date_filter_ts(self: DatabaseManager, value: str, *, next_day: bool = False) -> float:
+        """Parse a ``YYYY-MM-DD`` UI date bound; repeated paging reuses the cached value."""
+        return _ymd_to_ts(str(value), bool(next_day))
+
     def _filter_tokens(self: DatabaseManager, filter_txt: str) -> List[str]:
         raw = str(filter_txt or "").strip()
         if not raw:
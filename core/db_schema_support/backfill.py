@@ -76,25 +76,26 @@ class _NewsBackfillSchemaMixin:
         total_updated = 0
         safe_chunk_size = max(1, int(self.TITLE_HASH_BACKFILL_CHUNK_SIZE))
 
+        last_rowid = 0
+
         while True:
             rows = conn.execute(
-                "SELECT link, title FROM news WHERE title_hash IS NULL LIMIT ?",
-                (safe_chunk_size,),
+                "SELECT rowid, link, title FROM news "
+                "WHERE title_hash IS NULL AND rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, safe_chunk_size),
             ).fetchall()
             if not rows:
                 break
 
+            last_rowid = int(rows[-1][0])
             updates = [
-                (self._calculate_title_hash(str(title or "")), str(link or ""))
-                for link, title in rows
+                (self._calculate_title_hash(str(title or "")), rowid)
+                for rowid, link, title in rows
                 if str(link or "").strip()
             ]
-            if not updates:
-                break
-
-            conn.executemany("UPDATE news SET title_hash = ? WHERE link = ?", updates)
-            conn.commit()
-            total_updated += len(updates)
+            if updates:
+                conn.executemany("UPDATE news SET title_hash = ? WHERE rowid = ?", updates)
+                total_updated += len(updates)
 
         remaining = int(
             conn.execute("SELECT COUNT(*) FROM news WHERE title_hash IS NULL").fetchone()[0]
@@ -109,25 +110,26 @@ class _NewsBackfillSchemaMixin:
         total_updated = 0
         safe_chunk_size = max(1, int(self.PUBDATE_TS_BACKFILL_CHUNK_SIZE))
 
+        last_rowid = 0
+
         while True:
             rows = conn.execute(
-                "SELECT link, pubDate FROM news WHERE pubDate_ts IS NULL LIMIT ?",
-                (safe_chunk_size,),
+                "SELECT rowid, link, pubDate FROM news "
+                "WHERE pubDate_ts IS NULL AND rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, safe_chunk_size),
             ).fetchall()
             if not rows:
                 break
 
+            last_rowid = int(rows[-1][0])
             updates = [
-                (parse_date_to_ts(str(pub_date or "")), str(link or ""))
-                for link, pub_date in rows
+                (parse_date_to_ts(str(pub_date or "")), rowid)
+                for rowid, link, pub_date in rows
                 if str(link or "").strip()
             ]
-            if not updates:
-                break
-
-            conn.executemany("UPDATE news SET pubDate_ts = ? WHERE link = ?", updates)
-            conn.commit()
-            total_updated += len(updates)
+            if updates:
+                conn.executemany("UPDATE news SET pubDate_ts = ? WHERE rowid = ?", updates)
+                total_updated += len(updates)
 
         remaining = int(
             conn.execute("SELECT COUNT(*) FROM news WHERE pubDate_ts IS NULL").fetchone()[0]
@@ -23,15 +23,46 @@ logger = logging.getLogger(__name__)
 class _DatabaseConnectionSchemaMixin:
     def _create_connection(self: DatabaseManager):
         """Create a pooled SQLite connection."""
-        conn = sqlite3.connect(self.db_file, timeout=30.0, check_same_thread=False)
+        conn = sqlite3.connect(
+            self.db_file,
+            timeout=self.SQLITE_BUSY_TIMEOUT_MS / 1000.0,
+            check_same_thread=False,
+            cached_statements=int(self.SQLITE_CACHED_STATEMENTS),
+        )
         conn.execute("PRAGMA foreign_keys=ON")
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA cache_size=-64000")
-        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute(f"PRAGMA busy_timeout={int(self.SQLITE_BUSY_TIMEOUT_MS)}")
+        self._apply_io_pragmas(conn)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _create_read_only_connection(self: DatabaseManager):
+        """Create a pooled connection that refuses writes (PRAGMA query_only).
+
+        A plain read/write handle is used instead of ``mode=ro`` so readers keep
+        working when the WAL/shm files are absent after a checkpoint.
+        """
+        conn = self._create_connection()
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _begin_immediate(self: DatabaseManager, conn: sqlite3.Connection) -> None:
+        """Take the WAL write lock up front so busy_timeout applies at BEGIN.
+
+        A deferred transaction that reads before writing can hit SQLITE_BUSY on
+        lock upgrade, which busy_timeout cannot retry.
+        """
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+
+    def _apply_io_pragmas(self: DatabaseManager, conn: sqlite3.Connection) -> None:
+        """Keep sort/group temp b-trees in memory and read pages through mmap."""
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={int(self.SQLITE_MMAP_SIZE_BYTES)}")
+        conn.execute(f"PRAGMA journal_size_limit={int(self.SQLITE_JOURNAL_SIZE_LIMIT_BYTES)}")
+
     def _news_column_names(self: DatabaseManager, conn: sqlite3.Connection) -> set[str]:
         return {str(row[1]) for row in conn.execute("PRAGMA table_info(news)").fetchall()}
 
@@ -66,12 +97,16 @@ class _DatabaseConnectionSchemaMixin:
         return last_result
 
     def _check_integrity(self: DatabaseManager) -> IntegrityCheckResult:
-        """Run PRAGMA integrity_check before using an existing DB."""
+        """Run PRAGMA quick_check before using an existing DB.
+
+        quick_check skips the index/content cross-verification of
+        integrity_check (O(N log N)) but still detects structural corruption.
+        """
         conn = None
         try:
             conn = sqlite3.connect(self.db_file, timeout=5.0)
             cursor = conn.cursor()
-            cursor.execute("PRAGMA integrity_check")
+            cursor.execute("PRAGMA quick_check")
             result = cursor.fetchone()
             if result and str(result[0]).lower() == "ok":
                 return IntegrityCheckResult("ok", "")
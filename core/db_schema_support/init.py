@@ -22,7 +22,12 @@ logger = logging.getLogger(__name__)
 class _DatabaseInitSchemaMixin:
     def init_db(self: DatabaseManager):
         """Initialize tables, migrations, and indexes."""
+        is_new_db_file = not os.path.exists(self.db_file) or os.path.getsize(self.db_file) == 0
         conn = sqlite3.connect(self.db_file)
+        if is_new_db_file:
+            # page_size only applies before the first table is created; existing
+            # WAL databases cannot be resized, so never touch them here.
+            conn.execute(f"PRAGMA page_size={int(self.SQLITE_NEW_DB_PAGE_SIZE)}")
         with conn:
             conn.execute(
                 """
@@ -105,24 +110,23 @@ class _DatabaseInitSchemaMixin:
                 (datetime.now().timestamp(),),
             )
 
+            # Backfill before (re)building indexes so freshly created indexes
+            # are not maintained row by row during the bulk UPDATE.
+            self._backfill_missing_title_hashes(conn)
+            self._backfill_missing_pubdate_ts(conn)
+
+            needs_analyze = not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_news_publisher_deleted'"
+            ).fetchone()
             indexes = [
-                "CREATE INDEX IF NOT EXISTS idx_keyword ON news(keyword)",
-                "CREATE INDEX IF NOT EXISTS idx_bookmarked ON news(is_bookmarked)",
                 "CREATE INDEX IF NOT EXISTS idx_ts ON news(pubDate_ts)",
-                "CREATE INDEX IF NOT EXISTS idx_read ON news(is_read)",
                 "CREATE INDEX IF NOT EXISTS idx_read_ts ON news(is_read, pubDate_ts DESC)",
                 "CREATE INDEX IF NOT EXISTS idx_title_hash ON news(title_hash)",
-                "CREATE INDEX IF NOT EXISTS idx_duplicate ON news(is_duplicate)",
-                "CREATE INDEX IF NOT EXISTS idx_deleted ON news(is_deleted)",
                 "CREATE INDEX IF NOT EXISTS idx_deleted_ts ON news(is_deleted, delete_updated_at)",
-                "CREATE INDEX IF NOT EXISTS idx_keyword_read ON news(keyword, is_read)",
-                "CREATE INDEX IF NOT EXISTS idx_keyword_ts ON news(keyword, pubDate_ts DESC)",
-                "CREATE INDEX IF NOT EXISTS idx_keyword_dup ON news(keyword, is_duplicate)",
                 "CREATE INDEX IF NOT EXISTS idx_bookmarked_ts ON news(is_bookmarked, pubDate_ts DESC)",
                 "CREATE INDEX IF NOT EXISTS idx_bookmarked_read_ts ON news(is_bookmarked, is_read, pubDate_ts DESC)",
-                "CREATE INDEX IF NOT EXISTS idx_nk_keyword ON news_keywords(keyword)",
-                "CREATE INDEX IF NOT EXISTS idx_nk_query_key ON news_keywords(query_key)",
-                "CREATE INDEX IF NOT EXISTS idx_nk_link ON news_keywords(link)",
+                # Index-only probe for the bookmark view's per-row duplicate EXISTS.
+                "CREATE INDEX IF NOT EXISTS idx_nk_link_dup ON news_keywords(link, is_duplicate)",
                 "CREATE INDEX IF NOT EXISTS idx_nk_keyword_link ON news_keywords(keyword, link)",
                 "CREATE INDEX IF NOT EXISTS idx_nk_query_key_keyword ON news_keywords(query_key, keyword)",
                 "CREATE INDEX IF NOT EXISTS idx_nk_query_key_link ON news_keywords(query_key, link)",
@@ -130,7 +134,12 @@ class _DatabaseInitSchemaMixin:
                 "CREATE INDEX IF NOT EXISTS idx_nk_query_key_dup ON news_keywords(query_key, is_duplicate)",
                 "CREATE INDEX IF NOT EXISTS idx_nk_query_key_keyword_dup ON news_keywords(query_key, keyword, is_duplicate)",
                 "CREATE INDEX IF NOT EXISTS idx_news_tags_tag ON news_tags(tag)",
-                "CREATE INDEX IF NOT EXISTS idx_news_tags_link ON news_tags(link)",
+                # Covers the news side of news_keywords -> news unread joins
+                # (grouped badge counts) without touching the table b-tree.
+                "CREATE INDEX IF NOT EXISTS idx_news_link_read_deleted ON news(link, is_read, is_deleted)",
+                # Lets get_top_publishers walk publishers in GROUP BY order
+                # and read is_deleted from the index instead of the table.
+                "CREATE INDEX IF NOT EXISTS idx_news_publisher_deleted ON news(publisher, is_deleted)",
             ]
             for idx in indexes:
                 try:
@@ -138,8 +147,25 @@ class _DatabaseInitSchemaMixin:
                 except sqlite3.OperationalError as e:
                     logger.debug("Index creation skipped: %s", e)
 
-            self._backfill_missing_title_hashes(conn)
-            self._backfill_missing_pubdate_ts(conn)
+            # Tab scopes are resolved through news_keywords, so the legacy
+            # news.keyword indexes are unused; the single-column indexes are
+            # strict prefixes of composites above. Each only costs writes.
+            redundant_indexes = (
+                "idx_keyword",
+                "idx_keyword_read",
+                "idx_keyword_ts",
+                "idx_keyword_dup",
+                "idx_read",
+                "idx_bookmarked",
+                "idx_duplicate",
+                "idx_deleted",
+                "idx_nk_keyword",
+                "idx_nk_query_key",
+                "idx_nk_link",
+                "idx_news_tags_link",
+            )
+            for redundant_index in redundant_indexes:
+                conn.execute(f"DROP INDEX IF EXISTS {redundant_index}")
 
             conn.execute(
                 """
@@ -161,4 +187,12 @@ class _DatabaseInitSchemaMixin:
             )
             self._recalculate_duplicate_flags_with_conn(conn)
 
+            if needs_analyze:
+                # One-time planner statistics so newly added covering indexes
+                # are picked up; later refreshes go through optimize_database().
+                try:
+                    conn.execute("ANALYZE")
+                except sqlite3.OperationalError as e:
+                    logger.debug("ANALYZE skipped: %s", e)
+
         conn.close()
@@ -18,8 +18,18 @@ class _DatabaseSchemaMixin(
 
     FTS_BACKFILL_CURSOR_KEY = "news_fts.backfill_rowid"
     FTS_BACKFILL_DONE_KEY = "news_fts.backfill_done"
-    TITLE_HASH_BACKFILL_CHUNK_SIZE = 1000
-    PUBDATE_TS_BACKFILL_CHUNK_SIZE = 5000
+    TITLE_HASH_BACKFILL_CHUNK_SIZE = 10000
+    PUBDATE_TS_BACKFILL_CHUNK_SIZE = 10000
+    SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+    SQLITE_JOURNAL_SIZE_LIMIT_BYTES = 64 * 1024 * 1024
+    SQLITE_NEW_DB_PAGE_SIZE = 4096
+    SQLITE_BUSY_TIMEOUT_MS = 30000
+    # Pool checkout outlasts busy_timeout so callers queue behind a lock holder
+    # instead of opening emergency connections that would block in SQLite.
+    POOL_CHECKOUT_GRACE_SEC = 10.0
+    # Fetch/count SQL is built from cached templates, so the number of distinct
+    # statement texts is bounded; keep them all compiled per connection.
+    SQLITE_CACHED_STATEMENTS = 256
 
 
 __all__ = ["IntegrityCheckResult", "_DatabaseSchemaMixin"]
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import logging
+import threading
 from dataclasses import dataclass
+from typing import Dict, Optional, Set
 
 import requests
 from requests.adapters import HTTPAdapter
 
+logger = logging.getLogger(__name__)
+
+NAVER_OPENAPI_ORIGIN = "https://openapi.naver.com/"
+
+_shared_sessions: Dict["HttpClientConfig", requests.Session] = {}
+_shared_sessions_lock = threading.Lock()
+_preheated_configs: Set["HttpClientConfig"] = set()
+
 
 @dataclass(frozen=True)
 class HttpClientConfig:
-    pool_connections: int = 20
-    pool_maxsize: int = 20
+    pool_connections: int = 2
+    pool_maxsize: int = 8
     max_retries: int = 0
     user_agent: str = "NewsScraperPro/32.7.3"
 
@@ -24,3 +35,58 @@ class HttpClientConfig:
         session.mount("http://", adapter)
         session.headers.update({"User-Agent": self.user_agent})
         return session
+
+    def shared_session(self) -> requests.Session:
+        """Return the process-wide keep-alive session for this config.
+
+        Fetch workers reuse it so TLS handshakes to the API host are paid once;
+        callers that need an isolated session use create_session() instead.
+        """
+        with _shared_sessions_lock:
+            session = _shared_sessions.get(self)
+            if session is None:
+                session = self.create_session()
+                _shared_sessions[self] = session
+            return session
+
+    def preheat_shared_session(
+        self,
+        url: str = NAVER_OPENAPI_ORIGIN,
+        timeout: float = 5.0,
+    ) -> Optional[threading.Thread]:
+        """Warm DNS/TLS for the shared session on a daemon thread.
+
+        This sends one real HEAD request to ``url`` (the API origin, no
+        credentials attached), at most once per config per process; later calls
+        return None. The pooled keep-alive connection is then reused by the
+        first refresh. Failures are only logged; the real request simply
+        reconnects.
+        """
+        with _shared_sessions_lock:
+            if self in _preheated_configs:
+                return None
+            _preheated_configs.add(self)
+        session = self.shared_session()
+
+        def _preheat() -> None:
+            try:
+                session.head(url, timeout=timeout, allow_redirects=False).close()
+            except requests.RequestException as exc:
+                logger.debug("HTTP session preheat failed (%s): %s", url, exc)
+
+        thread = threading.Thread(target=_preheat, name="http-preheat", daemon=True)
+        thread.start()
+        return thread
+
+
+def close_shared_sessions() -> None:
+    """Close every process-wide shared session (called once at app shutdown)."""
+    with _shared_sessions_lock:
+        sessions = list(_shared_sessions.values())
+        _shared_sessions.clear()
+        _preheated_configs.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception as exc:
+            logger.debug("HTTP session close failed: %s", exc)
@@ -1,9 +1,10 @@
+import copy
 import logging
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from core.constants import CONFIG_FILE
-from core.config_store import load_config_file, save_primary_config_file
+from core.config_store import AppConfig, load_config_file, save_primary_config_file
 from core.logging_setup import configure_logging
 
 configure_logging()
@@ -23,11 +24,9 @@ def merge_keyword_groups(
     for group_name, incoming_keywords in incoming_groups.items():
         if group_name not in merged and not incoming_keywords:
             continue
-        if group_name not in merged:
-            merged[group_name] = []
-        for keyword in incoming_keywords:
-            if keyword not in merged[group_name]:
-                merged[group_name].append(keyword)
+        merged_keywords = dict.fromkeys(merged.get(group_name, ()))
+        merged_keywords.update(dict.fromkeys(incoming_keywords))
+        merged[group_name] = list(merged_keywords)
 
     return merged
 
@@ -41,10 +40,35 @@ class KeywordGroupManager:
             os.path.dirname(os.path.abspath(config_file)),
             "keyword_groups.json",
         )
-        self.groups: Dict[str, List[str]] = {}  # {그룹명: [키워드 목록]}
+        self._groups: Dict[str, List[str]] = {}  # {그룹명: [키워드 목록]}
+        self._group_index: Optional[Tuple[Dict[str, str], Dict[str, Set[str]]]] = None
+        # (mtime_ns, size) of the config file as last read/written by us, and
+        # the parsed config at that point; lets saves skip the re-read.
+        self._config_snapshot: Optional[Tuple[Tuple[int, int], AppConfig]] = None
         self.last_error: str = ""
         self.load_groups()
 
+    @property
+    def groups(self) -> Dict[str, List[str]]:
+        return self._groups
+
+    @groups.setter
+    def groups(self, value: Dict[str, List[str]]) -> None:
+        self._groups = value
+        self._group_index = None
+
+    def _index(self) -> Tuple[Dict[str, str], Dict[str, Set[str]]]:
+        """키워드→그룹 역색인과 그룹별 키워드 set (groups 교체 시 재생성)."""
+        if self._group_index is None:
+            keyword_to_group: Dict[str, str] = {}
+            keyword_sets: Dict[str, Set[str]] = {}
+            for group, keywords in self._groups.items():
+                keyword_sets[group] = set(keywords)
+                for keyword in keywords:
+                    keyword_to_group.setdefault(keyword, group)
+            self._group_index = (keyword_to_group, keyword_sets)
+        return self._group_index
+
     def _normalize_groups(self, groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
         normalized: Dict[str, List[str]] = {}
         for group_name, raw_keywords in groups.items():
@@ -56,12 +80,9 @@ class KeywordGroupManager:
 
             keywords: List[str] = []
             if isinstance(raw_keywords, list):
-                for raw_keyword in raw_keywords:
-                    if not isinstance(raw_keyword, str):
-                        continue
-                    keyword = raw_keyword.strip()
-                    if keyword and keyword not in keywords:
-                        keywords.append(keyword)
+                # dict.fromkeys: 입력 순서를 유지하면서 O(N)으로 중복 제거
+                stripped = (k.strip() for k in raw_keywords if isinstance(k, str))
+                keywords = list(dict.fromkeys(k for k in stripped if k))
             normalized[cleaned_group_name] = keywords
         return normalized
 
@@ -104,16 +125,41 @@ class KeywordGroupManager:
             self.last_error = str(e)
             self.groups = {}
 
+    def _config_file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load_config_for_update(self) -> AppConfig:
+        """설정 파일이 마지막 저장 이후 바뀌지 않았으면 파싱 결과를 재사용한다."""
+        snapshot = self._config_snapshot
+        if snapshot is not None and snapshot[0] == self._config_file_stamp():
+            return copy.deepcopy(snapshot[1])
+        return load_config_file(self.config_file)
+
     def _persist_groups(self, groups: Dict[str, List[str]]) -> bool:
         normalized_groups = self._normalize_groups(groups)
         try:
-            config = load_config_file(self.config_file)
+            config = self._load_config_for_update()
+            if (
+                self._config_snapshot is not None
+                and list(config.get("keyword_groups", {}).items()) == list(normalized_groups.items())
+            ):
+                # 파일이 이미 같은 그룹을 같은 순서로 담고 있으면 쓰기를 생략한다.
+                self.groups = normalized_groups
+                self.last_error = ""
+                return True
             config["keyword_groups"] = normalized_groups
             save_primary_config_file(self.config_file, config)
+            stamp = self._config_file_stamp()
+            self._config_snapshot = (stamp, copy.deepcopy(config)) if stamp is not None else None
             self.groups = normalized_groups
             self.last_error = ""
             return True
         except Exception as e:
+            self._config_snapshot = None
             self.last_error = str(e)
             logger.error(f"키워드 그룹 저장 오류: {e}")
             return False
@@ -172,7 +218,7 @@ class KeywordGroupManager:
         if not normalized_keyword:
             self.last_error = "keyword_required"
             return False
-        if normalized_keyword in self.groups[normalized_group]:
+        if normalized_keyword in self._index()[1].get(normalized_group, ()):
             self.last_error = "duplicate_keyword"
             return False
         candidate = self._normalize_groups(dict(self.groups))
@@ -186,7 +232,7 @@ class KeywordGroupManager:
         if normalized_group not in self.groups:
             self.last_error = "group_not_found"
             return False
-        if normalized_keyword not in self.groups[normalized_group]:
+        if normalized_keyword not in self._index()[1].get(normalized_group, ()):
             self.last_error = "keyword_not_found"
             return False
         candidate = self._normalize_groups(dict(self.groups))
@@ -203,7 +249,4 @@ class KeywordGroupManager:
     
     def get_keyword_group(self, keyword: str) -> Optional[str]:
         """키워드가 속한 그룹 반환"""
-        for group, keywords in self.groups.items():
-            if keyword in keywords:
-                return group
-        return None
+        return self._index()[0].get(keyword)
@@ -11,6 +11,10 @@ def configure_logging() -> None:
     global _CONFIGURED
     if _CONFIGURED:
         return
+    if logging.getLogger().handlers:
+        # basicConfig would be a no-op; skip building (and opening) handlers.
+        _CONFIGURED = True
+        return
 
     try:
         logging.basicConfig(
@@ -22,6 +26,7 @@ def configure_logging() -> None:
                     maxBytes=2 * 1024 * 1024,
                     backupCount=5,
                     encoding='utf-8',
+                    delay=True,
                 ),
                 logging.StreamHandler(),
             ],
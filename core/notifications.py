@@ -1,23 +1,61 @@
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Optional
 
 from core.logging_setup import configure_logging
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
+_sound_executor: Optional[ThreadPoolExecutor] = None
+_sound_executor_lock = threading.Lock()
+_sound_pending = threading.Event()
+
+
+def _get_sound_executor() -> ThreadPoolExecutor:
+    global _sound_executor
+    with _sound_executor_lock:
+        if _sound_executor is None:
+            _sound_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notification-sound")
+        return _sound_executor
+
+
+def _message_beep(winsound: ModuleType, sound: int) -> None:
+    try:
+        winsound.MessageBeep(sound)
+    except Exception as e:
+        logger.debug(f"알림 소리 재생 실패: {e}")
+    finally:
+        _sound_pending.clear()
+
+
 class NotificationSound:
     """시스템 알림 소리 재생"""
-    
-    @staticmethod
-    def play(sound_type: str = "default"):
+
+    _winsound: Optional[ModuleType] = None
+
+    @classmethod
+    def _get_winsound(cls) -> ModuleType:
+        if cls._winsound is None:
+            import winsound
+            cls._winsound = winsound
+        return cls._winsound
+
+    @classmethod
+    def play(cls, sound_type: str = "default"):
         """
         알림 소리 재생
         sound_type: 'default', 'success', 'warning', 'error'
+
+        Windows에서는 MessageBeep가 GUI 스레드를 잠시 막으므로 전용 스레드 하나로 넘기며,
+        이미 재생 대기 중인 소리가 있으면 새 요청은 버린다.
         """
         try:
             if sys.platform == 'win32':
-                import winsound
+                winsound = cls._get_winsound()
                 sounds = {
                     'default': winsound.MB_OK,
                     'success': winsound.MB_ICONASTERISK,
@@ -25,19 +63,26 @@ class NotificationSound:
                     'error': winsound.MB_ICONHAND,
                 }
                 sound = sounds.get(sound_type, winsound.MB_OK)
-                winsound.MessageBeep(sound)
+                if _sound_pending.is_set():
+                    return
+                _sound_pending.set()
+                try:
+                    _get_sound_executor().submit(_message_beep, winsound, sound)
+                except Exception:
+                    _sound_pending.clear()
+                    raise
             else:
                 # macOS/Linux: 터미널 벨 사용
                 print('\a', end='', flush=True)
         except Exception as e:
             logger.debug(f"알림 소리 재생 실패: {e}")
     
-    @staticmethod
-    def is_available() -> bool:
+    @classmethod
+    def is_available(cls) -> bool:
         """알림 소리 사용 가능 여부"""
         if sys.platform == 'win32':
             try:
-                import winsound
+                cls._get_winsound()
                 return True
             except ImportError:
                 return False
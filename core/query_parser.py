@@ -1,19 +1,17 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 
 
-def _split_query_tokens(raw: str) -> Tuple[List[str], List[str]]:
-    parts = str(raw or "").split()
+@lru_cache(maxsize=1024)
+def _split_query_tokens_cached(raw: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    # 탭/검색창 문자열이 반복 파싱되므로 캐시는 튜플로 두고,
+    # 호출자에게는 수정해도 캐시에 영향이 없는 새 리스트를 돌려준다.
+    parts = raw.split()
     if not parts:
-        return [], []
-
-    positive_words: List[str] = []
-    exclude_words: List[str] = []
-    for token in parts:
-        if token.startswith("-"):
-            if len(token) > 1:
-                exclude_words.append(token[1:])
-            continue
-        positive_words.append(token)
+        return (), ()
+
+    positive_words = tuple(token for token in parts if not token.startswith("-"))
+    exclude_words = tuple(token[1:] for token in parts if len(token) > 1 and token[0] == "-")
     return positive_words, exclude_words
 
 
@@ -24,16 +22,15 @@ def parse_tab_query(raw: str) -> Tuple[str, List[str]]:
     old storage/grouping paths. The actual tab/fetch identity must be derived
     from `parse_search_query(...)` plus excludes through `build_fetch_key(...)`.
     """
-    positive_words, exclude_words = _split_query_tokens(raw)
+    positive_words, exclude_words = _split_query_tokens_cached(str(raw or ""))
     db_keyword = positive_words[0] if positive_words else ""
-    return db_keyword, exclude_words
+    return db_keyword, list(exclude_words)
 
 
 def parse_search_query(raw: str) -> Tuple[str, List[str]]:
     """API 검색어(모든 양키워드 결합) + 제외어를 반환."""
-    positive_words, exclude_words = _split_query_tokens(raw)
-    search_query = " ".join(positive_words)
-    return search_query, exclude_words
+    positive_words, exclude_words = _split_query_tokens_cached(str(raw or ""))
+    return " ".join(positive_words), list(exclude_words)
 
 
 def has_positive_keyword(raw: str) -> bool:
@@ -41,13 +38,13 @@ def has_positive_keyword(raw: str) -> bool:
     return bool(search_query)
 
 
-def build_fetch_key(search_keyword: str, exclude_words: List[str]) -> str:
-    normalized_keyword = (search_keyword or "").strip().lower()
-    normalized_excludes = sorted(
-        {
-            word.strip().lower()
-            for word in (exclude_words or [])
-            if isinstance(word, str) and word.strip()
-        }
-    )
+@lru_cache(maxsize=512)
+def _build_fetch_key_cached(search_keyword: str, exclude_words: Tuple[str, ...]) -> str:
+    normalized_keyword = search_keyword.strip().lower()
+    normalized_excludes = sorted({word.strip().lower() for word in exclude_words if word.strip()})
     return f"{normalized_keyword}|{'|'.join(normalized_excludes)}"
+
+
+def build_fetch_key(search_keyword: str, exclude_words: Sequence[str]) -> str:
+    excludes = tuple(word for word in (exclude_words or ()) if isinstance(word, str))
+    return _build_fetch_key_cached(search_keyword or "", excludes)
@@ -32,10 +32,13 @@ class RuntimePaths:
     instance_lock_file: str
 
 
+_SOURCE_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 def get_app_dir() -> str:
     if getattr(sys, "frozen", False):
         return os.path.dirname(sys.executable)
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return _SOURCE_APP_DIR
 
 
 def _is_truthy_env(value: object) -> bool:
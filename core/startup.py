@@ -7,13 +7,15 @@ from typing import Optional, TypedDict
 
 from core.constants import APP_DIR
 
-try:
-    import winreg
-    _WINREG: Optional[ModuleType] = winreg
-    WINREG_AVAILABLE = True
-except ImportError:
-    _WINREG = None
-    WINREG_AVAILABLE = False
+_WINREG: Optional[ModuleType] = None
+WINREG_AVAILABLE = False
+if sys.platform == 'win32':
+    try:
+        import winreg
+        _WINREG = winreg
+        WINREG_AVAILABLE = True
+    except ImportError:
+        pass
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,7 @@ class StartupManager:
     """Windows 시작프로그램 레지스트리 관리"""
     REGISTRY_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
     APP_NAME = "NaverNewsScraperPro"
+    _startup_enabled_cache: Optional[bool] = None
     
     @classmethod
     def is_available(cls) -> bool:
@@ -107,8 +110,21 @@ class StartupManager:
     
     @classmethod
     def is_startup_enabled(cls) -> bool:
-        """호환용 wrapper: 등록 상태가 건강한 경우에만 True."""
-        return bool(cls.get_startup_status().get("is_healthy", False))
+        """호환용 wrapper: 등록 상태가 건강한 경우에만 True.
+
+        설정 화면이 반복 호출하므로 결과는 등록/해제 또는 invalidate_cache() 전까지 재사용한다.
+        """
+        cached = StartupManager._startup_enabled_cache
+        if cached is not None:
+            return cached
+        enabled = bool(cls.get_startup_status().get("is_healthy", False))
+        StartupManager._startup_enabled_cache = enabled
+        return enabled
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """외부에서 레지스트리가 바뀌었을 수 있을 때 캐시된 등록 상태를 버린다."""
+        StartupManager._startup_enabled_cache = None
 
     @classmethod
     def has_startup_entry(cls) -> bool:
@@ -131,6 +147,8 @@ class StartupManager:
                 winreg_mod.KEY_SET_VALUE,
             ) as key:
                 winreg_mod.SetValueEx(key, cls.APP_NAME, 0, winreg_mod.REG_SZ, exe_path)
+            # 건강 상태는 최소화 옵션/대상 경로에도 좌우되므로 다음 조회 때 다시 계산한다.
+            cls.invalidate_cache()
             
             logger.info(f"시작프로그램 등록 완료: {exe_path}")
             return True
@@ -155,10 +173,11 @@ class StartupManager:
                 try:
                     winreg_mod.DeleteValue(key, cls.APP_NAME)
                     logger.info("시작프로그램 등록 해제 완료")
-                    return True
                 except FileNotFoundError:
                     # 이미 등록되어 있지 않음
-                    return True
+                    pass
+            StartupManager._startup_enabled_cache = False
+            return True
         except Exception as e:
             logger.error(f"시작프로그램 해제 오류: {e}")
             return False
@@ -1,12 +1,15 @@
+import atexit
 import html
 import logging
 import re
+import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from functools import lru_cache
-from typing import Dict
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
 
 from core.logging_setup import configure_logging
 
@@ -24,35 +27,128 @@ DATE_FORMATS = (
 )
 DATE_OUTPUT_FORMAT = '%Y.%m.%d %H:%M'
 
+PERF_FLUSH_INTERVAL_SEC = 1.0
+_PERF_BUFFER: Deque[str] = deque(maxlen=10000)
+_perf_flush_lock = threading.Lock()
+_perf_flush_thread: Optional[threading.Thread] = None
+
+
+def flush_perf_buffer() -> None:
+    """버퍼에 쌓인 PERF 항목을 항목마다 개별 로그 레코드로 내보낸다 (`PERF|` 검색 호환 유지)."""
+    while True:
+        try:
+            line = _PERF_BUFFER.popleft()
+        except IndexError:
+            break
+        logger.info("%s", line)
+
+
+def _perf_flush_loop() -> None:
+    while True:
+        time.sleep(PERF_FLUSH_INTERVAL_SEC)
+        try:
+            flush_perf_buffer()
+        except Exception:
+            pass
+
+
+def _ensure_perf_flusher() -> None:
+    global _perf_flush_thread
+    if _perf_flush_thread is not None:
+        return
+    with _perf_flush_lock:
+        if _perf_flush_thread is None:
+            thread = threading.Thread(target=_perf_flush_loop, name="perf-log-flush", daemon=True)
+            thread.start()
+            atexit.register(flush_perf_buffer)
+            _perf_flush_thread = thread
+
+
 @contextmanager
-def perf_timer(scope: str, meta: str = ""):
+def perf_timer(scope: str, meta: str = "", *meta_args: Any, min_ms: float = 1.0):
+    """블록 실행 시간을 측정해 PERF 버퍼에 기록한다 (min_ms 미만은 버림).
+
+    항목은 매번 로깅하지 않고 백그라운드 스레드가 PERF_FLUSH_INTERVAL_SEC마다 모아서 기록한다.
+    meta_args가 있으면 meta를 %-포맷 템플릿으로 보고 실제로 기록할 때만 포맷한다.
+    INFO가 꺼져 있으면 측정 자체를 건너뛴다.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        yield
+        return
     started = time.perf_counter()
     try:
         yield
     finally:
         elapsed_ms = (time.perf_counter() - started) * 1000.0
-        logger.info(f"PERF|{scope}|{elapsed_ms:.2f}ms|{meta}")
+        if elapsed_ms >= min_ms:
+            if meta_args:
+                try:
+                    meta = meta % meta_args
+                except (TypeError, ValueError):
+                    meta = "|".join([meta, *map(str, meta_args)])
+            _PERF_BUFFER.append(f"PERF|{scope}|{elapsed_ms:.2f}ms|{meta}")
+            _ensure_perf_flusher()
 
 
-def parse_date_string(date_str: str) -> str:
-    """날짜 문자열 파싱 헬퍼 함수 (RFC 2822 및 여러 포맷 지원)"""
-    if not date_str:
-        return ""
+def _parse_datetime(date_str: str):
+    """Parse RFC 2822 or one of ``DATE_FORMATS``; returns None when nothing matches.
+
+    ``YYYY-...`` strings never parse as RFC 2822, so they go straight to the
+    C-level ``datetime.fromisoformat`` and only fall back to the ``strptime``
+    format whose separator matches ``date_str[10]`` when that rejects them.
+    """
+    if date_str[4:5] == "-":
+        try:
+            return datetime.fromisoformat(date_str[:19])
+        except (ValueError, TypeError):
+            pass
+        separator = date_str[10:11]
+        if separator == "T":
+            preferred = DATE_FORMATS[0]
+        elif separator == " ":
+            preferred = DATE_FORMATS[1]
+        else:
+            preferred = DATE_FORMATS[2]
+        for fmt in (preferred, *(f for f in DATE_FORMATS if f != preferred)):
+            try:
+                return datetime.strptime(date_str[:19], fmt)
+            except (ValueError, TypeError):
+                continue
+        return None
     try:
         # RFC 2822 형식 먼저 시도 (네이버 API 기본 형식)
-        dt = parsedate_to_datetime(date_str)
-        return dt.strftime(DATE_OUTPUT_FORMAT)
+        return parsedate_to_datetime(date_str)
     except (ValueError, TypeError):
         # 대체 포맷들 시도
         for fmt in DATE_FORMATS:
             try:
-                dt = datetime.strptime(date_str[:19], fmt)
-                return dt.strftime(DATE_OUTPUT_FORMAT)
+                return datetime.strptime(date_str[:19], fmt)
             except (ValueError, TypeError):
                 continue
-    
-    # 추가: 한국어 날짜 형식 등 기타 포맷 시도 (필요시 확장)
-    
+    return None
+
+
+def parse_date_string(date_str: str) -> str:
+    """날짜 문자열 파싱 헬퍼 함수 (RFC 2822 및 여러 포맷 지원)"""
+    if not date_str:
+        return ""
+    if isinstance(date_str, str):
+        return _parse_date_string_cached(date_str)
+    return _parse_date_string_uncached(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string_cached(date_str: str) -> str:
+    return _parse_date_string_uncached(date_str)
+
+
+def _parse_date_string_uncached(date_str: str) -> str:
+    try:
+        dt = _parse_datetime(date_str)
+    except (ValueError, TypeError, AttributeError):
+        dt = None
+    if dt is not None:
+        return dt.strftime(DATE_OUTPUT_FORMAT)
     return date_str  # 파싱 실패 시 원본 반환
 
 
@@ -60,16 +156,24 @@ def parse_date_to_ts(date_str: str) -> float:
     """날짜 문자열을 타임스탬프로 변환 (정렬용)"""
     if not date_str:
         return 0.0
+    if isinstance(date_str, str):
+        # 같은 배치의 기사들은 pubDate 문자열이 자주 겹치므로 캐시를 거친다.
+        return _parse_date_to_ts_cached(date_str)
+    return _parse_date_to_ts_uncached(date_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_to_ts_cached(date_str: str) -> float:
+    return _parse_date_to_ts_uncached(date_str)
+
+
+def _parse_date_to_ts_uncached(date_str: str) -> float:
     try:
-        dt = parsedate_to_datetime(date_str)
+        dt = _parse_datetime(date_str)
+    except (ValueError, TypeError, AttributeError):
+        dt = None
+    if dt is not None:
         return dt.timestamp()
-    except (ValueError, TypeError):
-        for fmt in DATE_FORMATS:
-            try:
-                dt = datetime.strptime(date_str[:19], fmt)
-                return dt.timestamp()
-            except (ValueError, TypeError):
-                continue
     return 0.0
 
 
@@ -79,6 +183,14 @@ def get_highlight_pattern(keyword: str) -> re.Pattern:
     return re.compile(f'({re.escape(keyword)})', re.IGNORECASE)
 
 
+@lru_cache(maxsize=128)
+def get_highlight_union(keywords: Tuple[str, ...]) -> re.Pattern:
+    """여러 키워드를 하나의 교대(alternation) 패턴으로 캐시 반환"""
+    # 긴 키워드를 먼저 두어 겹치는 키워드("AI", "AI반도체")에서 더 긴 쪽이 우선 매칭되게 한다.
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('(' + '|'.join(map(re.escape, ordered)) + ')', re.IGNORECASE)
+
+
 class TextUtils:
     """텍스트 처리 유틸리티"""
     
@@ -97,3 +209,13 @@ class TextUtils:
         
         return highlighted
 
+    @staticmethod
+    def highlight_text_many(text: str, keywords: Iterable[str]) -> str:
+        """여러 키워드를 한 번의 치환으로 하이라이팅 (캐시된 결합 패턴 사용)"""
+        escaped_text = html.escape(text)
+        escaped_keywords = tuple(dict.fromkeys(html.escape(kw) for kw in keywords if kw))
+        if not escaped_keywords:
+            return escaped_text
+
+        pattern = get_highlight_union(escaped_keywords)
+        return pattern.sub(r"<span class='highlight'>\1</span>", escaped_text)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from PyQt6.QtCore import QThread
 
@@ -55,5 +55,11 @@ class WorkerRegistry:
         if self._active_request_id_by_tab_keyword.get(tab_keyword) == request_id:
             self._active_request_id_by_tab_keyword.pop(tab_keyword, None)
 
-    def all_handles(self) -> List[WorkerHandle]:
-        return list(self._handles_by_request_id.values())
+    def all_handles(self, snapshot: bool = False) -> Iterable[WorkerHandle]:
+        """Return a read-only live view of handles, or a list copy with snapshot=True.
+
+        Callers that clean up or pop workers while iterating must pass snapshot=True.
+        """
+        if snapshot:
+            return list(self._handles_by_request_id.values())
+        return self._handles_by_request_id.values()
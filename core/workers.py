@@ -51,6 +51,8 @@ from core.workers_support import (
     _publisher_from_naver_news_url,
     _publisher_from_url,
     _publisher_source_url,
+    _resolve_item_links,
+    _response_json,
     _retry_after_seconds_from_response,
     connect_qthread_finished,
     delete_qthread_when_finished,
@@ -90,5 +92,7 @@ __all__ = [
     "_publisher_from_naver_news_url",
     "_publisher_from_url",
     "_publisher_source_url",
+    "_resolve_item_links",
+    "_response_json",
     "_retry_after_seconds_from_response",
 ]
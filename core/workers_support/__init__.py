@@ -18,6 +18,8 @@ from core.workers_support.http_policy import (
     _publisher_from_naver_news_url,
     _publisher_from_url,
     _publisher_source_url,
+    _resolve_item_links,
+    _response_json,
     _retry_after_seconds_from_response,
 )
 from core.workers_support.jobs import (
@@ -62,5 +64,7 @@ __all__ = [
     "_publisher_from_naver_news_url",
     "_publisher_from_url",
     "_publisher_source_url",
+    "_resolve_item_links",
+    "_response_json",
     "_retry_after_seconds_from_response",
 ]
@@ -1,26 +1,31 @@
-import html
 import json
 import logging
+import re
 import threading
-import time
-import traceback
-from typing import Any, Callable, Dict, List, Optional, TypedDict, cast
+from typing import Any, Callable, Dict, List, Optional, Pattern, TypedDict, cast
 
 import requests
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from core.database import DatabaseConnectionError, DatabaseQueryError, DatabaseWriteError
+from core.database import (
+    DatabaseConnectionError,
+    DatabaseQueryError,
+    DatabaseWriteError,
+    NewsRow,
+    news_row_as_dict,
+)
+from core.http_client import HttpClientConfig
 from core.protocols import ClosableProtocol, RequestGetProtocol
 from core.query_parser import build_fetch_key
 from core.workers_support.http_policy import (
     MAX_FETCH_COOLDOWN_SECONDS,
     MAX_INLINE_RETRY_AFTER_SECONDS,
-    RE_BOLD_TAGS,
-    _is_naver_news_url,
+    _clean_api_text,
     _normalized_http_url,
     _publisher_from_naver_news_url,
     _publisher_from_url,
-    _publisher_source_url,
+    _resolve_item_links,
+    _response_json,
     _retry_after_seconds_from_response,
 )
 from core.workers_support.jobs import perf_timer
@@ -36,6 +41,14 @@ def _is_db_pool_exhausted_error(error: BaseException) -> bool:
     return "connection pool exhausted" in message or "pool exhausted" in message
 
 
+def _compile_exclude_pattern(exclude_words) -> Optional[Pattern[str]]:
+    """제외어를 소문자 부분일치 alternation 하나로 묶어 항목당 한 번만 스캔한다."""
+    words = {str(word).lower() for word in (exclude_words or ()) if word}
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+
+
 def _db_pool_exhausted_message() -> str:
     return "데이터베이스 연결이 포화 상태입니다. 잠시 후 다시 시도해주세요."
 
@@ -71,10 +84,17 @@ class ApiWorker(QObject):
         super().__init__()
         self.cid = client_id
         self.csec = client_secret
+        # 요청 헤더는 워커 수명 동안 바뀌지 않으므로 생성 시 한 번만 만든다.
+        # 공유 세션의 session.headers는 건드리지 않고 요청마다 이 dict를 넘긴다.
+        self._headers = {
+            "X-Naver-Client-Id": str(client_id or "").strip(),
+            "X-Naver-Client-Secret": str(client_secret or "").strip(),
+        }
         self.search_query = str(search_query or "").strip()
         self.db_keyword = str(db_keyword or "").strip()
         self.display_keyword = str(display_keyword or self.search_query or self.db_keyword)
         self.exclude_words = exclude_words
+        self._exclude_pattern = _compile_exclude_pattern(exclude_words)
         self.db = db_manager
         self.query_key = str(query_key or "").strip() or build_fetch_key(
             self.search_query,
@@ -85,8 +105,7 @@ class ApiWorker(QObject):
         self.timeout = timeout
         self.session = session
         self.session_factory = session_factory
-        self._is_running = True
-        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
         self._destroyed = False
         self._request_session: Optional[ClosableProtocol] = None
         self._owns_request_session = False
@@ -99,13 +118,14 @@ class ApiWorker(QObject):
 
     @property
     def is_running(self):
-        with self._lock:
-            return self._is_running and not self._destroyed
+        return not self._cancel_event.is_set() and not self._destroyed
 
     @is_running.setter
     def is_running(self, value):
-        with self._lock:
-            self._is_running = value
+        if value:
+            self._cancel_event.clear()
+        else:
+            self._cancel_event.set()
 
     def _safe_emit(self, signal, value):
         try:
@@ -154,11 +174,10 @@ class ApiWorker(QObject):
         return min(8, max(1, 2 ** max(0, int(attempt))))
 
     def _sleep_with_cancel(self, seconds: int) -> bool:
+        """Wait up to ``seconds``; stop() wakes the wait immediately. Returns is_running."""
         safe_seconds = max(0, int(seconds or 0))
-        for _ in range(safe_seconds):
-            if not self.is_running:
-                return False
-            time.sleep(1)
+        if safe_seconds and self._cancel_event.wait(safe_seconds):
+            return False
         return self.is_running
 
     def run(self):
@@ -172,10 +191,7 @@ class ApiWorker(QObject):
         if not self.db_keyword:
             self.db_keyword = self.search_query
 
-        headers = {
-            "X-Naver-Client-Id": self.cid.strip(),
-            "X-Naver-Client-Secret": self.csec.strip(),
-        }
+        headers = self._headers
         url = "https://openapi.naver.com/v1/search/news.json"
         self.last_error_meta = {
             "kind": "unknown",
@@ -183,19 +199,22 @@ class ApiWorker(QObject):
             "cooldown_seconds": 0,
             "retryable": False,
         }
+        # Injected and shared sessions outlive the worker; only a session the
+        # factory built for this run is closed in the finally block below.
         session: RequestGetProtocol
+        owns_session = False
         if self.session is not None:
             session = self.session
         elif self.session_factory is not None:
             session = self.session_factory()
+            owns_session = True
         else:
-            session = requests.Session()
-        owns_session = self.session is None
+            session = HttpClientConfig().shared_session()
         self._request_session = cast(ClosableProtocol, session) if hasattr(session, "close") else None
         self._owns_request_session = owns_session
 
         try:
-            with perf_timer("api.run", f"kw={self.display_keyword}|max_retries={self.max_retries}"):
+            with perf_timer("api.run", "kw=%s|max_retries=%s", self.display_keyword, self.max_retries):
                 for attempt in range(self.max_retries):
                     if not self.is_running:
                         logger.info(f"ApiWorker 중단됨: {self.display_keyword}")
@@ -214,7 +233,7 @@ class ApiWorker(QObject):
                             "sort": "date",
                         }
 
-                        with perf_timer("api.request", f"kw={self.display_keyword}|attempt={attempt + 1}"):
+                        with perf_timer("api.request", "kw=%s|attempt=%s", self.display_keyword, attempt + 1):
                             resp = session.get(
                                 url,
                                 headers=headers,
@@ -253,10 +272,8 @@ class ApiWorker(QObject):
                                 return
                             if attempt < self.max_retries - 1:
                                 self._safe_emit(self.progress, f"요청 제한 초과. {cooldown_seconds}초 후 재시도...")
-                                for _ in range(cooldown_seconds):
-                                    if not self.is_running:
-                                        return
-                                    time.sleep(1)
+                                if not self._sleep_with_cancel(cooldown_seconds):
+                                    return
                                 continue
                             self._emit_error(
                                 "API 요청 제한 초과. 잠시 후 다시 시도해주세요.",
@@ -289,48 +306,43 @@ class ApiWorker(QObject):
                             )
                             return
 
-                        with perf_timer("api.parse", f"kw={self.display_keyword}"):
-                            data = resp.json()
+                        with perf_timer("api.parse", "kw=%s", self.display_keyword):
+                            data = _response_json(resp)
                             raw_items = data.get("items", [])
-                            items: List[Dict[str, Any]] = []
+                            # 행은 NEWS_ROW_FIELDS 순서의 튜플로 모으고, dict는 새 항목에만 만든다.
+                            items: List[NewsRow] = []
                             new_items: List[Dict[str, Any]] = []
                             filtered_count = 0
-                            exclude_words_lc = [ex.lower() for ex in self.exclude_words if ex]
+                            exclude_pattern = self._exclude_pattern
+                            # stop()은 항상 이벤트를 세우므로 항목마다 property 대신 이벤트만 확인한다.
+                            is_cancelled = self._cancel_event.is_set
 
                             for item in raw_items:
-                                if not self.is_running:
+                                if is_cancelled():
                                     break
 
-                                title = html.unescape(RE_BOLD_TAGS.sub("", item.get("title", "")))
-                                desc = html.unescape(RE_BOLD_TAGS.sub("", item.get("description", "")))
-
-                                if exclude_words_lc:
-                                    should_exclude = False
-                                    title_lc = title.lower()
-                                    desc_lc = desc.lower()
-                                    for ex in exclude_words_lc:
-                                        if ex in title_lc or ex in desc_lc:
-                                            should_exclude = True
-                                            filtered_count += 1
-                                            break
-                                    if should_exclude:
-                                        continue
+                                title = _clean_api_text(item.get("title", ""))
+                                desc = _clean_api_text(item.get("description", ""))
+
+                                # 제목/본문을 구분자로 이어 lower()와 검색을 한 번씩만 수행한다.
+                                if exclude_pattern is not None and exclude_pattern.search(
+                                    f"{title}\x01{desc}".lower()
+                                ):
+                                    filtered_count += 1
+                                    continue
 
                                 naver_link = _normalized_http_url(item.get("link", ""))
                                 org_link = _normalized_http_url(item.get("originallink", ""))
-                                if _is_naver_news_url(naver_link):
-                                    final_link = naver_link
-                                elif _is_naver_news_url(org_link):
-                                    final_link = org_link
-                                else:
-                                    final_link = naver_link or org_link
+                                final_link, publisher_source, final_is_naver_news = _resolve_item_links(
+                                    naver_link,
+                                    org_link,
+                                )
                                 if not final_link:
                                     filtered_count += 1
                                     continue
 
-                                publisher_source = _publisher_source_url(org_link, final_link)
                                 publisher = _publisher_from_url(publisher_source)
-                                if not publisher_source and _is_naver_news_url(final_link):
+                                if not publisher_source and final_is_naver_news:
                                     publisher = _publisher_from_naver_news_url(final_link) or publisher
                                     if publisher == _publisher_from_url(""):
                                         logger.info(
@@ -339,13 +351,7 @@ class ApiWorker(QObject):
                                         )
 
                                 items.append(
-                                    {
-                                        "title": title,
-                                        "description": desc,
-                                        "link": final_link,
-                                        "pubDate": item.get("pubDate", ""),
-                                        "publisher": publisher,
-                                    }
+                                    (title, desc, final_link, item.get("pubDate", ""), publisher)
                                 )
 
                         self._safe_emit(self.progress, f"'{self.display_keyword}' 저장 중...")
@@ -353,12 +359,18 @@ class ApiWorker(QObject):
                             logger.info(f"ApiWorker cancelled before upsert: {self.display_keyword}")
                             return
 
+                        # 이 워커는 이미 전용 QThread에서 돌고 있으므로 upsert는 GUI와 겹쳐 실행된다.
+                        # finished는 new_items/added_count와 DB 오류 종류를 담아야 하고, 완료 핸들러가
+                        # 저장된 행에 자동화 규칙을 적용하고 탭을 다시 읽으므로 저장이 끝난 뒤에만 보낸다.
                         try:
                             upsert_detailed = getattr(self.db, "upsert_news_detailed", None)
                             if callable(upsert_detailed):
                                 with perf_timer(
                                     "api.upsert",
-                                    f"kw={self.db_keyword}|query_key={self.query_key}|items={len(items)}|mode=detailed",
+                                    "kw=%s|query_key=%s|items=%s|mode=detailed",
+                                    self.db_keyword,
+                                    self.query_key,
+                                    len(items),
                                 ):
                                     upsert_result = upsert_detailed(
                                         items,
@@ -374,29 +386,32 @@ class ApiWorker(QObject):
                                 ]
                                 new_link_set = set(new_link_order)
                                 seen_new_links = set()
-                                for item in items:
-                                    link = str(item.get("link", "") or "").strip()
+                                for row in items:
+                                    link = row[2].strip()
                                     if not link or link not in new_link_set or link in seen_new_links:
                                         continue
                                     seen_new_links.add(link)
-                                    new_items.append(item)
+                                    new_items.append(news_row_as_dict(row))
                             else:
                                 existing_links = self.db.get_existing_links_for_query(
-                                    [str(item.get("link", "") or "") for item in items],
+                                    [row[2] for row in items],
                                     keyword=self.db_keyword,
                                     query_key=self.query_key,
                                 )
                                 seen_new_links = set()
-                                for item in items:
-                                    link = str(item.get("link", "") or "").strip()
+                                for row in items:
+                                    link = row[2].strip()
                                     if not link or link in existing_links or link in seen_new_links:
                                         continue
                                     seen_new_links.add(link)
-                                    new_items.append(item)
+                                    new_items.append(news_row_as_dict(row))
 
                                 with perf_timer(
                                     "api.upsert",
-                                    f"kw={self.db_keyword}|query_key={self.query_key}|items={len(items)}|mode=legacy",
+                                    "kw=%s|query_key=%s|items=%s|mode=legacy",
+                                    self.db_keyword,
+                                    self.query_key,
+                                    len(items),
                                 ):
                                     added_count, dup_count = self.db.upsert_news(
                                         items,
@@ -506,8 +521,7 @@ class ApiWorker(QObject):
                         return
 
                     except Exception as e:
-                        logger.error(f"ApiWorker 예외: {self.display_keyword} - {e}")
-                        traceback.print_exc()
+                        logger.exception("ApiWorker 예외: %s - %s", self.display_keyword, e)
                         if not self.is_running:
                             logger.info(f"ApiWorker cancelled on exception: {self.display_keyword}")
                             return
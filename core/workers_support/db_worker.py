@@ -1,19 +1,82 @@
 import logging
-from typing import Any, Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThreadPool, pyqtSignal
 
-from core.workers_support.jobs import perf_timer
+from core.workers_support.jobs import PooledWorker, perf_timer
 from core.workers_support.query_scope import DBQueryScope
 
 logger = logging.getLogger(__name__)
 
-class DBWorker(QThread):
-    """DB 조회 전용 워커 스레드(UI 블로킹 방지)"""
+DB_WORKER_POOL_MAX_THREADS = 2
+_DB_WORKER_POOL: Optional[QThreadPool] = None
+
+
+def _db_worker_pool() -> QThreadPool:
+    """탭 DB 조회 전용 스레드 풀 (읽기 연결 경합을 줄이기 위해 동시 실행 수를 제한)"""
+    global _DB_WORKER_POOL
+    if _DB_WORKER_POOL is None:
+        pool = QThreadPool()
+        pool.setMaxThreadCount(DB_WORKER_POOL_MAX_THREADS)
+        _DB_WORKER_POOL = pool
+    return _DB_WORKER_POOL
+
+
+# 같은 범위를 다시 조회할 때(정렬 토글, 같은 필터어 재입력) SQLite를 건너뛰는 결과 메모.
+# 키에 DatabaseManager의 쓰기 세대를 넣으므로 쓰기가 생기면 이전 항목은 자연히 무효가 된다.
+DB_RESULT_CACHE_MAX_ENTRIES = 16
+DB_RESULT_CACHE_TTL_SECONDS = 5.0
+_DB_RESULT_CACHE: "weakref.WeakKeyDictionary[Any, OrderedDict[tuple, tuple]]" = weakref.WeakKeyDictionary()
+_db_result_cache_lock = threading.Lock()
+
+
+def _db_result_cache_get(db: Any, key: tuple) -> Optional[Tuple[List[Dict[str, Any]], int, int]]:
+    with _db_result_cache_lock:
+        try:
+            entries = _DB_RESULT_CACHE.get(db)
+        except TypeError:
+            return None
+        if not entries:
+            return None
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        rows, total_count, unread_count, cached_at = entry
+        if time.monotonic() - cached_at > DB_RESULT_CACHE_TTL_SECONDS:
+            entries.pop(key, None)
+            return None
+        entries.move_to_end(key)
+    return [dict(row) for row in rows], total_count, unread_count
+
+
+def _db_result_cache_put(
+    db: Any,
+    key: tuple,
+    rows: List[Dict[str, Any]],
+    total_count: int,
+    unread_count: int,
+) -> None:
+    snapshot = [dict(row) for row in rows]
+    with _db_result_cache_lock:
+        try:
+            entries = _DB_RESULT_CACHE.setdefault(db, OrderedDict())
+        except TypeError:
+            return
+        entries[key] = (snapshot, total_count, unread_count, time.monotonic())
+        entries.move_to_end(key)
+        while len(entries) > DB_RESULT_CACHE_MAX_ENTRIES:
+            entries.popitem(last=False)
+
+
+class DBWorker(PooledWorker):
+    """DB 조회 전용 워커(UI 블로킹 방지, 전용 스레드 풀에서 실행)"""
 
     finished = pyqtSignal(list, int)
     error = pyqtSignal(str)
-    settled = pyqtSignal()
 
     def __init__(
         self,
@@ -31,12 +94,33 @@ class DBWorker(QThread):
         self.offset = offset
         self.include_total = include_total
         self.known_total_count = known_total_count
-        self._is_cancelled = False
         self.last_unread_count = 0
         self._conn = None
 
+    def _thread_pool(self) -> QThreadPool:
+        return _db_worker_pool()
+
+    @property
+    def _is_cancelled(self) -> bool:
+        return self.isInterruptionRequested()
+
+    def _result_cache_key(self) -> Optional[tuple]:
+        generation = getattr(self.db, "_write_generation", None)
+        if not isinstance(generation, int):
+            return None
+        return (
+            generation,
+            self.scope,
+            self.limit,
+            self.offset,
+            self.include_total,
+            self.known_total_count,
+        )
+
     def stop(self):
-        self._is_cancelled = True
+        self.requestInterruption()
+        if self._cancel_queued():
+            return
         if self._conn is not None:
             try:
                 interrupt_connection = getattr(self.db, "interrupt_connection", None)
@@ -51,11 +135,22 @@ class DBWorker(QThread):
         try:
             with perf_timer(
                 "ui.dbworker.run",
-                f"kw={self.scope.keyword}|bookmark={int(self.scope.only_bookmark)}|include_total={int(self.include_total)}",
+                "kw=%s|bookmark=%d|include_total=%d",
+                self.scope.keyword,
+                self.scope.only_bookmark,
+                self.include_total,
             ):
                 if self._is_cancelled:
                     return
 
+                cache_key = self._result_cache_key()
+                if cache_key is not None:
+                    cached = _db_result_cache_get(self.db, cache_key)
+                    if cached is not None:
+                        data, total_count, self.last_unread_count = cached
+                        self.finished.emit(data, total_count)
+                        return
+
                 open_read_connection = getattr(self.db, "open_read_connection", None)
                 conn: Any
                 if callable(open_read_connection):
@@ -108,6 +203,8 @@ class DBWorker(QThread):
                 if self._is_cancelled:
                     return
 
+                if cache_key is not None:
+                    _db_result_cache_put(self.db, cache_key, data, total_count, self.last_unread_count)
                 self.finished.emit(data, total_count)
         except Exception as e:
             if self._is_cancelled or "interrupted" in str(e).lower():
@@ -1,11 +1,31 @@
+import html
 import ipaddress
 import re
 import urllib.parse
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Optional
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+    _ORJSON: Optional[ModuleType] = orjson
+except ImportError:
+    _ORJSON = None
 
 RE_BOLD_TAGS = re.compile(r"</?b>")
+# Naver API 응답에 실제로 등장하는 태그/엔티티만 한 번의 스캔으로 치환한다.
+_API_ENTITIES = {
+    "&amp;": "&",
+    "&lt;": "<",
+    "&gt;": ">",
+    "&quot;": '"',
+    "&apos;": "'",
+    "&#39;": "'",
+}
+RE_API_MARKUP = re.compile(r"</?b>|&(?:amp|lt|gt|quot|apos|#39);")
+RE_OTHER_AMPERSAND = re.compile(r"&(?!(?:amp|lt|gt|quot|apos|#39);)")
 MAX_INLINE_RETRY_AFTER_SECONDS = 30
 MAX_FETCH_COOLDOWN_SECONDS = 6 * 60 * 60
 
@@ -45,6 +65,33 @@ def _retry_after_seconds_from_response(response: Any) -> int:
         except Exception:
             header_value = None
     return _parse_retry_after_seconds(header_value)
+def _response_json(response: Any) -> Any:
+    """Decode a JSON body straight from bytes with orjson, else via response.json()."""
+    if _ORJSON is not None:
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            try:
+                return _ORJSON.loads(content)
+            except _ORJSON.JSONDecodeError:
+                # Non-UTF-8 bodies still go through requests' charset detection.
+                pass
+    return response.json()
+def _clean_api_text(value: Any) -> str:
+    """Strip Naver `<b>` highlight tags and decode entities, skipping no-op passes."""
+    text = str(value or "")
+    if "&" in text:
+        if RE_OTHER_AMPERSAND.search(text):
+            # Unknown entity or bare '&': keep html.unescape semantics.
+            if "<" in text:
+                text = text.replace("<b>", "").replace("</b>", "")
+            return html.unescape(text)
+        return RE_API_MARKUP.sub(_replace_api_markup, text)
+    if "<" in text:
+        # Tags only: two literal replaces are cheaper than a regex pass.
+        text = text.replace("<b>", "").replace("</b>", "")
+    return text
+def _replace_api_markup(match: "re.Match[str]") -> str:
+    return _API_ENTITIES.get(match.group(0), "")
 def _normalized_http_url(value: Any) -> str:
     text = str(value or "").strip()
     if not text:
@@ -78,8 +125,12 @@ def _is_disallowed_http_host(host: str) -> bool:
         )
     )
 def _host_from_url(value: str) -> str:
+    # 한 항목의 link/originallink가 판별 과정에서 여러 번 파싱되므로 결과를 캐시한다.
+    return _host_from_url_cached(str(value or ""))
+@lru_cache(maxsize=4096)
+def _host_from_url_cached(url: str) -> str:
     try:
-        return str(urllib.parse.urlparse(str(value or "")).hostname or "").strip().lower()
+        return str(urllib.parse.urlparse(url).hostname or "").strip().lower()
     except Exception:
         return ""
 def _is_naver_news_host(host: str) -> bool:
@@ -93,6 +144,25 @@ def _publisher_source_url(original_link: str, final_link: str) -> str:
         if host and not _is_naver_news_host(host):
             return candidate
     return ""
+def _resolve_item_links(naver_link: str, original_link: str) -> Tuple[str, str, bool]:
+    """Pick (final_link, publisher_source_url, final_is_naver_news) classifying each host once."""
+    naver_host = _host_from_url(naver_link)
+    original_host = _host_from_url(original_link)
+    naver_is_news = _is_naver_news_host(naver_host)
+    original_is_news = _is_naver_news_host(original_host)
+
+    if naver_is_news or (naver_link and not original_is_news):
+        final_link, final_host, final_is_news = naver_link, naver_host, naver_is_news
+    else:
+        final_link, final_host, final_is_news = original_link, original_host, original_is_news
+
+    if original_host and not original_is_news:
+        publisher_source = original_link
+    elif final_host and not final_is_news:
+        publisher_source = final_link
+    else:
+        publisher_source = ""
+    return final_link, publisher_source, final_is_news
 def _publisher_from_naver_news_url(value: str) -> str:
     if not _is_naver_news_url(value):
         return ""
@@ -117,7 +187,10 @@ def _publisher_from_naver_news_url(value: str) -> str:
         return ""
     return f"naver:oid:{oid}"
 def _publisher_from_url(value: str) -> str:
-    parsed = urllib.parse.urlparse(str(value or ""))
+    return _publisher_from_url_cached(str(value or ""))
+@lru_cache(maxsize=4096)
+def _publisher_from_url_cached(url: str) -> str:
+    parsed = urllib.parse.urlparse(url)
     host = parsed.netloc.strip().lower()
     if "@" in host:
         host = host.rsplit("@", 1)[-1]
@@ -1,11 +1,11 @@
 import logging
 import sqlite3
-import time
-import traceback
-from contextlib import contextmanager
+import threading
 from typing import Any, Dict, Optional, Protocol, cast
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+from core.text_utils import perf_timer
 
 logger = logging.getLogger(__name__)
 
@@ -15,20 +15,107 @@ class ReadConnectionProtocol(Protocol):
 
     def close(self) -> None:
         ...
-@contextmanager
-def perf_timer(scope: str, meta: str = ""):
-    started = time.perf_counter()
-    try:
-        yield
-    finally:
-        elapsed_ms = (time.perf_counter() - started) * 1000.0
-        logger.info(f"PERF|{scope}|{elapsed_ms:.2f}ms|{meta}")
-class AsyncJobWorker(QThread):
+def _job_name(job_func: Any) -> str:
+    return str(getattr(job_func, "__name__", job_func))
+ASYNC_JOB_POOL_MAX_THREADS = 4
+_ASYNC_JOB_POOL: Optional[QThreadPool] = None
+
+
+def _async_job_pool() -> QThreadPool:
+    """단발성 작업 전용 스레드 풀 (전역 풀 설정을 건드리지 않도록 별도 인스턴스 사용)"""
+    global _ASYNC_JOB_POOL
+    if _ASYNC_JOB_POOL is None:
+        pool = QThreadPool()
+        pool.setMaxThreadCount(ASYNC_JOB_POOL_MAX_THREADS)
+        _ASYNC_JOB_POOL = pool
+    return _ASYNC_JOB_POOL
+class AsyncJob(QRunnable):
+    """스레드 풀에서 PooledWorker.run을 실행하는 러너블"""
+
+    def __init__(self, worker: "PooledWorker"):
+        super().__init__()
+        self._worker = worker
+
+    def run(self):
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        try:
+            worker.run()
+        finally:
+            worker._mark_done()
+class PooledWorker(QObject):
+    """QThreadPool에서 run()을 실행하는 워커 공통 기반
+
+    작업마다 QThread를 만들지 않고 스레드 풀을 재사용한다.
+    호출부 호환을 위해 start/isRunning/wait/requestInterruption 등
+    QThread와 같은 형태의 메서드를 제공한다. 서브클래스 run()은 끝날 때 settled를 보낸다.
+    """
+
+    settled = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._interrupt_event = threading.Event()
+        self._done_event = threading.Event()
+        self._done_event.set()
+        self._job: Optional[AsyncJob] = None
+
+    def _thread_pool(self) -> QThreadPool:
+        return _async_job_pool()
+
+    def _mark_done(self) -> None:
+        self._job = None
+        self._done_event.set()
+
+    def start(self):
+        if not self._done_event.is_set():
+            return
+        self._done_event.clear()
+        job = AsyncJob(self)
+        self._job = job
+        self._thread_pool().start(job)
+
+    def _cancel_queued(self) -> bool:
+        """아직 풀 대기열에 있는 작업을 꺼내 실행 없이 종료 처리한다."""
+        job = self._job
+        if job is None or self._done_event.is_set():
+            return False
+        try:
+            taken = bool(self._thread_pool().tryTake(job))
+        except RuntimeError:
+            taken = False
+        if taken:
+            try:
+                self.settled.emit()
+            finally:
+                self._mark_done()
+        return taken
+
+    def isRunning(self) -> bool:  # noqa: N802 - QThread API spelling
+        return not self._done_event.is_set()
+
+    def isInterruptionRequested(self) -> bool:  # noqa: N802 - QThread API spelling
+        return self._interrupt_event.is_set()
+
+    def requestInterruption(self):  # noqa: N802 - QThread API spelling
+        self._interrupt_event.set()
+
+    def quit(self):
+        """QThread 호환용: 풀 작업에는 이벤트 루프가 없으므로 아무 것도 하지 않는다."""
+
+    def wait(self, msecs: Optional[int] = None) -> bool:
+        timeout = None if msecs is None else max(0, int(msecs)) / 1000.0
+        return self._done_event.wait(timeout)
+
+    def run(self):
+        """서브클래스가 실제 작업으로 재정의한다. 기본 구현은 작업 없이 settled만 보낸다."""
+        self.settled.emit()
+class AsyncJobWorker(PooledWorker):
     """단발성 비동기 작업 수행 워커"""
 
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
-    settled = pyqtSignal()
 
     def __init__(self, job_func, *args, parent=None, **kwargs):
         super().__init__(parent)
@@ -48,7 +135,7 @@ class AsyncJobWorker(QThread):
             if self.isInterruptionRequested():
                 return
             self.error.emit(str(e))
-            traceback.print_exc()
+            logger.exception("AsyncJobWorker job failed: %s", _job_name(self.job_func))
         finally:
             self.settled.emit()
 
@@ -116,7 +203,7 @@ class IterativeJobWorker(QThread):
                 self.cancelled.emit()
                 return
             self.error.emit(str(e))
-            traceback.print_exc()
+            logger.exception("IterativeJobWorker job failed: %s", _job_name(self.job_func))
         finally:
             self.settled.emit()
 
@@ -169,13 +256,13 @@ class InterruptibleReadWorker(QThread):
                 self.cancelled.emit()
                 return
             self.error.emit(str(e))
-            traceback.print_exc()
+            logger.exception("InterruptibleReadWorker job failed: %s", _job_name(self.job_func))
         except Exception as e:
             if self.isInterruptionRequested():
                 self.cancelled.emit()
                 return
             self.error.emit(str(e))
-            traceback.print_exc()
+            logger.exception("InterruptibleReadWorker job failed: %s", _job_name(self.job_func))
         finally:
             conn = self._conn
             self._conn = None
@@ -0,0 +1,104 @@
+import ast
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Tuple
+
+_TOP_LEVEL_DEF_TYPES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+_IDENTIFIER_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=None)
+def _literal_alternation(needles: Tuple[str, ...]) -> "re.Pattern[str]":
+    ordered = sorted(set(needles), key=len, reverse=True)
+    return re.compile("|".join(re.escape(needle) for needle in ordered))
+
+
+@lru_cache(maxsize=None)
+def _read_source_cached(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def _source_tokens_cached(path: str, mtime_ns: int) -> FrozenSet[str]:
+    return frozenset(_IDENTIFIER_RE.findall(_read_source_cached(path, mtime_ns)))
+
+
+@lru_cache(maxsize=None)
+def _parse_source_cached(path: str, mtime_ns: int) -> ast.Module:
+    return ast.parse(_read_source_cached(path, mtime_ns), filename=path)
+
+
+@lru_cache(maxsize=None)
+def _class_map_cached(path: str, mtime_ns: int) -> Dict[str, ast.ClassDef]:
+    module = _parse_source_cached(path, mtime_ns)
+    return {node.name: node for node in module.body if isinstance(node, ast.ClassDef)}
+
+
+@lru_cache(maxsize=None)
+def _top_level_spans_cached(path: str, mtime_ns: int) -> Dict[str, Tuple[int, int]]:
+    src = _read_source_cached(path, mtime_ns)
+    line_starts = [0]
+    for line in src.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+    spans: Dict[str, Tuple[int, int]] = {}
+    for node in _parse_source_cached(path, mtime_ns).body:
+        if not isinstance(node, _TOP_LEVEL_DEF_TYPES) or node.end_lineno is None:
+            continue
+        first_line = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+        spans.setdefault(node.name, (line_starts[first_line - 1], line_starts[node.end_lineno]))
+    return spans
+
+
+def read_source(path: str) -> str:
+    """Read a repository source file once per session (re-read if it changes on disk)."""
+    return _read_source_cached(path, os.stat(path).st_mtime_ns)
+
+
+def source_tokens(path: str) -> FrozenSet[str]:
+    """Return the set of identifier-like tokens in a source file for O(1) membership checks."""
+    return _source_tokens_cached(path, os.stat(path).st_mtime_ns)
+
+
+def top_level_block(path: str, name: str) -> str:
+    """Return the exact source span (decorators included) of a top-level ``def``/``class``."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    start, end = _top_level_spans_cached(path, mtime_ns)[name]
+    return _read_source_cached(path, mtime_ns)[start:end]
+
+
+def class_map(path: str) -> Dict[str, ast.ClassDef]:
+    """Map top-level class names to their AST nodes, parsing the file once per session."""
+    return _class_map_cached(path, os.stat(path).st_mtime_ns)
+
+
+def func_map(cls: ast.ClassDef) -> Dict[str, ast.FunctionDef]:
+    """Map method names defined directly in ``cls`` to their AST nodes."""
+    return {node.name: node for node in cls.body if isinstance(node, ast.FunctionDef)}
+
+
+def line_positions(block: str, *needles: str) -> Dict[str, int]:
+    """Return the first line number containing each needle, scanning ``block`` once."""
+    positions: Dict[str, int] = {}
+    pending = list(needles)
+    for lineno, line in enumerate(block.splitlines()):
+        for needle in [needle for needle in pending if needle in line]:
+            positions[needle] = lineno
+            pending.remove(needle)
+        if not pending:
+            break
+    return positions
+
+
+def literal_positions(block: str, *needles: str) -> Dict[str, int]:
+    """Return the first offset of each needle using one compiled-alternation pass.
+
+    Needles must not overlap each other in ``block``; missing needles are absent from the result.
+    """
+    positions: Dict[str, int] = {}
+    for match in _literal_alternation(needles).finditer(block):
+        positions.setdefault(match.group(0), match.start())
+        if len(positions) == len(needles):
+            break
+    return positions
@@ -3,7 +3,12 @@ import tempfile
 from pathlib import Path
 
 
+# Under pytest-xdist (`python -m pytest -n auto`) give each worker (gw0, gw1, ...)
+# its own temp/runtime directory so parallel filesystem tests never collide.
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "")
 _TMP_ROOT = Path(__file__).resolve().parent.parent / ".pytest_tmp"
+if _WORKER_ID:
+    _TMP_ROOT = _TMP_ROOT / _WORKER_ID
 _TMP_ROOT.mkdir(parents=True, exist_ok=True)
 _RUNTIME_ROOT = _TMP_ROOT / "runtime_data"
 _RUNTIME_ROOT.mkdir(parents=True, exist_ok=True)
@@ -28,6 +28,122 @@ class TestDbQueries(unittest.TestCase):
             "publisher": "example.com",
         }
 
+    def test_pooled_and_read_connections_apply_io_pragmas(self):
+        with self.mgr.connection() as conn:
+            self.assertEqual(int(conn.execute("PRAGMA temp_store").fetchone()[0]), 2)
+            self.assertEqual(int(conn.execute("PRAGMA journal_size_limit").fetchone()[0]), 64 * 1024 * 1024)
+        read_conn = self.mgr.open_read_connection()
+        try:
+            self.assertEqual(int(read_conn.execute("PRAGMA temp_store").fetchone()[0]), 2)
+        finally:
+            self.mgr.close_read_connection(read_conn)
+
+    def test_title_hash_matches_legacy_regex_normalization(self):
+        import hashlib
+        import re
+
+        for title in ["AI  News", "\tAI\u3000News\n", "Ａ Ｉ\u00a0뉴스", ""]:
+            legacy = hashlib.md5(re.sub(r"\s+", "", title.lower()).encode()).hexdigest()
+            self.assertEqual(self.mgr._calculate_title_hash(title), legacy)
+
+    def test_upsert_large_batch_probes_existing_hashes_and_links(self):
+        items = [self._make_item(idx, "2026-01-01T09:00:00") for idx in range(1200)]
+        self.assertEqual(self.mgr.upsert_news(items, "AI"), (1200, 0))
+
+        repeated = [dict(item, link=item["link"] + "?dup=1") for item in items[:3]]
+        self.assertEqual(self.mgr.upsert_news(items + repeated, "AI"), (0, 3))
+
+    def test_upsert_accepts_tuple_rows_in_field_order(self):
+        from core.database import NewsUpsertResult
+        from core.db_mutations_support import NEWS_ROW_FIELDS
+
+        items = [self._make_item(idx, "2026-01-01T09:00:00") for idx in range(3)]
+        rows = [tuple(item[field] for field in NEWS_ROW_FIELDS) for item in items]
+
+        result = self.mgr.upsert_news_detailed(rows, "AI")
+
+        self.assertEqual(result, NewsUpsertResult(3, 0, tuple(item["link"] for item in items)))
+        stored = {row["link"]: row for row in self.mgr.fetch_news("AI")}
+        self.assertEqual(stored[items[1]["link"]]["description"], "desc-1")
+        self.assertEqual(stored[items[1]["link"]]["publisher"], "example.com")
+
+    def test_init_db_backfills_missing_hashes_and_timestamps_across_chunks(self):
+        items = [self._make_item(idx, "2026-01-01T09:00:00") for idx in range(7)]
+        self.mgr.upsert_news(items, "AI")
+        expected = {row["link"]: (row["title_hash"], row["pubDate_ts"]) for row in self.mgr.fetch_news("AI")}
+        self.mgr.close()
+
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.execute("UPDATE news SET title_hash = NULL, pubDate_ts = NULL")
+            conn.commit()
+        finally:
+            conn.close()
+
+        with mock.patch.object(app.DatabaseManager, "TITLE_HASH_BACKFILL_CHUNK_SIZE", 3), mock.patch.object(
+            app.DatabaseManager, "PUBDATE_TS_BACKFILL_CHUNK_SIZE", 2
+        ):
+            self.mgr = app.DatabaseManager(str(self.db_path), max_connections=2)
+
+        restored = {row["link"]: (row["title_hash"], row["pubDate_ts"]) for row in self.mgr.fetch_news("AI")}
+        self.assertEqual(restored, expected)
+
+    def test_count_cache_serves_repeats_and_drops_on_write(self):
+        self.mgr.upsert_news([self._make_item(idx, "2026-01-01T09:00:00") for idx in range(3)], "AI")
+        self.assertEqual(self.mgr.count_news("AI", only_unread=True), 3)
+
+        with mock.patch.object(self.mgr, "get_read_connection", side_effect=AssertionError("cache miss")):
+            self.assertEqual(self.mgr.count_news("AI", only_unread=True), 3)
+
+        self.assertTrue(self.mgr.update_status("https://example.com/0", "is_read", 1))
+        self.assertEqual(self.mgr.count_news("AI", only_unread=True), 2)
+        self.assertEqual(self.mgr.count_news_states("AI").unread_count, 2)
+
+    def test_update_status_many_matches_single_update_results(self):
+        self.mgr.upsert_news([self._make_item(idx, "2026-01-01T09:00:00") for idx in range(2)], "AI")
+
+        results = self.mgr.update_status_many(
+            [
+                ("https://example.com/0", "is_read", 1),
+                ("https://example.com/0", "is_read", 1),
+                ("https://example.com/1", "notes", "memo"),
+                ("https://example.com/missing", "is_bookmarked", 1),
+                ("https://example.com/1", "title", "nope"),
+            ]
+        )
+
+        self.assertEqual(results, [True, False, True, False, False])
+        rows = {row["link"]: row for row in self.mgr.fetch_news("AI")}
+        self.assertEqual(rows["https://example.com/0"]["is_read"], 1)
+        self.assertEqual(rows["https://example.com/1"]["notes"], "memo")
+
+    def test_mark_all_as_read_updates_only_scoped_unread_rows(self):
+        shared = self._make_item(300, "2026-01-01T09:00:00")
+        self.mgr.upsert_news([shared, self._make_item(301, "2026-01-02T09:00:00")], "AI", query_key="ai|")
+        self.mgr.upsert_news([shared], "AI", query_key="ai robotics|")
+        self.mgr.upsert_news([self._make_item(302, "2026-01-03T09:00:00")], "ECON", query_key="econ|")
+
+        self.assertEqual(self.mgr.mark_all_as_read("AI", only_bookmark=False, query_key="ai|"), 2)
+        self.assertEqual(self.mgr.mark_all_as_read("AI", only_bookmark=False, query_key="ai|"), 0)
+        self.assertEqual(self.mgr.count_news("AI", only_unread=True, query_key="ai robotics|"), 0)
+        self.assertEqual(self.mgr.count_news("ECON", only_unread=True, query_key="econ|"), 1)
+
+    def test_mark_read_updates_probe_unread_rows_through_an_index(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            statements = [
+                "UPDATE news SET is_read = 1 WHERE is_read = 0 "
+                "AND COALESCE(is_deleted, 0) = 0 AND link IN ('a', 'b')",
+                "UPDATE news SET is_read = 1 WHERE is_bookmarked = 1 "
+                "AND is_read = 0 AND COALESCE(is_deleted, 0) = 0",
+            ]
+            for statement in statements:
+                plan = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + statement))
+                self.assertIn("USING", plan)
+                self.assertNotIn("SCAN news", plan)
+        finally:
+            conn.close()
+
     def test_fetch_news_limit_offset_compatible_with_default(self):
         items = [
             self._make_item(1, "2026-01-01T09:00:00"),
@@ -156,6 +272,21 @@ class TestDbQueries(unittest.TestCase):
         ]
         self.assertEqual([r["link"] for r in sql_filtered], [r["link"] for r in expected])
 
+    def test_overlapping_exclude_words_collapse_without_changing_results(self):
+        titles = ["Bitcoin rally", "COIN listing", "AI chips", "비트코인 급등"]
+        self.mgr.upsert_news(
+            [dict(self._make_item(idx, "2026-01-01T09:00:00"), title=title) for idx, title in enumerate(titles)],
+            "AI",
+        )
+
+        params: list = []
+        clause = self.mgr._append_exclude_words_clause(params, ["bitcoin", "coin", "Coin", "비트코인", "코인"])
+        rows = self.mgr.fetch_news("AI", exclude_words=["bitcoin", "coin", "Coin", "비트코인", "코인"])
+
+        self.assertEqual(clause.count("NOT ("), 2)
+        self.assertEqual(params, ["%코인%", "%코인%", "%coin%", "%coin%"])
+        self.assertEqual([row["title"] for row in rows], ["AI chips"])
+
     def test_count_news_supports_only_unread_with_exclude_words(self):
         items = [
             {
@@ -1185,6 +1316,8 @@ class TestDbSchemaMigration(unittest.TestCase):
                         for row in conn.execute("PRAGMA index_list(news)").fetchall()
                     }
                     self.assertIn("idx_bookmarked_read_ts", news_indexes)
+                    self.assertNotIn("idx_keyword_ts", news_indexes)
+                    self.assertNotIn("idx_read", news_indexes)
                 finally:
                     conn.close()
             finally:
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from core.database import NewsCountSummary
@@ -38,6 +39,20 @@ class _FakeConn:
         return None
 
 
+class _BlockingDb(_FakeDb):
+    def __init__(self, release: threading.Event):
+        super().__init__()
+        self.release = release
+
+    def count_news_states(self, **kwargs):
+        self.release.wait(5)
+        return super().count_news_states(**kwargs)
+
+
+class _GenerationalFakeDb(_FakeDb):
+    _write_generation: int = 0
+
+
 class TestDbWorkerPagination(unittest.TestCase):
     def _make_scope(self) -> DBQueryScope:
         return DBQueryScope(
@@ -131,6 +146,57 @@ class TestDbWorkerPagination(unittest.TestCase):
 
         self.assertEqual(db.interrupts, 1)
 
+    def test_dbworker_memoizes_repeat_scope_until_write_generation_changes(self):
+        db = _GenerationalFakeDb()
+        payloads = []
+
+        def run_once():
+            worker = DBWorker(db, scope=self._make_scope(), limit=50, offset=0, include_total=True)
+            worker.finished.connect(lambda data, total: payloads.append((data, total, worker.last_unread_count)))
+            worker.run()
+
+        run_once()
+        calls_after_first = len(db.calls)
+        payloads[0][0][0]["title"] = "mutated by caller"
+        run_once()
+
+        self.assertEqual(len(db.calls), calls_after_first)
+        self.assertEqual(payloads[1], ([{"link": "https://example.com/1", "title": "row"}], 123, 45))
+
+        db._write_generation += 1
+        run_once()
+
+        self.assertGreater(len(db.calls), calls_after_first)
+
+    def test_dbworker_stop_drops_job_still_queued_on_bounded_pool(self):
+        from core.workers_support.db_worker import DB_WORKER_POOL_MAX_THREADS
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        busy = [
+            DBWorker(_BlockingDb(release), scope=self._make_scope(), limit=50)
+            for _ in range(DB_WORKER_POOL_MAX_THREADS)
+        ]
+        for worker in busy:
+            worker.start()
+
+        queued_db = _FakeDb()
+        queued = DBWorker(queued_db, scope=self._make_scope(), limit=50)
+        settled = []
+        queued.settled.connect(lambda: settled.append(True))
+        queued.start()
+        self.assertTrue(queued.isRunning())
+
+        queued.stop()
+
+        self.assertFalse(queued.isRunning())
+        self.assertEqual(settled, [True])
+        self.assertEqual(queued_db.calls, [])
+
+        release.set()
+        for worker in busy:
+            self.assertTrue(worker.wait(2000))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,13 +7,14 @@ from unittest import mock
 
 from core.backup import AutoBackup, cleanup_applied_pending_restore_files
 from core.content_filters import MAX_NOTE_LENGTH
-from core.database import DatabaseManager
+from core.database import DatabaseManager, news_row_as_dict
 from core.workers import (
     ApiWorker,
     MAX_FETCH_COOLDOWN_SECONDS,
     _normalized_http_url,
     _publisher_from_naver_news_url,
     _publisher_source_url,
+    _resolve_item_links,
 )
 from ui._main_window_settings_io import import_bookmarks_notes_from_csv
 from ui.main_window_support.ui_shell import _MainWindowUIShellMixin
@@ -52,7 +53,7 @@ class _FakeDB:
 
     def upsert_news(self, items, keyword, query_key=None):
         self.upsert_calls += 1
-        self.items = list(items)
+        self.items = [news_row_as_dict(item) for item in items]
         return len(items), 0
 
 
@@ -114,6 +115,17 @@ class TestFollowup20260508(unittest.TestCase):
         self.assertFalse(_normalized_http_url("http://printer.local/news"))
         self.assertEqual(_normalized_http_url("https://example.com/news"), "https://example.com/news")
 
+    def test_resolve_item_links_prefers_naver_link_and_original_publisher(self):
+        naver = "https://n.news.naver.com/mnews/article/001/0000000001"
+        origin = "https://publisher.com/a/1"
+        self.assertEqual(_resolve_item_links(naver, origin), (naver, origin, True))
+        self.assertEqual(_resolve_item_links("", naver), (naver, "", True))
+        self.assertEqual(
+            _resolve_item_links("https://blog.example.com/x", origin),
+            ("https://blog.example.com/x", origin, False),
+        )
+        self.assertEqual(_resolve_item_links("", ""), ("", "", False))
+
     def test_naver_only_links_use_oid_publisher_fallback(self):
         source = _publisher_source_url("", "https://news.naver.com/main/read.naver?oid=001")
         self.assertEqual(source, "")
@@ -170,11 +182,11 @@ class TestFollowup20260508(unittest.TestCase):
         session = _SequenceSession([_FakeResponse(503, {"errorMessage": "down"}), _FakeResponse(200, payload)])
         worker, db = self._make_api_worker(session, max_retries=2)
 
-        with mock.patch("core.workers.time.sleep") as sleep_mock:
+        with mock.patch.object(worker._cancel_event, "wait", return_value=False) as wait_mock:
             worker.run()
 
         self.assertEqual(len(session.calls), 2)
-        self.assertEqual(sleep_mock.call_count, 1)
+        wait_mock.assert_called_once_with(1)
         self.assertEqual(db.upsert_calls, 1)
 
     def test_mark_query_as_read_chunked_makes_progress_with_chunk_size_one(self):
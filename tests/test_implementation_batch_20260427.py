@@ -8,7 +8,7 @@ from unittest import mock
 import core.backup as backup_module
 from core.backup import apply_pending_restore_if_any
 from core.config_store import default_config, load_config_file, save_config_file_atomic
-from core.database import DatabaseManager, DatabaseWriteError
+from core.database import DatabaseManager, DatabaseWriteError, news_row_as_dict
 from core.workers import ApiWorker, DBQueryScope, JobCancelledError
 from ui._main_window_settings_io import export_scope_to_csv
 from ui.news_tab import NewsTab
@@ -215,7 +215,7 @@ class _CaptureDb(_FakeDb):
         self.items = []
 
     def upsert_news(self, items, *_args, **_kwargs):
-        self.items = list(items)
+        self.items = [news_row_as_dict(item) for item in items]
         return len(self.items), 0
 
 
@@ -234,10 +234,10 @@ class TestImplementationBatchStability(unittest.TestCase):
         errors = []
         worker.error.connect(lambda msg: errors.append(msg))
 
-        with mock.patch("core.workers.time.sleep") as sleep_mock:
+        with mock.patch.object(worker._cancel_event, "wait", return_value=False) as wait_mock:
             worker.run()
 
-        self.assertEqual(sleep_mock.call_count, 0)
+        wait_mock.assert_not_called()
         self.assertEqual(len(errors), 1)
         self.assertEqual(worker.last_error_meta["kind"], "rate_limit")
         self.assertEqual(worker.last_error_meta["cooldown_seconds"], 45)
@@ -8,6 +8,7 @@ from core.content_filters import normalize_publisher_filter_lists
 from core.database import DatabaseManager
 from core.query_parser import build_fetch_key
 from core.workers import DBQueryScope
+from tests._source_cache import line_positions, read_source
 from ui.main_window import MainApp
 from ui.news_tab import NewsTab
 
@@ -150,12 +151,12 @@ class _DummyFilterTab:
 
 class TestImplementationPlanUiGuards(unittest.TestCase):
     def test_pending_restore_runs_after_single_instance_guard_before_main_window(self):
-        src = Path("core/bootstrap.py").read_text(encoding="utf-8")
-        single_guard_idx = src.index("if not instance_lock.tryLock(0):")
-        restore_idx = src.index("if apply_pending_restore_if_any(")
-        main_window_idx = src.index("window = MainApp(runtime_paths=RUNTIME_PATHS)")
-        self.assertLess(single_guard_idx, restore_idx)
-        self.assertLess(restore_idx, main_window_idx)
+        single_guard = "if not instance_lock.tryLock(0):"
+        restore = "if apply_pending_restore_if_any("
+        main_window = "window = MainApp(runtime_paths=RUNTIME_PATHS)"
+        positions = line_positions(read_source("core/bootstrap.py"), single_guard, restore, main_window)
+        self.assertLess(positions[single_guard], positions[restore])
+        self.assertLess(positions[restore], positions[main_window])
 
     def test_tag_filter_scope_change_triggers_reload_even_when_text_is_unchanged(self):
         dummy = _DummyFilterTab()
@@ -5,22 +5,26 @@ from pathlib import Path
 
 from core.config_store import load_config_file, normalize_import_settings
 
+_KEYWORDS_15 = tuple(f"k{i}" for i in range(15))
+
 
 class TestImportSettingsNormalization(unittest.TestCase):
+    # normalize_import_settings only reads the fallback, so tests can share one instance.
+    FALLBACK = {
+        "theme_index": 0,
+        "refresh_interval_index": 2,
+        "auto_backup_minutes": 30,
+        "notification_enabled": True,
+        "alert_keywords": ["기존"],
+        "sound_enabled": True,
+        "minimize_to_tray": True,
+        "close_to_tray": True,
+        "start_minimized": False,
+        "notify_on_refresh": False,
+        "api_timeout": 15,
+    }
+
     def test_normalize_import_settings_coerces_types_and_ranges(self):
-        fallback = {
-            "theme_index": 0,
-            "refresh_interval_index": 2,
-            "auto_backup_minutes": 30,
-            "notification_enabled": True,
-            "alert_keywords": ["기존"],
-            "sound_enabled": True,
-            "minimize_to_tray": True,
-            "close_to_tray": True,
-            "start_minimized": False,
-            "notify_on_refresh": False,
-            "api_timeout": 15,
-        }
         raw = {
             "theme_index": "9",
             "refresh_interval_index": "abc",
@@ -35,27 +39,32 @@ class TestImportSettingsNormalization(unittest.TestCase):
             "api_timeout": "999",
         }
 
-        normalized, warnings = normalize_import_settings(raw, fallback)
+        normalized, warnings = normalize_import_settings(raw, self.FALLBACK)
 
-        self.assertEqual(normalized["theme_index"], 2)
-        self.assertEqual(normalized["refresh_interval_index"], 2)
-        self.assertEqual(normalized["auto_backup_minutes"], 60)
-        self.assertEqual(normalized["notification_enabled"], False)
-        self.assertEqual(normalized["alert_keywords"], ["AI", "경제", "100", "증시"])
-        self.assertEqual(normalized["sound_enabled"], False)
-        self.assertEqual(normalized["minimize_to_tray"], True)
-        self.assertEqual(normalized["close_to_tray"], True)
-        self.assertEqual(normalized["start_minimized"], True)
-        self.assertEqual(normalized["notify_on_refresh"], False)
-        self.assertEqual(normalized["api_timeout"], 60)
+        expected = {
+            "theme_index": 2,
+            "refresh_interval_index": 2,
+            "auto_backup_minutes": 60,
+            "notification_enabled": False,
+            "alert_keywords": ["AI", "경제", "100", "증시"],
+            "sound_enabled": False,
+            "minimize_to_tray": True,
+            "close_to_tray": True,
+            "start_minimized": True,
+            "notify_on_refresh": False,
+            "api_timeout": 60,
+        }
+        self.assertEqual({key: normalized[key] for key in expected}, expected)
 
         self.assertGreaterEqual(len(warnings), 1)
-        self.assertTrue(any("api_timeout" in warning for warning in warnings))
-        self.assertTrue(any("auto_backup_minutes" in warning for warning in warnings))
-        self.assertTrue(any("alert_keywords" in warning for warning in warnings))
+        all_warnings = "\0".join(warnings)
+        self.assertIn("api_timeout", all_warnings)
+        self.assertIn("auto_backup_minutes", all_warnings)
+        self.assertIn("alert_keywords", all_warnings)
 
     def test_normalize_import_settings_handles_invalid_settings_payload(self):
         fallback = {
+            **self.FALLBACK,
             "theme_index": 1,
             "refresh_interval_index": 4,
             "notification_enabled": False,
@@ -69,27 +78,13 @@ class TestImportSettingsNormalization(unittest.TestCase):
         }
 
         normalized, warnings = normalize_import_settings("invalid", fallback)
-        self.assertEqual(normalized["theme_index"], 1)
-        self.assertEqual(normalized["refresh_interval_index"], 4)
-        self.assertEqual(normalized["api_timeout"], 20)
-        self.assertEqual(normalized["alert_keywords"], ["A"])
+        self.assertEqual({key: normalized[key] for key in fallback}, fallback)
         self.assertEqual(len(warnings), 1)
         self.assertIn("settings 형식", warnings[0])
 
     def test_alert_keywords_is_limited_to_ten(self):
-        fallback = {
-            "theme_index": 0,
-            "refresh_interval_index": 2,
-            "notification_enabled": True,
-            "alert_keywords": [],
-            "sound_enabled": True,
-            "minimize_to_tray": True,
-            "close_to_tray": True,
-            "start_minimized": False,
-            "notify_on_refresh": False,
-            "api_timeout": 15,
-        }
-        raw = {"alert_keywords": [f"k{i}" for i in range(15)]}
+        fallback = {**self.FALLBACK, "alert_keywords": []}
+        raw = {"alert_keywords": list(_KEYWORDS_15)}
 
         normalized, warnings = normalize_import_settings(raw, fallback)
         self.assertEqual(len(normalized["alert_keywords"]), 10)
@@ -1,4 +1,5 @@
 import json
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -8,55 +9,101 @@ from core.keyword_groups import KeywordGroupManager
 
 
 class TestKeywordGroupStorage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(root.cleanup)
+        cls._root = Path(root.name)
+        cls._template = cls._root / "template.json"
+        save_config_file_atomic(str(cls._template), default_config())
+
+    def setUp(self):
+        td = Path(tempfile.mkdtemp(dir=self._root))
+        self.addCleanup(shutil.rmtree, td, ignore_errors=True)
+        self.td = td
+        self.cfg = td / "config.json"
+        shutil.copyfile(self._template, self.cfg)
+
     def test_groups_are_saved_inside_config_file(self):
-        with tempfile.TemporaryDirectory() as td:
-            cfg = Path(td) / "config.json"
-            save_config_file_atomic(str(cfg), default_config())
+        mgr = KeywordGroupManager(config_file=str(self.cfg), legacy_file=str(self.td / "legacy_groups.json"))
+        self.assertTrue(mgr.create_group("시장"))
+        self.assertTrue(mgr.add_keyword_to_group("시장", "AI"))
+
+        loaded = load_config_file(str(self.cfg))
+        self.assertEqual(loaded["keyword_groups"].get("시장"), ["AI"])
+
+    def test_get_keyword_group_tracks_group_replacements(self):
+        mgr = KeywordGroupManager(config_file=str(self.cfg), legacy_file=str(self.td / "legacy_groups.json"))
+        mgr.groups = {"시장": ["AI", "경제"], "기술": ["AI", "클라우드"]}
+        self.assertEqual(mgr.get_keyword_group("AI"), "시장")
+        self.assertIsNone(mgr.get_keyword_group("반도체"))
+
+        self.assertTrue(mgr.add_keyword_to_group("기술", "반도체"))
+        self.assertEqual(mgr.get_keyword_group("반도체"), "기술")
+        self.assertFalse(mgr.add_keyword_to_group("기술", "반도체"))
+        self.assertEqual(mgr.last_error, "duplicate_keyword")
 
-            mgr = KeywordGroupManager(config_file=str(cfg), legacy_file=str(Path(td) / "legacy_groups.json"))
-            self.assertTrue(mgr.create_group("시장"))
-            self.assertTrue(mgr.add_keyword_to_group("시장", "AI"))
+        self.assertTrue(mgr.remove_keyword_from_group("시장", "AI"))
+        self.assertEqual(mgr.get_keyword_group("AI"), "기술")
 
-            loaded = load_config_file(str(cfg))
-            self.assertEqual(loaded["keyword_groups"].get("시장"), ["AI"])
+    def test_group_saves_keep_settings_written_by_other_writers(self):
+        mgr = KeywordGroupManager(config_file=str(self.cfg), legacy_file=str(self.td / "legacy_groups.json"))
+        self.assertTrue(mgr.create_group("시장"))
+
+        external = load_config_file(str(self.cfg))
+        external["app_settings"]["api_timeout"] = 27
+        save_config_file_atomic(str(self.cfg), external)
+
+        self.assertTrue(mgr.add_keyword_to_group("시장", "AI"))
+        loaded = load_config_file(str(self.cfg))
+        self.assertEqual(loaded["keyword_groups"], {"시장": ["AI"]})
+        self.assertEqual(loaded["app_settings"]["api_timeout"], 27)
+
+    def test_reordering_groups_is_persisted(self):
+        mgr = KeywordGroupManager(config_file=str(self.cfg), legacy_file=str(self.td / "legacy_groups.json"))
+        self.assertTrue(mgr.replace_groups({"시장": ["AI"], "기술": ["클라우드"]}))
+        self.assertTrue(mgr.replace_groups({"기술": ["클라우드"], "시장": ["AI"]}))
+
+        loaded = load_config_file(str(self.cfg))
+        self.assertEqual(list(loaded["keyword_groups"]), ["기술", "시장"])
 
     def test_legacy_group_file_migrates_to_config(self):
-        with tempfile.TemporaryDirectory() as td:
-            cfg = Path(td) / "config.json"
-            legacy = Path(td) / "keyword_groups.json"
-            save_config_file_atomic(str(cfg), default_config())
-            legacy.write_text(
-                json.dumps({"legacy_group": ["경제", "증시"]}, ensure_ascii=False),
-                encoding="utf-8",
-            )
+        legacy = self.td / "keyword_groups.json"
+        legacy.write_bytes('{"legacy_group": ["경제", "증시"]}'.encode("utf-8"))
 
-            mgr = KeywordGroupManager(config_file=str(cfg), legacy_file=str(legacy))
-            self.assertEqual(mgr.groups.get("legacy_group"), ["경제", "증시"])
+        mgr = KeywordGroupManager(config_file=str(self.cfg), legacy_file=str(legacy))
+        self.assertEqual(mgr.groups.get("legacy_group"), ["경제", "증시"])
 
-            loaded = load_config_file(str(cfg))
-            self.assertEqual(loaded["keyword_groups"].get("legacy_group"), ["경제", "증시"])
+        loaded = load_config_file(str(self.cfg))
+        self.assertEqual(loaded["keyword_groups"].get("legacy_group"), ["경제", "증시"])
 
     def test_merge_groups_preserves_existing_order_and_appends_new(self):
-        with tempfile.TemporaryDirectory() as td:
-            cfg = Path(td) / "config.json"
-            save_config_file_atomic(str(cfg), default_config())
+        mgr = KeywordGroupManager(config_file=str(self.cfg), legacy_file=str(self.td / "legacy_groups.json"))
+        mgr.groups = {"시장": ["AI", "경제"], "기술": ["클라우드"]}
+        mgr.save_groups()
+
+        merged = mgr.merge_groups(
+            {
+                "시장": ["경제", "증시", "AI"],
+                "신규": ["반도체", "AI"],
+            },
+            save=True,
+        )
 
-            mgr = KeywordGroupManager(config_file=str(cfg), legacy_file=str(Path(td) / "legacy_groups.json"))
-            mgr.groups = {"시장": ["AI", "경제"], "기술": ["클라우드"]}
-            mgr.save_groups()
+        self.assertEqual(merged["시장"], ["AI", "경제", "증시"])
+        self.assertEqual(merged["기술"], ["클라우드"])
+        self.assertEqual(merged["신규"], ["반도체", "AI"])
 
-            merged = mgr.merge_groups(
-                {
-                    "시장": ["경제", "증시", "AI"],
-                    "신규": ["반도체", "AI"],
-                },
-                save=True,
-            )
+        loaded = load_config_file(str(self.cfg))
+        self.assertEqual(loaded["keyword_groups"]["시장"], ["AI", "경제", "증시"])
 
-            self.assertEqual(merged["시장"], ["AI", "경제", "증시"])
-            self.assertEqual(merged["기술"], ["클라우드"])
-            self.assertEqual(merged["신규"], ["반도체", "AI"])
+    def test_schema_marked_config_still_normalizes_hand_edited_groups(self):
+        raw = json.loads(self.cfg.read_text(encoding="utf-8"))
+        self.assertEqual(raw.get("__schema_rev__"), 1)
 
-            loaded = load_config_file(str(cfg))
-            self.assertEqual(loaded["keyword_groups"]["시장"], ["AI", "경제", "증시"])
+        raw["keyword_groups"] = {" 시장 ": ["AI", " AI", ""], "기술": ["클라우드"]}
+        self.cfg.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
 
+        loaded = load_config_file(str(self.cfg))
+        self.assertEqual(loaded["keyword_groups"], {"시장": ["AI"], "기술": ["클라우드"]})
+        self.assertNotIn("__schema_rev__", loaded)
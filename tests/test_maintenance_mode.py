@@ -48,7 +48,7 @@ class _DummyRegistry:
     def __init__(self, handles):
         self._handles = list(handles)
 
-    def all_handles(self):
+    def all_handles(self, snapshot=False):
         return list(self._handles)
 
 
@@ -0,0 +1,65 @@
+import unittest
+from unittest import mock
+
+from core import text_utils
+
+
+class TestPerfTimerBuffer(unittest.TestCase):
+    def setUp(self):
+        text_utils._PERF_BUFFER.clear()
+        info_enabled = mock.patch.object(text_utils.logger, "isEnabledFor", return_value=True)
+        info_enabled.start()
+        self.addCleanup(info_enabled.stop)
+
+    def test_spans_below_threshold_are_dropped(self):
+        with mock.patch.object(text_utils, "_ensure_perf_flusher"):
+            with text_utils.perf_timer("fast", min_ms=10_000.0):
+                pass
+            with text_utils.perf_timer("kept", "kw=AI", min_ms=0.0):
+                pass
+
+        self.assertEqual(len(text_utils._PERF_BUFFER), 1)
+        self.assertTrue(text_utils._PERF_BUFFER[0].startswith("PERF|kept|"))
+        self.assertTrue(text_utils._PERF_BUFFER[0].endswith("|kw=AI"))
+
+    def test_meta_args_are_formatted_only_when_recorded(self):
+        class _Meta:
+            calls = 0
+
+            def __str__(self):
+                _Meta.calls += 1
+                return "AI"
+
+        with mock.patch.object(text_utils, "_ensure_perf_flusher"):
+            with text_utils.perf_timer("fast", "kw=%s", _Meta(), min_ms=10_000.0):
+                pass
+            self.assertEqual(_Meta.calls, 0)
+
+            with text_utils.perf_timer("kept", "kw=%s|rows=%d", _Meta(), 3, min_ms=0.0):
+                pass
+
+        self.assertEqual(_Meta.calls, 1)
+        self.assertTrue(text_utils._PERF_BUFFER[0].endswith("|kw=AI|rows=3"))
+
+    def test_timer_is_skipped_when_info_logging_is_disabled(self):
+        with mock.patch.object(text_utils.logger, "isEnabledFor", return_value=False):
+            with text_utils.perf_timer("quiet", min_ms=0.0):
+                pass
+
+        self.assertEqual(len(text_utils._PERF_BUFFER), 0)
+
+    def test_flush_emits_each_buffered_entry_as_its_own_record(self):
+        text_utils._PERF_BUFFER.extend(["PERF|a|1.00ms|", "PERF|b|2.00ms|"])
+
+        with self.assertLogs(text_utils.logger, level="INFO") as captured:
+            text_utils.flush_perf_buffer()
+
+        self.assertEqual(
+            [record.getMessage() for record in captured.records],
+            ["PERF|a|1.00ms|", "PERF|b|2.00ms|"],
+        )
+        self.assertEqual(len(text_utils._PERF_BUFFER), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,21 @@
+import contextlib
 import inspect
 import json
+import re
 import tempfile
 import unittest
 from pathlib import Path
+from typing import cast
 from unittest import mock
 
 import config_store
+from core.config_store import AppConfig
 from query_parser import build_fetch_key
 from ui.main_window import MainApp
 from ui.news_tab import NewsTab
+from tests._source_cache import line_positions, read_source
+
+_HASATTR_SELF_RE = re.compile(r'hasattr\(self,\s*"(\w+)"\)')
 
 
 class TestConfigStore(unittest.TestCase):
@@ -35,14 +42,49 @@ class TestConfigStore(unittest.TestCase):
             self.assertEqual(loaded['pagination_totals'], {'ai|': 321})
             self.assertEqual(loaded['keyword_groups'], {'시장': ['AI', '경제']})
 
+    def test_normalize_loaded_config_cache_returns_isolated_copies(self):
+        raw = {'app_settings': {'api_timeout': 22}, 'keyword_groups': {' 시장 ': ['AI', 'AI ']}}
+
+        first = config_store.normalize_loaded_config(raw)
+        first['keyword_groups']['시장'].append('mutated')
+        first['app_settings']['api_timeout'] = 5
+        second = config_store.normalize_loaded_config(raw)
+
+        self.assertEqual(second['keyword_groups'], {'시장': ['AI']})
+        self.assertEqual(second['app_settings']['api_timeout'], 22)
+
+    def test_config_roundtrip_with_and_without_orjson(self):
+        with tempfile.TemporaryDirectory() as td:
+            cfg_path = Path(td) / 'config.json'
+            payload = config_store.default_config()
+            payload['keyword_groups'] = {'시장': ['AI', '경제']}
+
+            for use_orjson in (True, False):
+                with self.subTest(use_orjson=use_orjson):
+                    patcher = contextlib.nullcontext() if use_orjson else mock.patch('core.config_store_support.io._ORJSON', None)
+                    with patcher:
+                        config_store.save_config_file_atomic(str(cfg_path), payload)
+                        loaded = config_store.load_config_file(str(cfg_path))
+                    self.assertEqual(loaded['keyword_groups'], {'시장': ['AI', '경제']})
+                    self.assertTrue(cfg_path.read_bytes().endswith(b'\n'))
+
+    def test_load_config_accepts_utf8_bom(self):
+        with tempfile.TemporaryDirectory() as td:
+            cfg_path = Path(td) / 'config.json'
+            cfg_path.write_bytes(b'\xef\xbb\xbf' + json.dumps({'search_history': ['AI']}).encode('utf-8'))
+
+            loaded = config_store.load_config_file(str(cfg_path))
+
+            self.assertEqual(loaded['search_history'], ['AI'])
+
     def test_atomic_save_failure_does_not_corrupt_existing_file(self):
         with tempfile.TemporaryDirectory() as td:
             cfg_path = Path(td) / 'config.json'
-            cfg_path.write_text(json.dumps({'stable': True}), encoding='utf-8')
+            cfg_path.write_bytes(b'{"stable": true}')
 
             with self.assertRaises(OSError):
                 with mock.patch('config_store.os.replace', side_effect=OSError('replace failed')):
-                    config_store.save_config_file_atomic(str(cfg_path), config_store.default_config())
+                    config_store.save_config_file_atomic(str(cfg_path), cast(AppConfig, {'x': 1}))
 
             data = json.loads(cfg_path.read_text(encoding='utf-8'))
             self.assertEqual(data, {'stable': True})
@@ -50,12 +92,17 @@ class TestConfigStore(unittest.TestCase):
 
 class TestPlanSourceGuards(unittest.TestCase):
     def _read(self, path: str) -> str:
-        return Path(path).read_text(encoding='utf-8')
+        return read_source(path)
 
     def test_build_fetch_key_separates_queries_with_same_keyword(self):
-        k1 = build_fetch_key('AI', ['광고'])
-        k2 = build_fetch_key('AI', ['코인'])
-        self.assertNotEqual(k1, k2)
+        cases = (
+            (('AI', ['광고']), ('AI', ['코인'])),
+            (('AI', []), ('AI', ['코인'])),
+            (('AI', ['광고', '코인']), ('AI', ['광고'])),
+        )
+        for first, second in cases:
+            with self.subTest(first=first, second=second):
+                self.assertNotEqual(build_fetch_key(*first), build_fetch_key(*second))
 
     def test_main_starts_with_pending_restore_apply(self):
         src = self._read('core/bootstrap.py')
@@ -70,9 +117,9 @@ class TestPlanSourceGuards(unittest.TestCase):
         self.assertNotIn('self.auto_backup.restore_backup(', block)
 
     def test_thread_terminate_removed(self):
-        for path in ['ui/main_window.py', 'ui/news_tab.py', 'core/workers.py']:
-            src = self._read(path)
-            self.assertNotIn('thread.terminate()', src)
+        for path in ('ui/main_window.py', 'ui/news_tab.py', 'core/workers.py'):
+            with self.subTest(path=path):
+                self.assertNotIn('thread.terminate()', self._read(path))
 
     def test_date_toggle_calls_reload_immediately(self):
         block = inspect.getsource(NewsTab._toggle_date_filter)
@@ -81,15 +128,15 @@ class TestPlanSourceGuards(unittest.TestCase):
 
     def test_date_style_call_order_in_setup_ui(self):
         block = inspect.getsource(NewsTab.setup_ui)
-        date_start_idx = block.index('self.date_start = QDateEdit()')
-        style_call_idx = block.index('self._update_date_toggle_style(False)')
-        self.assertGreater(style_call_idx, date_start_idx)
+        date_start = 'self.date_start = QDateEdit()'
+        style_call = 'self._update_date_toggle_style(False)'
+        positions = line_positions(block, date_start, style_call)
+        self.assertGreater(positions[style_call], positions[date_start])
 
     def test_update_date_toggle_style_has_init_guard(self):
         block = inspect.getsource(NewsTab._update_date_toggle_style)
-        self.assertIn('hasattr(self, "date_start")', block)
-        self.assertIn('hasattr(self, "date_end")', block)
-        self.assertIn('hasattr(self, "lbl_tilde")', block)
+        guarded = set(_HASATTR_SELF_RE.findall(block))
+        self.assertLessEqual({'date_start', 'date_end', 'lbl_tilde'}, guarded)
 
     def test_fetch_dedupe_uses_build_fetch_key(self):
         block = inspect.getsource(MainApp.fetch_news)
@@ -1,11 +1,13 @@
 import unittest
 
 import os
+import threading
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
-from core.workers import connect_qthread_finished, delete_qthread_when_finished
+from core.workers import AsyncJobWorker, connect_qthread_finished, delete_qthread_when_finished
+from core.workers_support.jobs import ASYNC_JOB_POOL_MAX_THREADS, PooledWorker, _async_job_pool
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
@@ -53,6 +55,46 @@ class TestQThreadLifetime(unittest.TestCase):
         self.app.processEvents()
         self.assertEqual(worker.delete_later_calls, 1)
 
+    def test_async_job_worker_runs_on_shared_thread_pool(self):
+        results: list[object] = []
+        worker = AsyncJobWorker(lambda value: threading.current_thread().name + value, "-done")
+        worker.finished.connect(results.append)
+
+        self.assertFalse(worker.isRunning())
+        worker.start()
+        self.assertTrue(worker.wait(2000))
+        self.app.processEvents()
+
+        self.assertFalse(worker.isRunning())
+        self.assertEqual(len(results), 1)
+        self.assertNotEqual(results[0], threading.current_thread().name + "-done")
+        self.assertEqual(_async_job_pool().maxThreadCount(), ASYNC_JOB_POOL_MAX_THREADS)
+        self.assertIsNot(_async_job_pool(), QThreadPool.globalInstance())
+
+    def test_async_job_worker_skips_result_after_interruption(self):
+        results: list[object] = []
+        worker = AsyncJobWorker(lambda: "ignored")
+        worker.finished.connect(results.append)
+        worker.requestInterruption()
+
+        worker.start()
+        self.assertTrue(worker.wait(2000))
+        self.app.processEvents()
+
+        self.assertEqual(results, [])
+
+    def test_pooled_worker_base_run_settles_without_work(self):
+        settled: list[bool] = []
+        worker = PooledWorker()
+        worker.settled.connect(lambda: settled.append(True))
+
+        worker.start()
+        self.assertTrue(worker.wait(2000))
+        self.app.processEvents()
+
+        self.assertEqual(settled, [True])
+        self.assertFalse(worker.isRunning())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from core.query_parser import parse_search_query, parse_tab_query
+from core.query_parser import build_fetch_key, parse_search_query, parse_tab_query
 
 
 class TestQueryParserSearchPolicy(unittest.TestCase):
@@ -21,3 +21,15 @@ class TestQueryParserSearchPolicy(unittest.TestCase):
         self.assertEqual(db_keyword, "인공지능")
         self.assertEqual(excludes, ["광고", "코인"])
 
+    def test_parsed_excludes_are_isolated_from_cached_results(self):
+        _, first = parse_tab_query("AI -광고 -")
+        first.append("mutated")
+        _, second = parse_tab_query("AI -광고 -")
+        self.assertEqual(second, ["광고"])
+        self.assertEqual(parse_search_query("AI -광고 -"), ("AI", ["광고"]))
+
+    def test_build_fetch_key_normalizes_list_and_tuple_excludes_alike(self):
+        expected = "ai|광고|코인"
+        self.assertEqual(build_fetch_key(" AI ", ["코인", " 광고", "", "광고"]), expected)
+        self.assertEqual(build_fetch_key("ai", ("광고", "코인")), expected)
+        self.assertEqual(build_fetch_key("", []), "|")
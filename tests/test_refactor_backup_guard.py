@@ -1,3 +1,5 @@
+import hashlib
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -5,6 +7,11 @@ from pathlib import Path
 from core.backup_guard import run_pre_refactor_backup, verify_backup
 
 
+def _sha256(path: Path) -> str:
+    with path.open('rb') as fh:
+        return hashlib.file_digest(fh, 'sha256').hexdigest()
+
+
 class TestRefactorBackupGuard(unittest.TestCase):
     def test_backup_generates_manifest_and_hashes(self):
         with tempfile.TemporaryDirectory() as td:
@@ -15,9 +22,16 @@ class TestRefactorBackupGuard(unittest.TestCase):
             (src / 'b.bin').write_bytes(b'abc123')
 
             backup_path = Path(run_pre_refactor_backup(str(src), str(dst_parent), prefix='test_backup_'))
-            self.assertTrue(backup_path.exists())
-            self.assertTrue((backup_path / 'backup_manifest.txt').exists())
-            self.assertTrue((backup_path / 'backup_hashes.sha256').exists())
+            self.assertTrue(backup_path.is_dir())
+            names = {entry.name for entry in os.scandir(backup_path)}
+            self.assertIn('backup_manifest.txt', names)
+            self.assertIn('backup_hashes.sha256', names)
+
+            hash_lines = (backup_path / 'backup_hashes.sha256').read_text(encoding='utf-8').splitlines()
+            recorded = {rel: digest for digest, rel in (line.split(' *', 1) for line in hash_lines)}
+            self.assertEqual(set(recorded), {'a.txt', 'b.bin'})
+            for rel, digest in recorded.items():
+                self.assertEqual(digest, _sha256(backup_path / rel))
 
     def test_verify_backup_detects_mismatch(self):
         with tempfile.TemporaryDirectory() as td:
@@ -3,6 +3,19 @@ import unittest
 
 import news_scraper_pro as app
 
+_WRAPPER_MODULES = [
+    importlib.import_module(mod_name)
+    for mod_name in (
+        'query_parser',
+        'config_store',
+        'backup_manager',
+        'worker_registry',
+        'workers',
+        'database_manager',
+        'styles',
+    )
+]
+_CORE_DB = importlib.import_module('core.database')
 
 class TestRefactorCompat(unittest.TestCase):
     def test_public_exports_available(self):
@@ -20,17 +33,7 @@ class TestRefactorCompat(unittest.TestCase):
             self.assertTrue(hasattr(app, name), name)
 
     def test_wrapper_modules_import(self):
-        modules = [
-            'query_parser',
-            'config_store',
-            'backup_manager',
-            'worker_registry',
-            'workers',
-            'database_manager',
-            'styles',
-        ]
-        for mod_name in modules:
-            mod = importlib.import_module(mod_name)
+        for mod in _WRAPPER_MODULES:
             self.assertIsNotNone(mod)
 
     def test_support_packages_import(self):
@@ -49,9 +52,8 @@ class TestRefactorCompat(unittest.TestCase):
             self.assertIsNotNone(mod)
 
     def test_database_manager_wrapper_points_to_core(self):
-        core_db = importlib.import_module('core.database')
         wrapper = importlib.import_module('database_manager')
-        self.assertIs(wrapper.DatabaseManager, core_db.DatabaseManager)
+        self.assertIs(wrapper.DatabaseManager, _CORE_DB.DatabaseManager)
 
     def test_public_all_exports_are_unique(self):
         modules = [
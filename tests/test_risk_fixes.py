@@ -1,11 +1,11 @@
 import inspect
 import unittest
-from pathlib import Path
 
 from core.query_parser import has_positive_keyword
 from ui.main_window import MainApp, TabFetchState
 from ui._main_window_settings_io import _MainWindowSettingsIOMixin
 from ui.news_tab import NewsTab
+from tests._source_cache import line_positions, read_source
 
 
 class TestKeywordValidation(unittest.TestCase):
@@ -110,7 +110,7 @@ class TestMainWindowRiskFixes(unittest.TestCase):
         self.assertIn("if self.sound_enabled:", block)
 
     def test_tray_notification_falls_back_to_desktop_notification(self):
-        src = Path("ui/_main_window_tray.py").read_text(encoding="utf-8")
+        src = read_source("ui/_main_window_tray.py")
         self.assertIn('fallback = getattr(self, "show_desktop_notification", None)', src)
         self.assertIn("fallback(title, message)", src)
 
@@ -132,22 +132,23 @@ class TestMainWindowRiskFixes(unittest.TestCase):
         block = inspect.getsource(MainApp.rename_tab)
         self.assertIn("self._worker_registry.get_active_request_id(old_keyword)", block)
         self.assertIn("self._ensure_tab_worker_stopped(", block)
-        self.assertLess(
-            block.index("new_keyword = self._normalize_tab_keyword(text)"),
-            block.index("self._worker_registry.get_active_request_id(old_keyword)"),
-        )
+        normalize_call = "new_keyword = self._normalize_tab_keyword(text)"
+        active_lookup = "self._worker_registry.get_active_request_id(old_keyword)"
+        positions = line_positions(block, normalize_call, active_lookup)
+        self.assertLess(positions[normalize_call], positions[active_lookup])
         self.assertIn("self._format_tab_title(new_keyword, unread_count=0)", block)
 
     def test_close_tab_cleans_active_worker_before_widget_cleanup(self):
         block = inspect.getsource(MainApp.close_tab)
         self.assertIn("self._worker_registry.get_active_request_id(removed_keyword)", block)
         self.assertIn("self._ensure_tab_worker_stopped(", block)
-        self.assertLess(block.index("self._ensure_tab_worker_stopped("), block.index("widget.cleanup()"))
+        positions = line_positions(block, "self._ensure_tab_worker_stopped(", "widget.cleanup()")
+        self.assertLess(positions["self._ensure_tab_worker_stopped("], positions["widget.cleanup()"])
 
 
 class TestStyleRiskFixes(unittest.TestCase):
     def test_tab_style_has_min_height_for_emoji_clipping(self):
-        src = Path("ui/styles_support/app_style.py").read_text(encoding="utf-8")
+        src = read_source("ui/styles_support/app_style.py")
         self.assertIn("QTabBar::tab {{", src)
         self.assertIn("min-height: 30px;", src)
 
@@ -1,21 +1,22 @@
 import ast
 import inspect
 import unittest
-from pathlib import Path
 from typing import Any, cast
 
+from tests._source_cache import class_map, func_map
 from ui._settings_dialog_content import _SettingsDialogContentMixin
 from ui.settings_dialog import SettingsDialog
 
 
 class TestSettingsRoundtripContract(unittest.TestCase):
     def test_get_data_contains_sound_api_timeout_and_minimize(self):
-        src = Path("ui/settings_dialog.py").read_text(encoding="utf-8")
-        module = ast.parse(src)
-        cls = next(node for node in module.body if isinstance(node, ast.ClassDef) and node.name == "SettingsDialog")
-        get_data = next(node for node in cls.body if isinstance(node, ast.FunctionDef) and node.name == "get_data")
+        cls = class_map("ui/settings_dialog.py")["SettingsDialog"]
+        get_data = func_map(cls)["get_data"]
 
-        return_node = next(node for node in ast.walk(get_data) if isinstance(node, ast.Return))
+        return_node = next(
+            (node for node in get_data.body if isinstance(node, ast.Return)),
+            None,
+        ) or next(node for node in ast.walk(get_data) if isinstance(node, ast.Return))
         self.assertIsNotNone(return_node.value)
         self.assertIsInstance(return_node.value, ast.Dict)
         assert return_node.value is not None
@@ -81,7 +81,7 @@ class _FakeRegistry:
     def __init__(self, handles):
         self._handles = list(handles)
 
-    def all_handles(self):
+    def all_handles(self, snapshot=False):
         return list(self._handles)
 
 
@@ -220,9 +220,14 @@ class TestShutdownCleanup(unittest.TestCase):
         dummy = _DummyCloseMain()
         event = _FakeEvent()
 
-        dummy._perform_real_close(event)
+        with mock.patch(
+            "ui._main_window_tray.close_shared_sessions",
+            side_effect=lambda: dummy.call_log.append("http.close"),
+        ):
+            dummy._perform_real_close(event)
 
         self.assertEqual(event.accept_calls, 1)
+        self.assertIn("http.close", dummy.call_log)
         self.assertIn("tab.cleanup:AI", dummy.call_log)
         self.assertIn("tab.cleanup:경제", dummy.call_log)
         self.assertIn("cleanup_worker:AI:7:0", dummy.call_log)
@@ -1,7 +1,7 @@
 import unittest
-from pathlib import Path
 
 from core.bootstrap import _resolve_single_instance_conflict
+from tests._source_cache import read_source, source_tokens
 
 
 class _FakeLock:
@@ -23,12 +23,10 @@ class _FakeLock:
 
 class TestSingleInstanceGuard(unittest.TestCase):
     def test_bootstrap_has_single_instance_lock_guard(self):
-        src = Path("core/bootstrap.py").read_text(encoding="utf-8")
-        self.assertIn("QLockFile", src)
-        self.assertIn("QLocalServer", src)
-        self.assertIn("QLocalSocket", src)
-        self.assertIn("INSTANCE_LOCK_FILE", src)
-        self.assertIn("INSTANCE_SERVER_NAME", src)
+        src = read_source("core/bootstrap.py")
+        tokens = source_tokens("core/bootstrap.py")
+        for name in ("QLockFile", "QLocalServer", "QLocalSocket", "INSTANCE_LOCK_FILE", "INSTANCE_SERVER_NAME"):
+            self.assertIn(name, tokens)
         self.assertIn("instance_lock.setStaleLockTime(10000)", src)
         self.assertIn("_resolve_single_instance_conflict(", src)
         self.assertIn("_setup_instance_server(", src)
@@ -6,32 +6,70 @@ import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
+from typing import cast
+from unittest import mock
+
+from requests.adapters import HTTPAdapter
 
 import news_scraper_pro as app
+from core.http_client import NAVER_OPENAPI_ORIGIN, HttpClientConfig, close_shared_sessions
 from ui.main_window import MainApp
 from ui.news_tab import NewsTab
+from tests._source_cache import literal_positions, read_source, top_level_block
 
+_EMPTY_CFG_BYTES = b'{"app_settings": {}}'
+_CFG_X1_BYTES = b'{"app_settings": {"x": 1}}'
+_CFG_X2_BYTES = b'{"app_settings": {"x": 2}}'
 
-class TestParseTabQuery(unittest.TestCase):
-    def test_parse_tab_query_basic(self):
-        self.assertEqual(app.parse_tab_query(''), ('', []))
-        self.assertEqual(app.parse_tab_query('AI'), ('AI', []))
 
-    def test_parse_tab_query_excludes(self):
-        self.assertEqual(app.parse_tab_query('AI -광고 -코인'), ('AI', ['광고', '코인']))
-        self.assertEqual(app.parse_tab_query('AI - 광고'), ('AI', []))
-        self.assertEqual(app.parse_tab_query('-광고 AI'), ('AI', ['광고']))
+def _sidecars(db_path: Path) -> tuple[str, str]:
+    db_str = os.fspath(db_path)
+    return db_str + '-wal', db_str + '-shm'
+
+
+def _write_fake_sidecars(db_path: Path) -> None:
+    for sidecar in _sidecars(db_path):
+        with open(sidecar, 'wb') as fh:
+            fh.write(b'fake')
+
+
+class TestParseTabQuery(unittest.TestCase):
+    def test_parse_tab_query(self):
+        cases = (
+            ('', ('', [])),
+            ('AI', ('AI', [])),
+            ('AI -광고 -코인', ('AI', ['광고', '코인'])),
+            ('AI - 광고', ('AI', [])),
+            ('-광고 AI', ('AI', ['광고'])),
+        )
+        for query, expected in cases:
+            with self.subTest(query=query):
+                self.assertEqual(app.parse_tab_query(query), expected)
 
 
 class TestBackupAndRestore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._db_templates = {value: cls._serialize_db(value) for value in (1, 2)}
+
+    @staticmethod
+    def _serialize_db(value: int) -> bytes:
+        conn = sqlite3.connect(':memory:')
+        try:
+            conn.execute('CREATE TABLE t (v INTEGER)')
+            conn.execute('INSERT INTO t(v) VALUES (?)', (value,))
+            conn.commit()
+            return conn.serialize()
+        finally:
+            conn.close()
+
     def _make_db(self, path: Path, value: int) -> None:
+        path.write_bytes(self._db_templates[value])
+
+    def _enable_wal(self, path: Path) -> None:
         conn = sqlite3.connect(str(path))
         try:
             conn.execute('PRAGMA journal_mode=WAL')
-            conn.execute('CREATE TABLE IF NOT EXISTS t (v INTEGER)')
-            conn.execute('DELETE FROM t')
-            conn.execute('INSERT INTO t(v) VALUES (?)', (value,))
-            conn.commit()
         finally:
             conn.close()
 
@@ -48,11 +86,11 @@ class TestBackupAndRestore(unittest.TestCase):
             d = Path(td)
             cfg = d / 'config.json'
             db = d / 'db.sqlite'
-            cfg.write_text(json.dumps({'app_settings': {}}, ensure_ascii=False), encoding='utf-8')
+            cfg.write_bytes(_EMPTY_CFG_BYTES)
             self._make_db(db, 1)
+            self._enable_wal(db)
 
-            (Path(str(db) + '-wal')).write_text('fake', encoding='utf-8')
-            (Path(str(db) + '-shm')).write_text('fake', encoding='utf-8')
+            _write_fake_sidecars(db)
 
             ab = app.AutoBackup(config_file=str(cfg), db_file=str(db))
             backup_path = ab.create_backup(include_db=True)
@@ -68,19 +106,18 @@ class TestBackupAndRestore(unittest.TestCase):
                 conn.close()
             self.assertEqual(ok, 'ok')
 
-            self.assertFalse(Path(str(backup_db) + '-wal').exists())
-            self.assertFalse(Path(str(backup_db) + '-shm').exists())
+            for sidecar in _sidecars(backup_db):
+                self.assertFalse(os.path.exists(sidecar), sidecar)
 
     def test_backup_fallback_copies_sidecars(self):
         with tempfile.TemporaryDirectory() as td:
             d = Path(td)
             cfg = d / 'config.json'
             db = d / 'db.sqlite'
-            cfg.write_text(json.dumps({'app_settings': {}}, ensure_ascii=False), encoding='utf-8')
+            cfg.write_bytes(_EMPTY_CFG_BYTES)
             self._make_db(db, 1)
 
-            (Path(str(db) + '-wal')).write_text('fake', encoding='utf-8')
-            (Path(str(db) + '-shm')).write_text('fake', encoding='utf-8')
+            _write_fake_sidecars(db)
 
             ab = app.AutoBackup(config_file=str(cfg), db_file=str(db))
             ab._snapshot_db = lambda dst_db_path: False
@@ -91,8 +128,8 @@ class TestBackupAndRestore(unittest.TestCase):
             backup_path_str = backup_path
 
             backup_db = Path(backup_path_str) / db.name
-            self.assertTrue(Path(str(backup_db) + '-wal').exists())
-            self.assertTrue(Path(str(backup_db) + '-shm').exists())
+            for sidecar in _sidecars(backup_db):
+                self.assertTrue(os.path.exists(sidecar), sidecar)
 
     def test_pending_restore_applies_on_startup(self):
         with tempfile.TemporaryDirectory() as td:
@@ -101,26 +138,21 @@ class TestBackupAndRestore(unittest.TestCase):
             db = d / 'db.sqlite'
             pending = d / app.PENDING_RESTORE_FILENAME
 
-            cfg.write_text(json.dumps({'app_settings': {'x': 1}}, ensure_ascii=False), encoding='utf-8')
+            cfg.write_bytes(_CFG_X1_BYTES)
             self._make_db(db, 1)
-            (Path(str(db) + '-wal')).write_text('fake', encoding='utf-8')
-            (Path(str(db) + '-shm')).write_text('fake', encoding='utf-8')
+            _write_fake_sidecars(db)
 
             ab = app.AutoBackup(config_file=str(cfg), db_file=str(db))
 
             backup_name = 'backup_test'
             backup_dir = Path(ab.backup_dir) / backup_name
             backup_dir.mkdir(parents=True, exist_ok=True)
-            (backup_dir / cfg.name).write_text(
-                json.dumps({'app_settings': {'x': 2}}, ensure_ascii=False),
-                encoding='utf-8',
-            )
+            (backup_dir / cfg.name).write_bytes(_CFG_X2_BYTES)
             backup_db = backup_dir / db.name
             self._make_db(backup_db, 2)
-            for suffix in ('-wal', '-shm'):
-                p = Path(str(backup_db) + suffix)
-                if p.exists():
-                    p.unlink()
+            for sidecar in _sidecars(backup_db):
+                if os.path.exists(sidecar):
+                    os.unlink(sidecar)
 
             ok = ab.schedule_restore(backup_name, restore_db=True, pending_file=str(pending))
             self.assertTrue(ok)
@@ -137,8 +169,8 @@ class TestBackupAndRestore(unittest.TestCase):
             cfg_loaded = json.loads(cfg.read_text(encoding='utf-8'))
             self.assertEqual(cfg_loaded['app_settings']['x'], 2)
             self.assertEqual(self._read_db_value(db), 2)
-            self.assertFalse(Path(str(db) + '-wal').exists())
-            self.assertFalse(Path(str(db) + '-shm').exists())
+            for sidecar in _sidecars(db):
+                self.assertFalse(os.path.exists(sidecar), sidecar)
 
     def test_invalid_pending_restore_is_kept_for_retry(self):
         with tempfile.TemporaryDirectory() as td:
@@ -147,7 +179,7 @@ class TestBackupAndRestore(unittest.TestCase):
             db = d / 'db.sqlite'
             pending = d / app.PENDING_RESTORE_FILENAME
 
-            cfg.write_text(json.dumps({'app_settings': {'x': 1}}, ensure_ascii=False), encoding='utf-8')
+            cfg.write_bytes(_CFG_X1_BYTES)
             self._make_db(db, 1)
             pending.write_text(
                 json.dumps(
@@ -205,14 +237,46 @@ class TestPerformanceRegressionGuards(unittest.TestCase):
             self.assertTrue(Path(path).exists(), path)
 
     def test_main_http_client_config_disables_transport_retry(self):
-        src = Path('core/http_client.py').read_text(encoding='utf-8')
+        src = read_source('core/http_client.py')
         self.assertIn('max_retries=max(0, int(self.max_retries))', src)
 
-    def test_fetch_worker_uses_http_client_factory(self):
+    def test_fetch_worker_uses_shared_http_client_session(self):
         block = inspect.getsource(MainApp.fetch_news)
-        self.assertIn('session_factory=self._require_http_client_config().create_session', block)
+        self.assertIn('session=self._require_http_client_config().shared_session()', block)
         self.assertNotIn('session=self.session', block)
 
+    def test_http_client_pool_is_bounded_and_non_blocking(self):
+        config = HttpClientConfig()
+        adapter = cast(HTTPAdapter, config.create_session().get_adapter(NAVER_OPENAPI_ORIGIN))
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        self.assertEqual(pool_kw['maxsize'], config.pool_maxsize)
+        self.assertFalse(pool_kw['block'])
+
+    def test_http_client_preheats_shared_session_once_and_closes_on_shutdown(self):
+        config = HttpClientConfig(user_agent='preheat-test')
+        self.addCleanup(close_shared_sessions)
+        session = config.shared_session()
+
+        with mock.patch.object(session, 'head') as head:
+            thread = config.preheat_shared_session(timeout=1.0)
+            assert thread is not None
+            thread.join(2)
+            self.assertIsNone(config.preheat_shared_session(timeout=1.0))
+        head.assert_called_once_with(NAVER_OPENAPI_ORIGIN, timeout=1.0, allow_redirects=False)
+
+        with mock.patch.object(session, 'close') as close:
+            close_shared_sessions()
+        close.assert_called_once_with()
+        self.assertIsNot(config.shared_session(), session)
+
+    def test_bootstrap_preheats_http_session_only_with_credentials(self):
+        needles = (
+            'if window.client_id and window.http_client_config is not None:',
+            'window.http_client_config.preheat_shared_session()',
+        )
+        found = literal_positions(read_source('core/bootstrap.py'), *needles)
+        self.assertEqual([needle for needle in needles if needle not in found], [])
+
     def test_newstab_has_required_helper_methods(self):
         for required in {
             '_prepare_item',
@@ -226,24 +290,27 @@ class TestPerformanceRegressionGuards(unittest.TestCase):
 
     def test_close_tab_calls_cleanup_before_delete_later(self):
         block = inspect.getsource(MainApp.close_tab)
-        self.assertIn('widget.cleanup()', block)
-        self.assertIn('widget.deleteLater()', block)
-        self.assertLess(block.index('widget.cleanup()'), block.index('widget.deleteLater()'))
+        positions = literal_positions(block, 'widget.cleanup()', 'widget.deleteLater()')
+        self.assertIn('widget.cleanup()', positions)
+        self.assertIn('widget.deleteLater()', positions)
+        self.assertLess(positions['widget.cleanup()'], positions['widget.deleteLater()'])
 
     def test_on_fetch_done_does_not_use_split_index_parsing(self):
         src = inspect.getsource(MainApp.on_fetch_done)
         self.assertNotIn('search_keyword = keyword.split()[0] if keyword.split() else keyword', src)
 
     def test_dbworker_gates_total_count_lookup_for_append(self):
-        src = Path('core/workers_support/db_worker.py').read_text(encoding='utf-8')
-        start = src.index('class DBWorker')
-        block = src[start:]
-        self.assertIn('open_read_connection(timeout=1.5)', block)
-        self.assertIn('if self.include_total:', block)
-        self.assertIn('count_news_states = getattr(self.db, "count_news_states", None)', block)
-        self.assertIn('total_count = int(self.known_total_count or 0)', block)
-        self.assertIn('limit=self.limit', block)
-        self.assertIn('offset=self.offset', block)
+        block = top_level_block('core/workers_support/db_worker.py', 'DBWorker')
+        needles = (
+            'open_read_connection(timeout=1.5)',
+            'if self.include_total:',
+            'count_news_states = getattr(self.db, "count_news_states", None)',
+            'total_count = int(self.known_total_count or 0)',
+            'limit=self.limit',
+            'offset=self.offset',
+        )
+        found = literal_positions(block, *needles)
+        self.assertEqual([needle for needle in needles if needle not in found], [])
 
     def test_render_html_skips_when_signature_unchanged(self):
         src = inspect.getsource(NewsTab._flush_render)
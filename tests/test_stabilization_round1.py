@@ -3,8 +3,10 @@ import csv
 import json
 import sqlite3
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from typing import Optional
 from unittest import mock
 
 from core.backup import AutoBackup
@@ -60,8 +62,8 @@ class _FakeWinreg:
     HKEY_CURRENT_USER = object()
     KEY_READ = 1
 
-    def __init__(self, value):
-        self.value = value
+    def __init__(self, value: Optional[str]):
+        self.value: Optional[str] = value
 
     def OpenKey(self, *_args, **_kwargs):
         return _FakeRegistryKey()
@@ -237,6 +239,22 @@ class TestStartupStatus(unittest.TestCase):
         self.assertFalse(status["is_healthy"])
         self.assertTrue(status["needs_repair"])
 
+    def test_is_startup_enabled_reuses_result_until_invalidated(self):
+        expected_command = '"C:\\Python311\\python.exe" "D:\\app\\news_scraper_pro.py"'
+        fake_winreg = _FakeWinreg(expected_command)
+        StartupManager.invalidate_cache()
+        self.addCleanup(StartupManager.invalidate_cache)
+
+        with mock.patch.object(StartupManager, "is_available", return_value=True):
+            with mock.patch.object(StartupManager, "build_startup_command", return_value=expected_command):
+                with mock.patch("core.startup._get_winreg", return_value=fake_winreg):
+                    with mock.patch("core.startup.os.path.exists", return_value=True):
+                        self.assertTrue(StartupManager.is_startup_enabled())
+                        fake_winreg.value = None
+                        self.assertTrue(StartupManager.is_startup_enabled())
+                        StartupManager.invalidate_cache()
+                        self.assertFalse(StartupManager.is_startup_enabled())
+
 
 class TestConfigDurability(unittest.TestCase):
     def test_save_primary_config_file_rotates_previous_valid_file_to_backup(self):
@@ -305,6 +323,43 @@ class TestDatabaseEmergencyCap(unittest.TestCase):
                 self.assertEqual(len(db._emergency_connections), 0)
                 db.close()
 
+    def test_waiting_get_connection_receives_returned_connection(self):
+        with tempfile.TemporaryDirectory() as td:
+            db_path = Path(td) / "news.db"
+            db = DatabaseManager(str(db_path), max_connections=1, max_emergency_connections=0)
+            pooled = db.get_connection(timeout=0.01)
+            received = []
+            try:
+                waiter = threading.Thread(target=lambda: received.append(db.get_connection(timeout=5.0)))
+                waiter.start()
+                threading.Timer(0.05, db.return_connection, args=(pooled,)).start()
+                waiter.join(timeout=5.0)
+                self.assertEqual(received, [pooled])
+                self.assertEqual(db._emergency_connection_rejections, 0)
+            finally:
+                for conn in received:
+                    db.return_connection(conn)
+                db.close()
+
+    def test_read_pool_connections_are_query_only_and_recycled(self):
+        with tempfile.TemporaryDirectory() as td:
+            db_path = Path(td) / "news.db"
+            db = DatabaseManager(str(db_path), max_connections=2, max_read_connections=1)
+            try:
+                reader = db.get_read_connection(timeout=0.01)
+                try:
+                    with self.assertRaises(sqlite3.OperationalError):
+                        reader.execute("DELETE FROM news")
+                    fallback = db.get_read_connection(timeout=0.01)
+                    self.assertIsNot(fallback, reader)
+                    db.return_connection(fallback)
+                finally:
+                    db.return_connection(reader)
+                self.assertIs(db.get_read_connection(timeout=0.01), reader)
+                db.return_connection(reader)
+            finally:
+                db.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,16 +1,21 @@
 import unittest
 from unittest import mock
-from pathlib import Path
 
 import core.startup as startup
+from tests._source_cache import literal_positions, read_source
+
+_STARTUP_REQUIRED = (
+    'entrypoint_path = os.path.join(APP_DIR, "news_scraper_pro.py")',
+    'command = f\'"{sys.executable}" "{entrypoint_path}"\'',
+)
+_STARTUP_FORBIDDEN = ("os.path.abspath(__file__)",)
 
 
 class TestStartupRegistryCommand(unittest.TestCase):
     def test_source_mode_targets_entrypoint_script(self):
-        src = Path("core/startup.py").read_text(encoding="utf-8")
-        self.assertIn('entrypoint_path = os.path.join(APP_DIR, "news_scraper_pro.py")', src)
-        self.assertIn('command = f\'"{sys.executable}" "{entrypoint_path}"\'', src)
-        self.assertNotIn("os.path.abspath(__file__)", src)
+        found = literal_positions(read_source("core/startup.py"), *_STARTUP_REQUIRED, *_STARTUP_FORBIDDEN)
+        self.assertEqual([needle for needle in _STARTUP_REQUIRED if needle not in found], [])
+        self.assertEqual([needle for needle in _STARTUP_FORBIDDEN if needle in found], [])
 
     def test_source_mode_command_supports_minimized_flag(self):
         with mock.patch.object(startup.sys, "frozen", False, create=True):
@@ -3,6 +3,10 @@ import symtable
 import unittest
 from pathlib import Path
 
+from tests._source_cache import read_source
+
+_BUILTIN_NAMES = frozenset(dir(builtins))
+
 
 class TestSymbolResolution(unittest.TestCase):
     def _collect_defs(self, table: symtable.SymbolTable) -> set[str]:
@@ -18,12 +22,14 @@ class TestSymbolResolution(unittest.TestCase):
         return names
 
     def _find_unresolved(self, path: Path) -> set[str]:
-        source = path.read_text(encoding="utf-8")
+        source = read_source(str(path))
         module_table = symtable.symtable(source, str(path), "exec")
-        builtin_names = set(dir(builtins))
         unresolved: set[str] = set()
 
-        def walk(table: symtable.SymbolTable, accessible_defs: set[str]) -> None:
+        # Share enclosing-scope definitions as a chain of sets instead of copying unions per scope.
+        stack: list[tuple[symtable.SymbolTable, tuple[set[str], ...]]] = [(module_table, ())]
+        while stack:
+            table, enclosing_defs = stack.pop()
             local_defs = self._collect_defs(table)
             for symbol in table.get_symbols():
                 name = symbol.get_name()
@@ -33,14 +39,14 @@ class TestSymbolResolution(unittest.TestCase):
                     continue
                 if name.startswith("__"):
                     continue
-                if name in local_defs or name in accessible_defs or name in builtin_names:
+                if name in local_defs or name in _BUILTIN_NAMES:
+                    continue
+                if any(name in defs for defs in enclosing_defs):
                     continue
                 unresolved.add(name)
 
-            for child in table.get_children():
-                walk(child, accessible_defs | local_defs)
-
-        walk(module_table, self._collect_defs(module_table))
+            scope_chain = enclosing_defs + (local_defs,)
+            stack.extend((child, scope_chain) for child in table.get_children())
         return unresolved
 
     def test_ui_and_startup_modules_have_no_unresolved_symbols(self):
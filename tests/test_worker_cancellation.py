@@ -1,3 +1,6 @@
+import json
+import threading
+import time
 import unittest
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
@@ -8,6 +11,7 @@ import requests
 
 from core.database import DatabaseWriteError, NewsUpsertResult
 from core.workers import ApiWorker, _parse_retry_after_seconds
+from core.workers_support.http_policy import _clean_api_text, _response_json
 
 
 class _FakeResponse:
@@ -185,6 +189,17 @@ class TestWorkerCancellation(unittest.TestCase):
         self.assertFalse(closable.close_called)
         self.assertFalse(worker.is_running)
 
+    def test_stop_wakes_pending_backoff_wait(self):
+        worker, _db = self._make_worker(session=None)
+        stopper = threading.Timer(0.05, worker.stop)
+        started = time.monotonic()
+        stopper.start()
+        try:
+            self.assertFalse(worker._sleep_with_cancel(30))
+        finally:
+            stopper.cancel()
+        self.assertLess(time.monotonic() - started, 5)
+
     def test_finished_result_only_exposes_new_items_for_alerts(self):
         payload = {
             "total": 2,
@@ -232,6 +247,49 @@ class TestWorkerCancellation(unittest.TestCase):
         )
         self.assertEqual(finished[0]["new_count"], 1)
 
+    def test_exclude_words_match_title_or_description_but_not_across_them(self):
+        def _item(idx, title, description):
+            return {
+                "title": title,
+                "description": description,
+                "link": f"https://news.naver.com/{idx}",
+                "originallink": f"https://example.com/{idx}",
+                "pubDate": "2026-02-27T10:00:00",
+            }
+
+        payload = {
+            "total": 4,
+            "items": [
+                _item(1, "<b>Coin</b> rally", "desc"),
+                _item(2, "AI update", "crypto COIN news"),
+                _item(3, "AI co", "in depth"),
+                _item(4, "AI chips", "desc"),
+            ],
+        }
+        worker = ApiWorker(
+            client_id="id",
+            client_secret="secret",
+            search_query="AI",
+            db_keyword="AI",
+            exclude_words=["coin"],
+            db_manager=_ExistingLinkDB(set()),
+            start_idx=1,
+            max_retries=1,
+            timeout=1,
+            session=_StaticSession(_FakeResponse(200, payload)),
+        )
+
+        finished = []
+        worker.finished.connect(lambda result: finished.append(result))
+
+        worker.run()
+
+        self.assertEqual(finished[0]["filtered"], 2)
+        self.assertEqual(
+            [item["link"] for item in finished[0]["new_items"]],
+            ["https://news.naver.com/3", "https://news.naver.com/4"],
+        )
+
     def test_detailed_upsert_path_skips_existing_link_prequery(self):
         payload = {
             "total": 3,
@@ -395,6 +453,36 @@ class TestWorkerCancellation(unittest.TestCase):
         self.assertEqual(_parse_retry_after_seconds("7", now=fixed_now), 7)
         self.assertEqual(_parse_retry_after_seconds(retry_at, now=fixed_now), 9)
 
+    def test_clean_api_text_strips_bold_tags_and_decodes_entities(self):
+        self.assertEqual(_clean_api_text("<b>AI</b> &amp; 반도체"), "AI & 반도체")
+        self.assertEqual(_clean_api_text("&lt;b&gt;literal"), "<b>literal")
+        self.assertEqual(_clean_api_text("plain  text"), "plain  text")
+        self.assertEqual(_clean_api_text(None), "")
+
+    def test_response_json_decodes_bytes_and_falls_back_to_response_json(self):
+        class _BytesResponse:
+            def __init__(self, content):
+                self.content = content
+                self.json_calls = 0
+
+            def json(self):
+                self.json_calls += 1
+                return json.loads(self.content)
+
+        body = '{"items": [{"title": "반도체"}]}'.encode("utf-8")
+        self.assertEqual(_response_json(_BytesResponse(body)), {"items": [{"title": "반도체"}]})
+
+        with mock.patch("core.workers_support.http_policy._ORJSON", None):
+            response = _BytesResponse(body)
+            self.assertEqual(_response_json(response), {"items": [{"title": "반도체"}]})
+            self.assertEqual(response.json_calls, 1)
+        self.assertEqual(_response_json(_FakeResponse(200, {"total": 1})), {"total": 1})
+
+    def test_clean_api_text_falls_back_to_unescape_for_other_entities(self):
+        self.assertEqual(_clean_api_text("&#39;AI&apos; &quot;칩&quot;"), "'AI' \"칩\"")
+        self.assertEqual(_clean_api_text("&amp;lt;"), "&lt;")
+        self.assertEqual(_clean_api_text("<b>AT&T</b>&nbsp;5G"), "AT&T\xa05G")
+
     def test_http_429_retry_after_seconds_header_controls_retry_delay(self):
         payload = {
             "total": 1,
@@ -417,12 +505,12 @@ class TestWorkerCancellation(unittest.TestCase):
         worker, db = self._make_worker(session)
         worker.max_retries = 2
 
-        with mock.patch("core.workers.time.sleep") as sleep_mock:
+        with mock.patch.object(worker._cancel_event, "wait", return_value=False) as wait_mock:
             worker.run()
 
         self.assertEqual(session.calls, 2)
         self.assertEqual(db.upsert_calls, 1)
-        self.assertEqual(sleep_mock.call_count, 7)
+        wait_mock.assert_called_once_with(7)
 
     def test_http_429_final_failure_uses_retry_after_http_date_for_cooldown(self):
         retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=6), usegmt=True)
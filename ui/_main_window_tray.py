@@ -12,6 +12,7 @@ from PyQt6.QtGui import QCloseEvent, QIcon
 from PyQt6.QtWidgets import QMenu, QMessageBox, QStyle, QSystemTrayIcon
 
 from core.constants import APP_NAME
+from core.http_client import close_shared_sessions
 from core.workers import InterruptibleReadWorker, delete_qthread_when_finished, retain_worker_until_finished
 
 if TYPE_CHECKING:
@@ -300,7 +301,7 @@ class _MainWindowTrayMixin:
             logger.info("열린 탭 정리 완료")
 
             if hasattr(self, "_worker_registry"):
-                for handle in list(self._worker_registry.all_handles()):
+                for handle in self._worker_registry.all_handles(snapshot=True):
                     try:
                         if not self.cleanup_worker(
                             keyword=handle.tab_keyword,
@@ -370,6 +371,12 @@ class _MainWindowTrayMixin:
             except Exception as e:
                 logger.error(f"설정 저장 오류: {e}")
 
+            if not defer_db_close:
+                try:
+                    close_shared_sessions()
+                except Exception as e:
+                    logger.error(f"HTTP 세션 종료 오류: {e}")
+
             if self.db is not None and defer_db_close:
                 logger.warning("DB close deferred because background workers are still settling")
             elif self.db is not None:
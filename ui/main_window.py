@@ -146,6 +146,7 @@ class MainApp(
             self._pending_refresh_keywords = []
             self._sequential_refresh_active = False
             self._current_refresh_idx = 0
+            self._sequential_inflight_count = 0
             self._total_refresh_count = 0
             self._sequential_new_count = 0
             self._sequential_added_count = 0
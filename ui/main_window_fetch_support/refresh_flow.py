@@ -22,6 +22,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 순차 새로고침 중 동시에 진행할 탭 요청 수 (네이버 API 동시 요청 상한 이내).
+SEQUENTIAL_REFRESH_MAX_INFLIGHT = 3
+
 class _MainWindowRefreshFlowMixin:
     def _current_fetch_cooldown_seconds(self: MainApp) -> int:
         remaining = int(max(0.0, float(getattr(self, "_fetch_cooldown_until", 0.0) or 0.0) - time.time()))
@@ -143,6 +146,7 @@ class _MainWindowRefreshFlowMixin:
         self._pending_refresh_keywords = prepared_keywords
         self._sequential_refresh_active = True
         self._current_refresh_idx = 0
+        self._sequential_inflight_count = 0
         self._total_refresh_count = len(prepared_keywords)
         self._sequential_new_count = 0
         self._sequential_added_count = 0
@@ -291,41 +295,51 @@ class _MainWindowRefreshFlowMixin:
             return True
         return False
     def _process_next_refresh(self: MainApp):
-        """Run the next queued tab refresh."""
+        """Start queued tab refreshes up to SEQUENTIAL_REFRESH_MAX_INFLIGHT at a time."""
         if not self._sequential_refresh_active:
             return
 
         if self._current_refresh_idx >= len(self._pending_refresh_keywords):
-            self._finish_sequential_refresh()
+            if self._sequential_inflight_count <= 0:
+                self._finish_sequential_refresh()
             return
 
         cooldown_seconds = self._current_fetch_cooldown_seconds()
         if cooldown_seconds > 0:
+            if self._sequential_inflight_count > 0:
+                # 진행 중인 요청이 끝나면 다시 호출되므로 타이머를 중복으로 걸지 않는다.
+                return
             self._status_bar().showMessage(
                 f"API 대기 시간으로 순차 새로고침을 {cooldown_seconds}초 후 재개합니다."
             )
             QTimer.singleShot(cooldown_seconds * 1000, self._process_next_refresh)
             return
 
-        keyword = self._pending_refresh_keywords[self._current_refresh_idx]
-        logger.info(
-            "Sequential refresh: [%s/%s] %s",
-            self._current_refresh_idx + 1,
-            self._total_refresh_count,
-            keyword,
-        )
-
-        self.progress.setValue(self._current_refresh_idx)
-        self._status_bar().showMessage(
-            f"'{keyword}' 새로고침 중... ({self._current_refresh_idx + 1}/{self._total_refresh_count})"
-        )
-
-        try:
-            self.fetch_news(keyword, is_sequential=True)
-        except Exception as e:
-            logger.error("Refresh failed for '%s': %s", keyword, e)
+        while (
+            self._sequential_refresh_active
+            and self._current_refresh_idx < len(self._pending_refresh_keywords)
+            and self._sequential_inflight_count < SEQUENTIAL_REFRESH_MAX_INFLIGHT
+        ):
+            keyword = self._pending_refresh_keywords[self._current_refresh_idx]
+            logger.info(
+                "Sequential refresh: [%s/%s] %s",
+                self._current_refresh_idx + 1,
+                self._total_refresh_count,
+                keyword,
+            )
+            self._status_bar().showMessage(
+                f"'{keyword}' 새로고침 중... ({self._current_refresh_idx + 1}/{self._total_refresh_count})"
+            )
             self._current_refresh_idx += 1
-            QTimer.singleShot(500, self._process_next_refresh)
+            self._sequential_inflight_count += 1
+
+            try:
+                self.fetch_news(keyword, is_sequential=True)
+            except Exception as e:
+                logger.error("Refresh failed for '%s': %s", keyword, e)
+                self._sequential_inflight_count = max(0, self._sequential_inflight_count - 1)
+                QTimer.singleShot(500, self._process_next_refresh)
+                return
     def _build_fetch_summary_message(
         self: MainApp,
         keyword: str,
@@ -375,7 +389,8 @@ class _MainWindowRefreshFlowMixin:
         if not self._sequential_refresh_active:
             return
 
-        self._current_refresh_idx += 1
+        self._sequential_inflight_count = max(0, self._sequential_inflight_count - 1)
+        self.progress.setValue(self._current_refresh_idx - self._sequential_inflight_count)
         QTimer.singleShot(300, self._process_next_refresh)
     def _finish_sequential_refresh(self: MainApp):
         """Reset sequential refresh state and surface the result."""
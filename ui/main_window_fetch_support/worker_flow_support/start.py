@@ -161,7 +161,7 @@ class _FetchWorkerStartMixin:
             query_key=query_key,
             start_idx=start_idx,
             timeout=self.api_timeout,
-            session_factory=self._require_http_client_config().create_session,
+            session=self._require_http_client_config().shared_session(),
             display_keyword=keyword,
         )
         thread = QThread()
@@ -333,6 +333,23 @@ def import_bookmarks_notes_from_csv(
     missing_rows = 0
     truncated_notes = 0
     safe_chunk_size = max(1, int(chunk_size or 200))
+    # Each chunk's bookmark/note updates share one write transaction.
+    pending_updates: List[Tuple[str, str, Any]] = []
+    pending_rows: List[List[int]] = []
+
+    def _flush_pending() -> None:
+        nonlocal updated_rows, missing_rows
+        if not pending_rows:
+            return
+        results = db.update_status_many(pending_updates) if pending_updates else []
+        for update_indexes in pending_rows:
+            if any(results[index] for index in update_indexes):
+                updated_rows += 1
+            else:
+                missing_rows += 1
+        pending_updates.clear()
+        pending_rows.clear()
+
     with open(input_path, "r", newline="", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
         if not reader.fieldnames:
@@ -344,27 +361,28 @@ def import_bookmarks_notes_from_csv(
             if not link:
                 missing_rows += 1
                 continue
-            changed = False
+            update_indexes: List[int] = []
             if any(key in row for key in ("북마크", "bookmark", "Bookmark")):
                 bookmark_value = row.get("북마크", row.get("bookmark", row.get("Bookmark", "")))
-                changed = bool(db.update_status(link, "is_bookmarked", 1 if _csv_truthy(bookmark_value) else 0)) or changed
+                update_indexes.append(len(pending_updates))
+                pending_updates.append((link, "is_bookmarked", 1 if _csv_truthy(bookmark_value) else 0))
             if any(key in row for key in ("메모", "notes", "Notes")):
                 note_value, note_truncated = truncate_note(
                     row.get("메모", row.get("notes", row.get("Notes", "")))
                 )
                 if note_truncated:
                     truncated_notes += 1
-                changed = bool(db.save_note(link, note_value)) or changed
-            if changed:
-                updated_rows += 1
-            else:
-                missing_rows += 1
+                update_indexes.append(len(pending_updates))
+                pending_updates.append((link, "notes", note_value))
+            pending_rows.append(update_indexes)
             if processed % safe_chunk_size == 0:
+                _flush_pending()
                 context.report(
                     current=processed,
                     total=0,
                     message=f"CSV 가져오는 중... ({processed}행 처리)",
                 )
+    _flush_pending()
     context.report(current=processed, total=processed, message="CSV 가져오기 완료")
     return {
         "processed": processed,
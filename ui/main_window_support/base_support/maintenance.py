@@ -90,13 +90,14 @@ class _MainWindowMaintenanceMixin:
             self._sequential_refresh_active = False
             self._pending_refresh_keywords = []
             self._current_refresh_idx = 0
+            self._sequential_inflight_count = 0
             self._total_refresh_count = 0
             self.progress.setVisible(False)
 
         with QMutexLocker(self._refresh_mutex):
             self._refresh_in_progress = False
 
-        handles = self._worker_registry.all_handles()
+        handles = self._worker_registry.all_handles(snapshot=True)
         for handle in handles:
             remaining_ms = max(50, int((deadline - time.monotonic()) * 1000))
             finished = self.cleanup_worker(
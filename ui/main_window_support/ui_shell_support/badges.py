@@ -77,7 +77,7 @@ class _MainWindowBadgeShellMixin:
             if not tab_infos:
                 return
 
-            with perf_timer("ui.update_all_tab_badges", f"tabs={len(tab_infos)}"):
+            with perf_timer("ui.update_all_tab_badges", "tabs=%s", len(tab_infos)):
                 db = self._require_db()
                 for tab_index, widget in tab_infos:
                     keyword = widget.keyword
@@ -34,7 +34,7 @@ class _NewsTabDbLoadingMixin:
             return
         if self._should_block_db_action("tab DB reload", notify=False):
             return
-        with perf_timer("ui.load_data_from_db", f"kw={self.keyword}|append={int(append)}"):
+        with perf_timer("ui.load_data_from_db", "kw=%s|append=%d", self.keyword, append):
             if self.worker and self.worker.isRunning():
                 old_worker = self.worker
                 previous_request_id = self._load_request_id
@@ -170,7 +170,7 @@ class _NewsTabDbLoadingMixin:
             logger.info("PERF|ui.on_data_loaded.stale|0.00ms|kw=%s|rid=%s", self.keyword, request_id)
             return
 
-        with perf_timer("ui.on_data_loaded", f"kw={self.keyword}|rows={len(data)}"):
+        with perf_timer("ui.on_data_loaded", "kw=%s|rows=%s", self.keyword, len(data)):
             was_initial_hydration = not self._initial_load_completed
             scope_signature = None
             if request_id is not None:
@@ -270,7 +270,7 @@ class _NewsTabDbLoadingMixin:
 
     def apply_filter(self):
         """필터 변경 시 DB 기반으로 첫 페이지부터 다시 조회한다."""
-        with perf_timer("ui.apply_filter", f"kw={self.keyword}|rows={len(self.news_data_cache)}"):
+        with perf_timer("ui.apply_filter", "kw=%s|rows=%s", self.keyword, len(self.news_data_cache)):
             filter_txt = self._current_filter_text()
             if filter_txt:
                 self.inp_filter.setObjectName("FilterActive")
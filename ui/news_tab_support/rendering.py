@@ -92,7 +92,7 @@ class _NewsTabRenderingMixin:
 
     def _flush_render(self):
         self._render_scheduled = False
-        with perf_timer("ui.render_html", f"kw={self.keyword}|rows={len(self.filtered_data_cache)}"):
+        with perf_timer("ui.render_html", "kw=%s|rows=%s", self.keyword, len(self.filtered_data_cache)):
             filter_word = self._current_filter_text()
             render_signature = (
                 self.theme,